@@ -6,12 +6,28 @@ __all__ = ['dummy']
 
 # %% ../nbs/010_Application_export.ipynb 1
 from ._application.app import FastKafka
+from ._components.aiokafka_consumer_loop import EventMetadata, LoadShedding
+from ._components.compression import AutoCompression
+from ._components.envelope import Envelope
 from ._components.meta import export
-from ._components.producer_decorator import KafkaEvent
+from ._components.outbox import Outbox
+from ._components.producer_decorator import EncodeOffloading, KafkaEvent
+from ._components.request_reply import reply_headers
+from ._components.scheduler import Schedule
+from ._components.table import Table
 
 __all__ = [
+    "AutoCompression",
+    "EncodeOffloading",
+    "Envelope",
+    "EventMetadata",
     "FastKafka",
     "KafkaEvent",
+    "LoadShedding",
+    "Outbox",
+    "Schedule",
+    "Table",
+    "reply_headers",
 ]
 
 # %% ../nbs/010_Application_export.ipynb 2
@@ -8,6 +8,7 @@ import asyncio
 import functools
 import inspect
 import json
+import socket
 import types
 from asyncio import iscoroutinefunction  # do not use the version from inspect
 from collections import namedtuple
@@ -16,11 +17,14 @@ from datetime import datetime, timedelta
 from functools import wraps
 from inspect import signature
 from pathlib import Path
+from time import monotonic
 from typing import *
 from unittest.mock import AsyncMock, MagicMock
 
 import anyio
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+from aiokafka.structs import RecordMetadata
+from kafka.coordinator.assignors.sticky.sticky_assignor import StickyPartitionAssignor
 from pydantic import BaseModel
 from pydantic.main import ModelMetaclass
 
@@ -30,7 +34,9 @@ fastkafka._components.logger.should_supress_timestamps = True
 
 import fastkafka
 from fastkafka._components.aiokafka_consumer_loop import (
+    LoadShedding,
     aiokafka_consumer_loop,
+    aiokafka_replay_loop,
     sanitize_kafka_config,
 )
 from fastkafka._components.asyncapi import (
@@ -39,12 +45,31 @@ from fastkafka._components.asyncapi import (
     KafkaBroker,
     KafkaBrokers,
     KafkaServiceInfo,
+    _get_example,
+    _get_msg_cls_for_producer,
     export_async_spec,
 )
 from .._components.benchmarking import _benchmark
+from .._components.compression import AutoCompression
+from .._components.encoder.trusted import get_trusted_decoder
+from .._components.envelope import Envelope, EnvelopeBatcher
 from .._components.logger import get_logger
 from .._components.meta import delegates, export, filter_using_signature, patch
-from .._components.producer_decorator import ProduceCallable, producer_decorator
+from .._components.outbox import Outbox, OutboxRecord, _send_records
+from fastkafka._components.producer_decorator import (
+    BaseSubmodel,
+    DeliveryTracker,
+    EncodeOffloading,
+    EventLoopThread,
+    OrderedEncoder,
+    Partitioner,
+    ProduceCallable,
+    get_partitioner,
+    producer_decorator,
+)
+from .._components.request_reply import ReplyConsumer
+from .._components.scheduler import Schedule, Scheduler
+from .._components.table import Table, aiokafka_table_loop
 
 # %% ../../nbs/015_FastKafka.ipynb 3
 logger = get_logger(__name__)
@@ -154,6 +179,7 @@ class FastKafka:
         kafka_brokers: Dict[str, Any],
         root_path: Optional[Union[Path, str]] = None,
         lifespan: Optional[Callable[["FastKafka"], AsyncContextManager[None]]] = None,
+        startup_timeout: Optional[float] = None,
         **kwargs: Any,
     ):
         """Creates FastKafka application
@@ -175,6 +201,10 @@ class FastKafka:
                 __aenter__ is called before app start and __aexit__ after app stop.
                 The lifespan is called whe application is started as async context
                 manager, e.g.:`async with kafka_app...`
+            startup_timeout: time in seconds for starting all producers and consumers,
+                which are started concurrently, default: None - the startup is not timed out.
+                If the startup fails or times out, the producers and consumers which were
+                already started are stopped.
 
         """
 
@@ -218,10 +248,32 @@ class FastKafka:
 
         self._producers_list: List[AIOKafkaProducer] = []  # type: ignore
 
+        self._delivery_trackers: Dict[str, DeliveryTracker] = {}
+        self._ordered_encoders: Dict[str, OrderedEncoder] = {}
+        self._envelope_batchers: Dict[str, EnvelopeBatcher] = {}
+
+        self._outboxes: Dict[str, Outbox] = {}
+        # compression types chosen at startup by benchmarking codecs
+        self._auto_compressions: Dict[
+            str, Tuple[AutoCompression, Callable[[Any], bytes], ProduceCallable]
+        ] = {}
+        self._outbox_drain_tasks: List[asyncio.Task] = []
+
+        # request-reply, replies are consumed by one consumer per reply topic
+        self._request_producer: Optional["asyncio.Future[AIOKafkaProducer]"] = None  # type: ignore
+        self._reply_consumers: Dict[str, ReplyConsumer] = {}
+
+        # producers of sync functions are running in this thread
+        self._producer_io_thread = EventLoopThread()
+
+        self._tables_store: Dict[str, Tuple[Table, Dict[str, Any]]] = {}
+
         self.benchmark_results: Dict[str, Dict[str, Any]] = {}
 
         # background tasks
         self._scheduled_bg_tasks: List[Callable[..., Coroutine[Any, Any, Any]]] = []
+        # scheduled producers are all called from a single background task
+        self._scheduler = Scheduler()
         self._bg_task_group_generator: Optional[anyio.abc.TaskGroup] = None
         self._bg_tasks_group: Optional[anyio.abc.TaskGroup] = None
 
@@ -231,9 +283,18 @@ class FastKafka:
         self.lifespan = lifespan
         self.lifespan_ctx: Optional[AsyncContextManager[None]] = None
 
+        self._startup_timeout = startup_timeout
+        # seconds from the start of the app until each producer and consumer was started
+        self.startup_timings: Dict[str, Dict[str, float]] = {
+            "producers": {},
+            "consumers": {},
+        }
+
         self._is_started: bool = False
         self._is_shutting_down: bool = False
+        self._worker_index: Optional[int] = None
         self._kafka_consumer_tasks: List[asyncio.Task[Any]] = []
+        self._kafka_table_tasks: List[asyncio.Task[Any]] = []
         self._kafka_producer_tasks: List[asyncio.Task[Any]] = []
         self._running_bg_tasks: List[asyncio.Task[Any]] = []
         self.run = False
@@ -263,6 +324,20 @@ class FastKafka:
         )
         self._set_bootstrap_servers(bootstrap_servers=bootstrap_servers)
 
+    def set_worker_index(self, worker_index: int) -> None:
+        """Sets the index of the worker process running the application
+
+        The index is used for deriving stable group_instance_id of consumers, so consumers
+        of a restarted worker rejoin the consumer group without triggering a rebalance.
+        Static group membership needs a version of aiokafka supporting group_instance_id,
+        with older versions consumers join their groups as dynamic members.
+        """
+        self._worker_index = worker_index
+        if not _is_static_membership_supported():
+            logger.warning(
+                "set_worker_index(): Static group membership is not supported by the installed version of aiokafka, consumers will use dynamic group membership."
+            )
+
     async def __aenter__(self) -> "FastKafka":
         if self.lifespan is not None:
             self.lifespan_ctx = self.lifespan(self)
@@ -303,10 +378,34 @@ class FastKafka:
         *,
         prefix: str = "to_",
         producer: Optional[AIOKafkaProducer] = None,
+        max_in_flight: int = 10_000,
+        on_delivery: Optional[Callable[[RecordMetadata], Any]] = None,
+        on_delivery_error: Optional[Callable[[BaseException], Any]] = None,
+        fire_and_forget: bool = False,
+        partitioner: Optional[Union[str, Partitioner]] = None,
+        outbox: Optional[Outbox] = None,
+        every: Optional[Union[float, timedelta, str, Schedule]] = None,
+        offload_encoding: Optional[EncodeOffloading] = None,
+        envelope: Optional[Envelope] = None,
         **kwargs: Dict[str, Any],
     ) -> ProduceCallable:
         raise NotImplementedError
 
+    async def flush(self) -> None:
+        raise NotImplementedError
+
+    def get_delivery_stats(self) -> Dict[str, Dict[str, int]]:
+        raise NotImplementedError
+
+    def get_encoding_stats(self) -> Dict[str, Dict[str, int]]:
+        raise NotImplementedError
+
+    def get_envelope_stats(self) -> Dict[str, Dict[str, int]]:
+        raise NotImplementedError
+
+    async def _send_outbox_records(self, records: List[OutboxRecord]) -> None:
+        raise NotImplementedError
+
     def benchmark(
         self,
         interval: Union[int, timedelta] = 1,
@@ -320,15 +419,41 @@ class FastKafka:
     ) -> Callable[[], Any]:
         raise NotImplementedError
 
+    def table(
+        self,
+        topic: str,
+        msg_type: Type[BaseSubmodel],
+        decoder: str = "json",
+        *,
+        max_size: Optional[int] = None,
+        **kwargs: Dict[str, Any],
+    ) -> Table[BaseSubmodel]:
+        raise NotImplementedError
+
     def _populate_consumers(
         self,
         is_shutting_down_f: Callable[[], bool],
+        on_started: Optional[Callable[[str], Awaitable[None]]] = None,
+    ) -> None:
+        raise NotImplementedError
+
+    async def _wait_for_consumers_started(
+        self, consumers_started: Dict[str, asyncio.Event]
+    ) -> None:
+        raise NotImplementedError
+
+    def _populate_tables(
+        self,
+        is_shutting_down_f: Callable[[], bool],
     ) -> None:
         raise NotImplementedError
 
     def get_topics(self) -> Iterable[str]:
         raise NotImplementedError
 
+    async def _choose_compression_types(self) -> None:
+        raise NotImplementedError
+
     async def _populate_producers(self) -> None:
         raise NotImplementedError
 
@@ -344,12 +469,49 @@ class FastKafka:
     async def _shutdown_consumers(self) -> None:
         raise NotImplementedError
 
+    async def _shutdown_tables(self) -> None:
+        raise NotImplementedError
+
     async def _shutdown_producers(self) -> None:
         raise NotImplementedError
 
     async def _shutdown_bg_tasks(self) -> None:
         raise NotImplementedError
 
+    async def request(
+        self,
+        topic: str,
+        msg: Any,
+        *,
+        reply_topic: str,
+        timeout: float = 30.0,
+        key: Optional[bytes] = None,
+        encoder: Union[str, Callable[[BaseModel], bytes]] = "json",
+        reply_cls: Optional[Type[BaseModel]] = None,
+        decoder: Union[str, Callable[[bytes, ModelMetaclass], Any]] = "json",
+    ) -> Any:
+        raise NotImplementedError
+
+    def get_request_stats(self) -> Dict[str, Dict[str, int]]:
+        raise NotImplementedError
+
+    async def _get_request_producer(self) -> AIOKafkaProducer:  # type: ignore
+        raise NotImplementedError
+
+    async def _shutdown_requests(self) -> None:
+        raise NotImplementedError
+
+    async def replay(
+        self,
+        topics: Optional[Iterable[str]] = None,
+        *,
+        from_offset: Optional[int] = None,
+        from_timestamp: Optional[datetime] = None,
+        to_offset: Optional[int] = None,
+        to_timestamp: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        raise NotImplementedError
+
 # %% ../../nbs/015_FastKafka.ipynb 25
 def _get_decoder_fn(decoder: str) -> Callable[[bytes, ModelMetaclass], Any]:
     """
@@ -359,6 +521,10 @@ def _get_decoder_fn(decoder: str) -> Callable[[bytes, ModelMetaclass], Any]:
         from fastkafka._components.encoder.json import json_decoder
 
         return json_decoder
+    elif decoder == "json-fast":
+        from fastkafka._components.encoder.json_fast import json_fast_decoder
+
+        return json_fast_decoder
     elif decoder == "avro":
         try:
             from fastkafka._components.encoder.avro import avro_decoder
@@ -367,6 +533,22 @@ def _get_decoder_fn(decoder: str) -> Callable[[bytes, ModelMetaclass], Any]:
                 "Unable to import avro packages. Please install FastKafka using the command 'fastkafka[avro]'"
             )
         return avro_decoder
+    elif decoder == "msgpack":
+        from fastkafka._components.encoder.msgpack import msgpack, msgpack_decoder
+
+        if msgpack is None:
+            raise ModuleNotFoundError(
+                "Unable to import msgpack packages. Please install FastKafka using the command 'fastkafka[msgpack]'"
+            )
+        return msgpack_decoder
+    elif decoder == "protobuf":
+        from fastkafka._components.encoder.protobuf import Message, protobuf_decoder
+
+        if Message is None:
+            raise ModuleNotFoundError(
+                "Unable to import protobuf packages. Please install FastKafka using the command 'fastkafka[protobuf]'"
+            )
+        return protobuf_decoder
     else:
         raise ValueError(f"Unknown decoder - {decoder}")
 
@@ -379,12 +561,20 @@ def consumes(
     decoder: Union[str, Callable[[bytes, ModelMetaclass], Any]] = "json",
     *,
     prefix: str = "on_",
+    max_age: Optional[Union[float, timedelta]] = None,
+    load_shedding: Optional[LoadShedding] = None,
+    envelope: bool = False,
+    validate: bool = True,
+    validate_every: Optional[int] = None,
     **kwargs: Dict[str, Any],
 ) -> Callable[[ConsumeCallable], ConsumeCallable]:
     """Decorator registering the callback called when a message is received in a topic.
 
     This function decorator is also responsible for registering topics for AsyncAPI specificiation and documentation.
 
+    If the decorated function has a parameter annotated with EventMetadata, the topic, partition,
+    offset, timestamp, key and headers of the consumed record are passed to it together with the message.
+
     Args:
         topic: Kafka topic that the consumer will subscribe to and execute the
             decorated function when it receives a message from the topic,
@@ -393,11 +583,32 @@ def consumes(
         decoder: Decoder to use to decode messages consumed from the topic,
                 default: json - By default, it uses json decoder to decode
                 bytes to json string and then it creates instance of pydantic
-                BaseModel. It also accepts custom decoder function.
+                BaseModel. Use "json-fast" for decoding with orjson or msgspec
+                if installed, "avro" for Avro, "msgpack" for MessagePack or "protobuf"
+                for Protocol Buffers.
+                It also accepts custom decoder function.
         prefix: Prefix stripped from the decorated function to define a topic name
             if the topic argument is not passed, default: "on_". If the decorated
             function name is not prefixed with the defined prefix and topic argument
             is not passed, then this method will throw ValueError
+        max_age: Messages with timestamp older than max_age (in seconds if given as
+            number) are skipped without decoding them, default: None - all messages
+            are consumed. Useful for consumers where only recent messages are relevant
+            so they catch up with the topic quickly after a downtime
+        load_shedding: Policy for shedding records while the consumer cannot keep up
+            with the topic, default: None - no records are shed
+        envelope: If True, records holding envelopes of messages sent by producers
+            created with an Envelope are unpacked and the decorated function is
+            called for each of their messages, default: False. Other records are
+            consumed as usual, so producers can switch to envelopes without
+            restarting the consumers
+        validate: If False, messages are decoded without validating them, which is
+            considerably faster, default: True. Use it only for topics written to by
+            trusted producers. Supported by the builtin decoders and by custom decoders
+            accepting the `validate` keyword argument
+        validate_every: If set together with validate=False, every `validate_every`-th
+            message is validated to detect producers sending invalid messages,
+            default: None - no messages are validated
 
     Returns:
         A function returning the same function
@@ -420,6 +631,16 @@ def consumes(
         )
 
         decoder_fn = _get_decoder_fn(decoder) if isinstance(decoder, str) else decoder
+        if not validate:
+            decoder_fn = get_trusted_decoder(decoder_fn, validate_every)
+        elif validate_every is not None:
+            raise ValueError("validate_every can only be used with validate=False")
+        if max_age is not None:
+            kwargs = {**kwargs, "max_age": max_age}
+        if load_shedding is not None:
+            kwargs = {**kwargs, "load_shedding": load_shedding}
+        if envelope:
+            kwargs = {**kwargs, "unpack_envelopes": True}
         self._consumers_store[topic_resolved] = (on_topic, decoder_fn, kwargs)
 
         return on_topic
@@ -435,6 +656,10 @@ def _get_encoder_fn(encoder: str) -> Callable[[BaseModel], bytes]:
         from fastkafka._components.encoder.json import json_encoder
 
         return json_encoder
+    elif encoder == "json-fast":
+        from fastkafka._components.encoder.json_fast import json_fast_encoder
+
+        return json_fast_encoder
     elif encoder == "avro":
         try:
             from fastkafka._components.encoder.avro import avro_encoder
@@ -443,18 +668,43 @@ def _get_encoder_fn(encoder: str) -> Callable[[BaseModel], bytes]:
                 "Unable to import avro packages. Please install FastKafka using the command 'fastkafka[avro]'"
             )
         return avro_encoder
+    elif encoder == "msgpack":
+        from fastkafka._components.encoder.msgpack import msgpack, msgpack_encoder
+
+        if msgpack is None:
+            raise ModuleNotFoundError(
+                "Unable to import msgpack packages. Please install FastKafka using the command 'fastkafka[msgpack]'"
+            )
+        return msgpack_encoder
+    elif encoder == "protobuf":
+        from fastkafka._components.encoder.protobuf import Message, protobuf_encoder
+
+        if Message is None:
+            raise ModuleNotFoundError(
+                "Unable to import protobuf packages. Please install FastKafka using the command 'fastkafka[protobuf]'"
+            )
+        return protobuf_encoder
     else:
         raise ValueError(f"Unknown encoder - {encoder}")
 
 # %% ../../nbs/015_FastKafka.ipynb 31
 @patch
 @delegates(AIOKafkaProducer)
-def produces(
+def produces(  # type: ignore
     self: FastKafka,
     topic: Optional[str] = None,
     encoder: Union[str, Callable[[BaseModel], bytes]] = "json",
     *,
     prefix: str = "to_",
+    max_in_flight: int = 10_000,
+    on_delivery: Optional[Callable[[RecordMetadata], Any]] = None,
+    on_delivery_error: Optional[Callable[[BaseException], Any]] = None,
+    fire_and_forget: bool = False,
+    partitioner: Optional[Union[str, Partitioner]] = None,
+    outbox: Optional[Outbox] = None,
+    every: Optional[Union[float, timedelta, str, Schedule]] = None,
+    offload_encoding: Optional[EncodeOffloading] = None,
+    envelope: Optional[Envelope] = None,
     **kwargs: Dict[str, Any],
 ) -> Callable[[ProduceCallable], ProduceCallable]:
     """Decorator registering the callback called when delivery report for a produced message is received
@@ -469,11 +719,65 @@ def produces(
         encoder: Encoder to use to encode messages before sending it to topic,
                 default: json - By default, it uses json encoder to convert
                 pydantic basemodel to json string and then encodes the string to bytes
-                using 'utf-8' encoding. It also accepts custom encoder function.
+                using 'utf-8' encoding. Use "json-fast" for encoding with orjson or
+                msgspec if installed, "avro" for Avro, "msgpack" for MessagePack or
+                "protobuf" for Protocol Buffers.
+                It also accepts custom encoder function.
         prefix: Prefix stripped from the decorated function to define a topic
             name if the topic argument is not passed, default: "to_". If the
             decorated function name is not prefixed with the defined prefix
             and topic argument is not passed, then this method will throw ValueError
+        max_in_flight: Maximum number of sends waiting for delivery confirmation,
+            default: 10_000. Calling the decorated function waits for some of the
+            pending deliveries to complete once the limit is reached.
+        on_delivery: Function called with the record metadata of each
+            successfully delivered message (or batch of messages), default: None
+        on_delivery_error: Function called with the exception for each failed
+            delivery, default: None - failed deliveries are logged
+        fire_and_forget: If True, calling a decorated sync function returns without
+            waiting for the messages to be handed over to the producer, default: False.
+            Producers of sync functions run in a separate thread, so the callbacks
+            above are called from that thread.
+        partitioner: Strategy for choosing partitions of the sent messages,
+            default: None - the default partitioner of AIOKafkaProducer is used, it
+            hashes keys with murmur2 the same way as the Java client and sends
+            messages without a key to random partitions. Options are
+            "sticky" for sending messages without a key to the same partition
+            until a batch is filled, or a function called with the key and lists of
+            all and available partitions from the cached topic metadata, returning
+            the partition to use.
+        outbox: Outbox on local disk for spooling messages while the broker is
+            unavailable, default: None - failed sends raise an exception. Messages
+            are spooled when sending or their delivery fails, when max_in_flight is
+            reached and while earlier messages are waiting in the outbox. They are
+            sent in order in the background once the broker is reachable again.
+            An outbox can be shared by several producers.
+        compression_type: Compression of the messages sent to the topic, one of
+            "gzip", "snappy", "lz4" or "zstd", default: None - the compression set
+            for the app is used. "auto" or an AutoCompression chooses the codec
+            at startup by benchmarking the available codecs on sample messages,
+            a batch of the example built from the message class by default. The choice
+            is logged, the codec of the app is kept if no codec qualifies.
+        every: Schedule for calling the decorated function periodically while
+            the app is running, default: None - the function is only called by
+            user code. Accepts an interval as a number of seconds or a timedelta,
+            a cron expression such as "*/5 * * * *", or a Schedule for setting
+            jitter and the policy for calls missed while the app was busy. The
+            function is called without arguments and the returned messages are
+            sent to the topic. All scheduled functions are called from a single
+            background task, sync functions are called in a thread pool.
+        offload_encoding: Settings for encoding large messages in a thread or
+            process pool instead of the event loop, default: None - messages are
+            encoded in the event loop. Messages are still sent in the order they
+            were produced. Only supported for async functions, as sync functions
+            encode messages in the calling thread.
+        envelope: Settings for packing small messages into envelopes, each of them
+            sent as a single record, default: None - every message is sent in its
+            own record. Messages are packed per key and the order of messages with
+            the same key is kept. Messages with headers are sent in their own
+            records. The messages must be consumed by consumers created with
+            `envelope=True`. Only supported for async functions and cannot be
+            combined with offload_encoding.
 
     Returns:
         A function returning the same function
@@ -487,17 +791,81 @@ def produces(
         topic: Optional[str] = topic,
         kwargs: Dict[str, Any] = kwargs,
     ) -> ProduceCallable:
+        if offload_encoding is not None and not iscoroutinefunction(on_topic):
+            raise ValueError(
+                f"Encode offloading is only supported for async producer functions, '{on_topic.__name__}' is not async"
+            )
+        if envelope is not None and not iscoroutinefunction(on_topic):
+            raise ValueError(
+                f"Envelopes are only supported for async producer functions, '{on_topic.__name__}' is not async"
+            )
+        if envelope is not None and offload_encoding is not None:
+            raise ValueError(
+                "Envelopes are meant for small messages and cannot be combined with encode offloading"
+            )
         topic_resolved: str = (
             _get_topic_name(topic_callable=on_topic, prefix=prefix)
             if topic is None
             else topic
         )
 
-        self._producers_store[topic_resolved] = (on_topic, None, kwargs)
+        if partitioner is not None:
+            kwargs = {**kwargs, "partitioner": get_partitioner(partitioner)}
         encoder_fn = _get_encoder_fn(encoder) if isinstance(encoder, str) else encoder
-        return producer_decorator(
-            self._producers_store, on_topic, topic_resolved, encoder_fn=encoder_fn
+        compression_type = kwargs.get("compression_type")
+        if compression_type == "auto" or isinstance(compression_type, AutoCompression):
+            self._auto_compressions[topic_resolved] = (
+                AutoCompression() if compression_type == "auto" else compression_type,
+                encoder_fn,
+                on_topic,
+            )
+            kwargs = {k: v for k, v in kwargs.items() if k != "compression_type"}
+        self._producers_store[topic_resolved] = (on_topic, None, kwargs)
+        if outbox is not None:
+            self._outboxes[topic_resolved] = outbox
+        self._delivery_trackers[topic_resolved] = DeliveryTracker(
+            max_in_flight=max_in_flight,
+            on_delivery=on_delivery,
+            on_delivery_error=on_delivery_error,
+        )
+        if offload_encoding is not None:
+            self._ordered_encoders[topic_resolved] = OrderedEncoder(offload_encoding)
+        if envelope is not None:
+            self._envelope_batchers[topic_resolved] = EnvelopeBatcher(envelope)
+        # delivery latency is reported with the benchmark results of the function
+        func_name = f"{on_topic.__module__}.{on_topic.__qualname__}"
+        self.benchmark_results.setdefault(func_name, {})[
+            "delivery_latency"
+        ] = self._delivery_trackers[topic_resolved].latency
+        schedule: Optional[Schedule] = None
+        if every is not None:
+            try:
+                signature(on_topic).bind()
+            except TypeError as e:
+                raise ValueError(
+                    f"Scheduled producer function '{on_topic.__name__}' must be callable without arguments"
+                ) from e
+            if isinstance(every, Schedule):
+                schedule = every
+            elif isinstance(every, str):
+                schedule = Schedule(cron=every)
+            else:
+                schedule = Schedule(every=every)
+        decorated = producer_decorator(
+            self._producers_store,
+            on_topic,
+            topic_resolved,
+            encoder_fn=encoder_fn,
+            tracker=self._delivery_trackers[topic_resolved],
+            io_thread=self._producer_io_thread,
+            fire_and_forget=fire_and_forget,
+            outbox=outbox,
+            ordered_encoder=self._ordered_encoders.get(topic_resolved),
+            envelope_batcher=self._envelope_batchers.get(topic_resolved),
         )
+        if schedule is not None:
+            self._scheduler.add(decorated, schedule)
+        return decorated
 
     return _decorator
 
@@ -546,10 +914,55 @@ def run_in_background(
     return _decorator
 
 # %% ../../nbs/015_FastKafka.ipynb 39
+def _is_static_membership_supported() -> bool:
+    return "group_instance_id" in signature(AIOKafkaConsumer).parameters
+
+
+def _get_group_instance_id(topic: str, worker_index: int) -> str:
+    return f"{socket.gethostname()}-{worker_index}-{topic}"
+
+
+def _get_consumer_config(
+    topic: str, config: Dict[str, Any], worker_index: Optional[int]
+) -> Dict[str, Any]:
+    """Get config of the consumer for the topic
+
+    If the worker index is set and aiokafka supports it, consumer gets a stable group_instance_id
+    for static group membership. Sticky partition assignors are replaced with subclasses so that
+    each consumer keeps track of its own previous assignment instead of sharing it in class attributes.
+
+    Args:
+        topic: topic consumed by the consumer
+        config: consumer config
+        worker_index: index of the worker process running the application
+
+    Returns:
+        Config of the consumer
+    """
+    config = config.copy()
+    if (
+        worker_index is not None
+        and config.get("group_id") is not None
+        and "group_instance_id" not in config
+        and _is_static_membership_supported()
+    ):
+        config["group_instance_id"] = _get_group_instance_id(topic, worker_index)
+    if "partition_assignment_strategy" in config:
+        config["partition_assignment_strategy"] = tuple(
+            type(assignor.__name__, (assignor,), {"member_assignment": None})
+            if isinstance(assignor, type)
+            and issubclass(assignor, StickyPartitionAssignor)
+            else assignor
+            for assignor in config["partition_assignment_strategy"]
+        )
+    return config
+
+# %% ../../nbs/015_FastKafka.ipynb 41
 @patch
 def _populate_consumers(
     self: FastKafka,
     is_shutting_down_f: Callable[[], bool],
+    on_started: Optional[Callable[[str], Awaitable[None]]] = None,
 ) -> None:
     default_config: Dict[str, Any] = filter_using_signature(
         AIOKafkaConsumer, **self._kafka_config
@@ -562,7 +975,12 @@ def _populate_consumers(
                 callback=consumer,
                 msg_type=signature(consumer).parameters["msg"].annotation,
                 is_shutting_down_f=is_shutting_down_f,
-                **{**default_config, **override_config},
+                on_started=None
+                if on_started is None
+                else functools.partial(on_started, topic),
+                **_get_consumer_config(
+                    topic, {**default_config, **override_config}, self._worker_index
+                ),
             )
         )
         for topic, (
@@ -580,7 +998,121 @@ async def _shutdown_consumers(
     if self._kafka_consumer_tasks:
         await asyncio.wait(self._kafka_consumer_tasks)
 
-# %% ../../nbs/015_FastKafka.ipynb 41
+
+@patch
+async def _wait_for_consumers_started(
+    self: FastKafka, consumers_started: Dict[str, asyncio.Event]
+) -> None:
+    """Waits until all consumers are started, raises the exception of a consumer which failed to start"""
+
+    async def _wait_for_consumer(
+        topic: str, started: asyncio.Event, task: asyncio.Task
+    ) -> None:
+        waiter = asyncio.create_task(started.wait())
+        try:
+            await asyncio.wait([waiter, task], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        if not started.is_set():
+            task.result()
+            raise RuntimeError(f"Consumer for topic '{topic}' stopped before starting")
+
+    await asyncio.gather(
+        *[
+            _wait_for_consumer(topic, consumers_started[topic], task)
+            for topic, task in zip(self._consumers_store, self._kafka_consumer_tasks)
+        ]
+    )
+
+# %% ../../nbs/015_FastKafka.ipynb 44
+@patch
+@delegates(AIOKafkaConsumer)
+def table(
+    self: FastKafka,
+    topic: str,
+    msg_type: Type[BaseSubmodel],
+    decoder: Union[str, Callable[[bytes, ModelMetaclass], Any]] = "json",
+    *,
+    max_size: Optional[int] = None,
+    **kwargs: Dict[str, Any],
+) -> Table[BaseSubmodel]:
+    """Creates an in-memory table with the latest message for each key of a topic, typically a compacted one.
+
+    While the application is running, the table is populated from the beginning of the topic and kept up to
+    date with new messages. Messages with an empty value (tombstones) remove their keys from the table.
+    Use `Table.wait_until_ready` in consumers that need the table to catch up with the topic first.
+
+    Args:
+        topic: Kafka topic the table is populated from
+        msg_type: type of messages in the topic
+        decoder: Decoder to use to decode messages consumed from the topic,
+                default: json - By default, it uses json decoder to decode
+                bytes to json string and then it creates instance of pydantic
+                BaseModel. Use "json-fast" for decoding with orjson or msgspec
+                if installed, "avro" for Avro, "msgpack" for MessagePack or "protobuf"
+                for Protocol Buffers.
+                It also accepts custom decoder function.
+        max_size: maximum number of keys in the table, if exceeded the least recently
+            updated keys are evicted, default: None - the table is not bounded
+
+    Returns:
+        The table, lookups are done using its `get` method
+
+    Throws:
+        ValueError
+    """
+    if topic in self._tables_store:
+        raise ValueError(f"Table for topic '{topic}' already exists")
+
+    decoder_fn = _get_decoder_fn(decoder) if isinstance(decoder, str) else decoder
+    table: Table[BaseSubmodel] = Table(
+        topic, msg_type, decoder_fn=decoder_fn, max_size=max_size
+    )
+    self._tables_store[topic] = (table, kwargs)
+
+    return table
+
+# %% ../../nbs/015_FastKafka.ipynb 46
+@patch
+def _populate_tables(
+    self: FastKafka,
+    is_shutting_down_f: Callable[[], bool],
+) -> None:
+    default_config: Dict[str, Any] = filter_using_signature(
+        AIOKafkaConsumer, **self._kafka_config
+    )
+    self._kafka_table_tasks = [
+        asyncio.create_task(
+            aiokafka_table_loop(
+                table,
+                is_shutting_down_f=is_shutting_down_f,
+                **{**default_config, **override_config},
+            )
+        )
+        for table, override_config in self._tables_store.values()
+    ]
+
+
+@patch
+async def _shutdown_tables(
+    self: FastKafka,
+) -> None:
+    if self._kafka_table_tasks:
+        await asyncio.wait(self._kafka_table_tasks)
+    # tables can be populated again in another event loop
+    for table, _ in self._tables_store.values():
+        table._reset()
+
+# %% ../../nbs/015_FastKafka.ipynb 48
+def _get_producer_config(
+    default_config: Dict[str, Any], override_config: Dict[str, Any]
+) -> Dict[str, Any]:
+    return {
+        **filter_using_signature(AIOKafkaProducer, **default_config),
+        **filter_using_signature(AIOKafkaProducer, **override_config),
+    }
+
+
 # TODO: Add passing of vars
 async def _create_producer(  # type: ignore
     *,
@@ -602,22 +1134,101 @@ async def _create_producer(  # type: ignore
         A producer.
     """
 
-    config = {
-        **filter_using_signature(AIOKafkaProducer, **default_config),
-        **filter_using_signature(AIOKafkaProducer, **override_config),
-    }
+    config = _get_producer_config(default_config, override_config)
     producer = AIOKafkaProducer(**config)
     logger.info(
         f"_create_producer() : created producer using the config: '{sanitize_kafka_config(**config)}'"
     )
 
-    await producer.start()
+    try:
+        await producer.start()
+    except BaseException:
+        # releases the connections opened before the start failed or was cancelled
+        await producer.stop()
+        raise
 
     producers_list.append(producer)
 
     return producer
 
 
+_DEFAULT_MAX_BATCH_SIZE = 16384
+
+
+def _choose_compression_type(
+    auto: AutoCompression,
+    encoder_fn: Callable[[Any], bytes],
+    on_topic: ProduceCallable,
+    max_batch_size: int,
+) -> Optional[str]:
+    """
+    Benchmarks codecs on the samples of the topic and returns the chosen compression type
+
+    Params:
+        auto: automatic compression settings of the topic
+        encoder_fn: encoder of the topic
+        on_topic: producer function of the topic
+        max_batch_size: maximal size of batches sent by the producer
+
+    Returns:
+        The chosen compression type or None if messages should not be compressed
+    """
+    if auto.samples is None:
+        msg_cls = _get_msg_cls_for_producer(on_topic)
+        example = encoder_fn(msg_cls.parse_obj(_get_example(msg_cls)))
+        # producers compress whole batches, a single small message compresses much worse
+        samples = [example] * max(1, max_batch_size // len(example))
+    else:
+        samples = [s if isinstance(s, bytes) else encoder_fn(s) for s in auto.samples]
+    return auto.choose(samples)
+
+
+@patch
+async def _choose_compression_types(self: FastKafka) -> None:
+    """Chooses compression types of topics with automatic compression by benchmarking codecs on sample messages,
+    the benchmarks are run in a thread so they do not block the event loop"""
+    loop = asyncio.get_running_loop()
+    for topic, (auto, encoder_fn, on_topic) in self._auto_compressions.items():
+        callback, producer, override_config = self._producers_store[topic]
+        max_batch_size = _get_producer_config(self._kafka_config, override_config).get(
+            "max_batch_size", _DEFAULT_MAX_BATCH_SIZE
+        )
+        try:
+            compression_type = await loop.run_in_executor(
+                None,
+                _choose_compression_type,
+                auto,
+                encoder_fn,
+                on_topic,
+                max_batch_size,
+            )
+        except Exception as e:
+            logger.warning(
+                f"_choose_compression_types(): Unable to choose compression for topic '{topic}', the configured compression type is used: {e!r}"
+            )
+            continue
+        logger.info(
+            f"_choose_compression_types(): Using compression type '{compression_type}' for topic '{topic}'"
+        )
+        if compression_type is not None:
+            override_config = {**override_config, "compression_type": compression_type}
+            self._producers_store[topic] = (callback, producer, override_config)
+
+
+async def _gather_or_cancel(*aws: Awaitable[Any]) -> None:
+    """Runs the awaitables concurrently, if one of them fails or the call is cancelled, the others
+    are cancelled and awaited before the exception is raised, so none of them keeps running
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 @patch
 async def _populate_producers(self: FastKafka) -> None:
     """Populates the producers for the FastKafka instance.
@@ -633,30 +1244,151 @@ async def _populate_producers(self: FastKafka) -> None:
     """
     default_config: Dict[str, Any] = self._kafka_config
     self._producers_list = []
-    self._producers_store.update(
-        {
-            topic: (
-                callback,
-                await _create_producer(
-                    callback=callback,
-                    default_config=default_config,
-                    override_config=override_config,
-                    producers_list=self._producers_list,
-                ),
-                override_config,
-            )
-            for topic, (
-                callback,
-                _,
-                override_config,
-            ) in self._producers_store.items()
-        }
+    self.startup_timings["producers"] = {}
+    started_at = monotonic()
+    await self._choose_compression_types()
+
+    # topics with the same effective config share a producer
+    producers_pool: List[Tuple[Dict[str, Any], bool, List[str]]] = []
+    for topic, (callback, _, override_config) in self._producers_store.items():
+        config = _get_producer_config(default_config, override_config)
+        is_async = iscoroutinefunction(callback)
+        for pooled_config, pooled_is_async, topics in producers_pool:
+            if pooled_config == config and pooled_is_async == is_async:
+                topics.append(topic)
+                break
+        else:
+            producers_pool.append((config, is_async, [topic]))
+
+    async def _start_shared_producer(topics: List[str]) -> None:
+        callback, _, override_config = self._producers_store[topics[0]]
+        create_coro = _create_producer(
+            callback=callback,
+            default_config=default_config,
+            override_config=override_config,
+            producers_list=self._producers_list,
+        )
+        if iscoroutinefunction(callback):
+            producer = await create_coro
+        else:
+            # sync functions send through the producer running in the I/O thread
+            self._producer_io_thread.start()
+            producer = await self._producer_io_thread.run(create_coro)
+
+        for topic in topics:
+            callback, _, override_config = self._producers_store[topic]
+            self._producers_store[topic] = (callback, producer, override_config)
+            self.startup_timings["producers"][topic] = monotonic() - started_at
+
+    await _gather_or_cancel(
+        *[_start_shared_producer(topics) for _, _, topics in producers_pool]
+    )
+
+    # messages spooled to outboxes are sent in the background
+    outboxes = {id(outbox): outbox for outbox in self._outboxes.values()}
+    self._outbox_drain_tasks = [
+        asyncio.create_task(outbox.drain(self._send_outbox_records))
+        for outbox in outboxes.values()
+    ]
+
+
+@patch
+async def _send_outbox_records(self: FastKafka, records: List[OutboxRecord]) -> None:
+    """Sends messages spooled to an outbox using the producers of their topics"""
+    records_per_topic: Dict[str, List[OutboxRecord]] = {}
+    for record in records:
+        records_per_topic.setdefault(record.topic, []).append(record)
+
+    for topic in [t for t in records_per_topic if t not in self._producers_store]:
+        logger.warning(
+            f"_send_outbox_records(): Dropping {len(records_per_topic.pop(topic))} spooled message(s) for topic '{topic}' without a producer"
+        )
+
+    def _send(topic: str, topic_records: List[OutboxRecord]) -> Awaitable[None]:
+        callback, producer, _ = self._producers_store[topic]
+        if iscoroutinefunction(callback):
+            return _send_records(producer, topic_records)
+        return self._producer_io_thread.run(_send_records(producer, topic_records))
+
+    await asyncio.gather(
+        *[
+            _send(topic, topic_records)
+            for topic, topic_records in records_per_topic.items()
+        ]
+    )
+
+
+@patch
+async def flush(self: FastKafka) -> None:
+    """Waits until all messages sent by the producers are delivered or failed"""
+    # messages waiting in envelopes are sent first
+    await asyncio.gather(
+        *[batcher.flush() for batcher in self._envelope_batchers.values()]
+    )
+
+    def _flush(topic: str, tracker: DeliveryTracker) -> Awaitable[None]:
+        callback, _, _ = self._producers_store[topic]
+        if iscoroutinefunction(callback) or not self._producer_io_thread.is_started:
+            return tracker.flush()
+        return self._producer_io_thread.run(tracker.flush())
+
+    await asyncio.gather(
+        *[_flush(topic, tracker) for topic, tracker in self._delivery_trackers.items()]
     )
 
 
+@patch
+def get_delivery_stats(self: FastKafka) -> Dict[str, Dict[str, int]]:
+    """Returns the number of in-flight, delivered and failed messages per topic"""
+    return {
+        topic: tracker.get_stats() for topic, tracker in self._delivery_trackers.items()
+    }
+
+
+@patch
+def get_encoding_stats(self: FastKafka) -> Dict[str, Dict[str, int]]:
+    """Returns the number of messages waiting to be encoded or sent and the number of messages encoded in a pool or in the event loop per topic with encode offloading"""
+    return {
+        topic: encoder.get_stats() for topic, encoder in self._ordered_encoders.items()
+    }
+
+
+@patch
+def get_envelope_stats(self: FastKafka) -> Dict[str, Dict[str, int]]:
+    """Returns the number of messages waiting in envelopes and the number of sent envelopes and messages packed in them per topic with envelopes"""
+    return {
+        topic: batcher.get_stats() for topic, batcher in self._envelope_batchers.items()
+    }
+
+
 @patch
 async def _shutdown_producers(self: FastKafka) -> None:
-    [await producer.stop() for producer in self._producers_list[::-1]]
+    # messages left in the outboxes are sent after the next start
+    for task in self._outbox_drain_tasks:
+        task.cancel()
+    await asyncio.gather(*self._outbox_drain_tasks, return_exceptions=True)
+    self._outbox_drain_tasks = []
+    await self.flush()
+    io_producers = [
+        producer
+        for callback, producer, _ in self._producers_store.values()
+        if not iscoroutinefunction(callback)
+    ]
+    for producer in self._producers_list[::-1]:
+        if any(producer is p for p in io_producers):
+            await self._producer_io_thread.run(producer.stop())
+        else:
+            await producer.stop()
+    self._producer_io_thread.stop()
+    # producers can be started again in another event loop
+    for tracker in self._delivery_trackers.values():
+        tracker.reset()
+    for batcher in self._envelope_batchers.values():
+        batcher.reset()
+    for outbox in self._outboxes.values():
+        outbox.close()
+    for encoder in self._ordered_encoders.values():
+        encoder.offloading.shutdown()
     # Remove references to stale producers
     self._producers_list = []
     self._producers_store.update(
@@ -674,7 +1406,7 @@ async def _shutdown_producers(self: FastKafka) -> None:
         }
     )
 
-# %% ../../nbs/015_FastKafka.ipynb 43
+# %% ../../nbs/015_FastKafka.ipynb 58
 @patch
 async def _populate_bg_tasks(
     self: FastKafka,
@@ -686,6 +1418,13 @@ async def _populate_bg_tasks(
         return asyncio.create_task(task(), name=task.__name__)
 
     self._running_bg_tasks = [_start_bg_task(task) for task in self._scheduled_bg_tasks]
+    if len(self._scheduler) > 0:
+        logger.info(
+            f"_populate_bg_tasks() : Starting scheduler for {len(self._scheduler)} scheduled producer(s)"
+        )
+        self._running_bg_tasks.append(
+            asyncio.create_task(self._scheduler.run(), name="fastkafka_scheduler")
+        )
 
 
 @patch
@@ -710,17 +1449,151 @@ async def _shutdown_bg_tasks(
             f"_shutdown_bg_tasks() : Execution finished for background task '{task.get_name()}'"
         )
 
-# %% ../../nbs/015_FastKafka.ipynb 45
+# %% ../../nbs/015_FastKafka.ipynb 62
+@patch
+async def request(
+    self: FastKafka,
+    topic: str,
+    msg: Any,
+    *,
+    reply_topic: str,
+    timeout: float = 30.0,
+    key: Optional[bytes] = None,
+    encoder: Union[str, Callable[[BaseModel], bytes]] = "json",
+    reply_cls: Optional[Type[BaseModel]] = None,
+    decoder: Union[str, Callable[[bytes, ModelMetaclass], Any]] = "json",
+) -> Any:
+    """Sends a request to the topic and waits for the reply sent to the reply topic
+
+    The request carries a unique correlation id in the "correlation_id" header. Services
+    replying to it must copy the header to the reply, e.g. by returning
+    `KafkaEvent(reply, headers=reply_headers(metadata))` from a producer function.
+    Replies are consumed from all partitions of the reply topic by a single consumer per
+    topic, started with the first request and stopped together with the application, so
+    any number of concurrent requests share one subscription.
+
+    Args:
+        topic: topic to send the request to
+        msg: request message, sent as is if it is bytes
+        reply_topic: topic the replies are sent to
+        timeout: time in seconds to wait for the reply, default: 30.0
+        key: key of the request message, default: None
+        encoder: encoder of the request message, default: "json"
+        reply_cls: message class of the reply, default: None - the raw value of
+            the reply is returned
+        decoder: decoder of the reply, default: "json"
+
+    Returns:
+        The decoded reply, or its raw value if reply_cls is not given
+
+    Raises:
+        asyncio.TimeoutError: if the reply is not received in time
+        ValueError: if the reply topic does not exist
+    """
+    if isinstance(msg, bytes):
+        value = msg
+    else:
+        encoder_fn = _get_encoder_fn(encoder) if isinstance(encoder, str) else encoder
+        value = encoder_fn(msg)
+
+    if reply_topic not in self._reply_consumers:
+        self._reply_consumers[reply_topic] = ReplyConsumer(
+            reply_topic, **self._kafka_config
+        )
+    producer = await self._get_request_producer()
+
+    async def _send(headers: List[Tuple[str, bytes]]) -> None:
+        fut = await producer.send(topic, value, key=key, headers=headers)
+        await fut
+
+    record = await self._reply_consumers[reply_topic].request(_send, timeout)
+    if reply_cls is None:
+        return record.value
+    decoder_fn = _get_decoder_fn(decoder) if isinstance(decoder, str) else decoder
+    return decoder_fn(record.value, reply_cls)
+
+
+@patch
+def get_request_stats(self: FastKafka) -> Dict[str, Dict[str, int]]:
+    """Returns the number of in-flight, replied and timed out requests and unmatched replies per reply topic"""
+    return {
+        topic: reply_consumer.get_stats()
+        for topic, reply_consumer in self._reply_consumers.items()
+    }
+
+
+@patch
+async def _get_request_producer(self: FastKafka) -> AIOKafkaProducer:  # type: ignore
+    async def _start() -> AIOKafkaProducer:  # type: ignore
+        producer = AIOKafkaProducer(**_get_producer_config(self._kafka_config, {}))
+        await producer.start()
+        return producer
+
+    # concurrent requests wait for the same producer to start
+    if self._request_producer is None:
+        self._request_producer = asyncio.ensure_future(_start())
+    try:
+        return await asyncio.shield(self._request_producer)
+    except Exception:
+        self._request_producer = None
+        raise
+
+
+@patch
+async def _shutdown_requests(self: FastKafka) -> None:
+    for reply_consumer in self._reply_consumers.values():
+        await reply_consumer.stop()
+    if self._request_producer is not None:
+        if self._request_producer.done() and self._request_producer.exception() is None:
+            await self._request_producer.result().stop()
+        else:
+            self._request_producer.cancel()
+        self._request_producer = None
+
+# %% ../../nbs/015_FastKafka.ipynb 64
 @patch
 async def _start(self: FastKafka) -> None:
     def is_shutting_down_f(self: FastKafka = self) -> bool:
         return self._is_shutting_down
 
+    started_at = monotonic()
+    consumers_started = {topic: asyncio.Event() for topic in self._consumers_store}
+    producers_started = asyncio.Event()
+
+    async def on_consumer_started(topic: str) -> None:
+        self.startup_timings["consumers"][topic] = monotonic() - started_at
+        consumers_started[topic].set()
+        # consumer callbacks might send messages using the producers
+        await producers_started.wait()
+
     #     self.create_docs()
-    await self._populate_producers()
-    self._populate_consumers(is_shutting_down_f)
+    self.startup_timings["consumers"] = {}
+    self._populate_tables(is_shutting_down_f)
+    self._populate_consumers(is_shutting_down_f, on_started=on_consumer_started)
+    try:
+        await asyncio.wait_for(
+            _gather_or_cancel(
+                self._populate_producers(),
+                self._wait_for_consumers_started(consumers_started),
+            ),
+            timeout=self._startup_timeout,
+        )
+    except BaseException:
+        producers_started.set()
+        # consumers which are still starting would not see the shutdown flag
+        for topic, task in zip(self._consumers_store, self._kafka_consumer_tasks):
+            if not consumers_started[topic].is_set():
+                task.cancel()
+        # stops what was already started, so the start can be retried
+        await self._stop()
+        raise
+    finally:
+        producers_started.set()
     await self._populate_bg_tasks()
 
+    logger.info(
+        f"_start() : Started {len(self._producers_list)} producer(s) and {len(self._kafka_consumer_tasks)} consumer(s) in {monotonic() - started_at:.2f}s"
+    )
     self._is_started = True
 
 
@@ -729,13 +1602,89 @@ async def _stop(self: FastKafka) -> None:
     self._is_shutting_down = True
 
     await self._shutdown_bg_tasks()
+    await self._shutdown_requests()
     await self._shutdown_consumers()
+    await self._shutdown_tables()
     await self._shutdown_producers()
 
     self._is_shutting_down = False
     self._is_started = False
 
-# %% ../../nbs/015_FastKafka.ipynb 51
+# %% ../../nbs/015_FastKafka.ipynb 72
+@patch
+async def replay(
+    self: FastKafka,
+    topics: Optional[Iterable[str]] = None,
+    *,
+    from_offset: Optional[int] = None,
+    from_timestamp: Optional[datetime] = None,
+    to_offset: Optional[int] = None,
+    to_timestamp: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """Replays messages from the topics through the functions registered with the consumes decorator
+
+    Messages are consumed from all partitions of the topics, starting at the given offset or
+    timestamp, and the method returns once the end of the partitions is reached. Offsets of
+    consumer groups are not affected. Producers are started for the duration of the replay if
+    the application is not already running, so consumers can produce messages while replaying.
+
+    Args:
+        topics: topics to replay, default: None - all topics consumed by the application
+        from_offset: offset to start the replay from, default: None - the replay starts at
+            the beginning of the partitions
+        from_timestamp: replay starts at the earliest message with timestamp greater or equal
+            to this one, default: None
+        to_offset: offset to stop the replay at (exclusive), default: None - the replay
+            stops at the end of the partitions at the time the replay started
+        to_timestamp: replay stops at the earliest message with timestamp greater or equal
+            to this one, default: None
+
+    Returns:
+        Dictionary mapping topics to the number of replayed messages
+
+    Raises:
+        ValueError: if a topic is not consumed by the application
+    """
+    topics = list(self._consumers_store.keys()) if topics is None else list(topics)
+    unknown_topics = [t for t in topics if t not in self._consumers_store]
+    if unknown_topics:
+        raise ValueError(
+            f"Topics {unknown_topics} are not consumed by the application, available options are {list(self._consumers_store.keys())}"
+        )
+
+    default_config: Dict[str, Any] = filter_using_signature(
+        AIOKafkaConsumer, **self._kafka_config
+    )
+
+    is_started = self._is_started
+    if not is_started:
+        await self._populate_producers()
+    try:
+        replayed = await asyncio.gather(
+            *[
+                aiokafka_replay_loop(
+                    topic=topic,
+                    decoder_fn=decoder_fn,
+                    callback=consumer,
+                    msg_type=signature(consumer).parameters["msg"].annotation,
+                    from_offset=from_offset,
+                    from_timestamp=from_timestamp,
+                    to_offset=to_offset,
+                    to_timestamp=to_timestamp,
+                    **{**default_config, **override_config},
+                )
+                for topic, (consumer, decoder_fn, override_config) in [
+                    (topic, self._consumers_store[topic]) for topic in topics
+                ]
+            ]
+        )
+    finally:
+        if not is_started:
+            await self._shutdown_producers()
+
+    return dict(zip(topics, replayed))
+
+# %% ../../nbs/015_FastKafka.ipynb 76
 @patch
 def create_docs(self: FastKafka) -> None:
     export_async_spec(
@@ -750,7 +1699,7 @@ def create_docs(self: FastKafka) -> None:
         asyncapi_path=self._asyncapi_path,
     )
 
-# %% ../../nbs/015_FastKafka.ipynb 55
+# %% ../../nbs/015_FastKafka.ipynb 80
 class AwaitedMock:
     @staticmethod
     def _await_for(f: Callable[..., Any]) -> Callable[..., Any]:
@@ -786,7 +1735,7 @@ class AwaitedMock:
                 if inspect.ismethod(f):
                     setattr(self, name, self._await_for(f))
 
-# %% ../../nbs/015_FastKafka.ipynb 56
+# %% ../../nbs/015_FastKafka.ipynb 81
 @patch
 def create_mocks(self: FastKafka) -> None:
     """Creates self.mocks as a named tuple mapping a new function obtained by calling the original functions and a mock"""
@@ -854,7 +1803,7 @@ def create_mocks(self: FastKafka) -> None:
         }
     )
 
-# %% ../../nbs/015_FastKafka.ipynb 62
+# %% ../../nbs/015_FastKafka.ipynb 87
 @patch
 def benchmark(
     self: FastKafka,
@@ -871,6 +1820,10 @@ def benchmark(
         sliding_window_size: The size of the sliding window to use to calculate
             average throughput. default: None - By default average throughput is
             not calculated
+
+    Delivery latencies of functions decorated with produces are recorded in a histogram
+    available under "delivery_latency" in benchmark_results, and their p50, p99 and
+    p999 are logged together with the throughput.
     """
 
     def _decorator(func: Callable[[I], Optional[O]]) -> Callable[[I], Optional[O]]:
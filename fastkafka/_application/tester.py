@@ -12,6 +12,7 @@ from typing import *
 from pydantic import BaseModel
 
 from .app import FastKafka
+from .._components.asyncapi import _get_msg_cls_for_producer
 from .._components.meta import delegates, export, patch
 from .._testing.apache_kafka_broker import ApacheKafkaBroker
 from .._testing.in_memory_broker import InMemoryBroker
@@ -98,10 +99,12 @@ class Tester(FastKafka):
         """Starts the Tester"""
         for app in self.apps:
             app.create_mocks()
-            await app.__aenter__()
         self.create_mocks()
-        await super().__aenter__()
-        await asyncio.sleep(3)
+        # apps are started when all of their producers are started and all of their
+        # consumers are assigned partitions, so messages sent from now on are consumed
+        await asyncio.gather(
+            *[app.__aenter__() for app in self.apps], super().__aenter__()
+        )
 
     async def _stop_tester(self) -> None:
         """Shuts down the Tester"""
@@ -145,7 +148,7 @@ class Tester(FastKafka):
 
 # %% ../../nbs/016_Tester.ipynb 11
 def mirror_producer(topic: str, producer_f: Callable[..., Any]) -> Callable[..., Any]:
-    msg_type = inspect.signature(producer_f).return_annotation
+    msg_type = _get_msg_cls_for_producer(producer_f)
 
     async def skeleton_func(msg: BaseModel) -> None:
         pass
@@ -200,5 +203,6 @@ def create_mirrors(self: Tester) -> None:
             setattr(self, mirror_f.__name__, mirror_f)
         for topic, (producer_f, _, _) in app._producers_store.items():
             mirror_f = mirror_producer(topic, producer_f)
-            mirror_f = self.consumes()(mirror_f)  # type: ignore
+            # records without envelopes are consumed as usual
+            mirror_f = self.consumes(envelope=True)(mirror_f)  # type: ignore
             setattr(self, mirror_f.__name__, mirror_f)
@@ -1,16 +1,18 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/023_CLI.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'run']
+__all__ = ['logger', 'run', 'replay']
 
 # %% ../nbs/023_CLI.ipynb 1
 import asyncio
 import multiprocessing
+from datetime import datetime
 from typing import *
 
 import typer
 
 from . import _cli_docs, _cli_testing
+from ._components.helpers import _import_from_string
 from ._components.logger import get_logger
 from ._server import run_fastkafka_server
 
@@ -49,7 +51,59 @@ def run(
         raise typer.Exit(1)
 
 # %% ../nbs/023_CLI.ipynb 13
+@_app.command(
+    help="Replays messages from Kafka topics through the consumers of Fast Kafka API application and exits",
+)
+def replay(
+    app: str = typer.Argument(
+        ...,
+        help="input in the form of 'path:app', where **path** is the path to a python file and **app** is an object of type **FastKafka**.",
+    ),
+    kafka_broker: str = typer.Option(
+        ...,
+        help="kafka_broker, one of the keys of the kafka_brokers dictionary passed in the constructor of FastaKafka class.",
+    ),
+    topic: Optional[List[str]] = typer.Option(
+        None,
+        help="Topic to replay, can be used multiple times. Defaults to all topics consumed by the application.",
+    ),
+    from_offset: Optional[int] = typer.Option(
+        None,
+        help="Offset to start the replay from. Defaults to the beginning of the partitions.",
+    ),
+    from_timestamp: Optional[datetime] = typer.Option(
+        None,
+        help="Replay starts at the earliest message with timestamp greater or equal to this one.",
+    ),
+    to_offset: Optional[int] = typer.Option(
+        None,
+        help="Offset to stop the replay at (exclusive). Defaults to the end of the partitions when the replay started.",
+    ),
+    to_timestamp: Optional[datetime] = typer.Option(
+        None,
+        help="Replay stops at the earliest message with timestamp greater or equal to this one.",
+    ),
+) -> None:
+    try:
+        application = _import_from_string(app)
+        application.set_kafka_broker(kafka_broker)
+        replayed = asyncio.run(
+            application.replay(
+                topic if topic else None,
+                from_offset=from_offset,
+                from_timestamp=from_timestamp,
+                to_offset=to_offset,
+                to_timestamp=to_timestamp,
+            )
+        )
+        for replayed_topic, n in replayed.items():
+            typer.echo(f"Replayed {n} messages from topic '{replayed_topic}'")
+    except Exception as e:
+        typer.secho(f"Unexpected internal error: {e}", err=True, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+# %% ../nbs/023_CLI.ipynb 16
 _app.add_typer(_cli_docs._docs_app, name="docs")
 
-# %% ../nbs/023_CLI.ipynb 21
+# %% ../nbs/023_CLI.ipynb 24
 _app.add_typer(_cli_testing._testing_app, name="testing")
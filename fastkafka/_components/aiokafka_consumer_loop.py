@@ -1,27 +1,99 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/011_ConsumerLoop.ipynb.
 
 # %% auto 0
-__all__ = ['logger', 'sanitize_kafka_config', 'aiokafka_consumer_loop']
+__all__ = ['logger', 'EventMetadata', 'LoadShedding', 'sanitize_kafka_config', 'aiokafka_consumer_loop', 'aiokafka_replay_loop']
 
 # %% ../../nbs/011_ConsumerLoop.ipynb 1
+import asyncio
 from asyncio import iscoroutinefunction  # do not use the version from inspect
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from inspect import signature
+from time import perf_counter, time
 from typing import *
 
 import anyio
 import asyncer
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRebalanceListener
 from aiokafka.structs import ConsumerRecord, TopicPartition
 from anyio.streams.memory import MemoryObjectReceiveStream
 from pydantic import BaseModel
 from pydantic.main import ModelMetaclass
 
+from .envelope import is_envelope, unpack_envelope
 from .logger import get_logger
-from .meta import delegates
+from .meta import delegates, export, filter_using_signature
 
 # %% ../../nbs/011_ConsumerLoop.ipynb 5
 logger = get_logger(__name__)
 
 # %% ../../nbs/011_ConsumerLoop.ipynb 9
+@dataclass
+@export("fastkafka")
+class EventMetadata:
+    """
+    A class for encapsulating the metadata of a consumed Kafka record.
+
+    Consumers opt in to receiving it by adding a parameter annotated with EventMetadata
+    to the decorated function, the metadata is not created for other consumers.
+
+    Attributes:
+        topic (str): The topic the record was consumed from.
+        partition (int): The partition the record was consumed from.
+        offset (int): The offset of the record in the partition.
+        timestamp (int): The timestamp of the record in milliseconds since epoch.
+        key (bytes, optional): The key of the record.
+        headers (Sequence[Tuple[str, bytes]]): The headers of the record.
+    """
+
+    topic: str
+    partition: int
+    offset: int
+    timestamp: int
+    key: Optional[bytes]
+    headers: Sequence[Tuple[str, bytes]]
+
+    @staticmethod
+    def create_event_metadata(record: ConsumerRecord) -> "EventMetadata":  # type: ignore
+        """
+        Creates the metadata of a consumed record.
+
+        Params:
+            record: consumed record
+
+        Returns:
+            Metadata of the record
+        """
+        return EventMetadata(
+            topic=record.topic,
+            partition=record.partition,
+            offset=record.offset,
+            timestamp=record.timestamp,
+            key=record.key,
+            headers=record.headers,
+        )
+
+
+def _takes_event_metadata(callback: Callable[..., Any]) -> bool:
+    """
+    Checks if the callback has a parameter annotated with EventMetadata.
+
+    Params:
+        callback: consumer callback
+
+    Returns:
+        True if the metadata of consumed records should be passed to the callback
+    """
+    try:
+        params = signature(callback).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.annotation is EventMetadata or p.annotation == EventMetadata.__name__
+        for p in params
+    )
+
+# %% ../../nbs/011_ConsumerLoop.ipynb 11
 def _create_safe_callback(
     callback: Callable[[BaseModel], Awaitable[None]]
 ) -> Callable[[BaseModel], Awaitable[None]]:
@@ -37,10 +109,11 @@ def _create_safe_callback(
 
     async def _safe_callback(
         msg: BaseModel,
+        *args: Any,
         callback: Callable[[BaseModel], Awaitable[None]] = callback,
     ) -> None:
         try:
-            await callback(msg)
+            await callback(msg, *args)
         except Exception as e:
             logger.warning(
                 f"_safe_callback(): exception caugth {e.__repr__()} while awaiting '{callback}({msg})'"
@@ -48,7 +121,7 @@ def _create_safe_callback(
 
     return _safe_callback
 
-# %% ../../nbs/011_ConsumerLoop.ipynb 12
+# %% ../../nbs/011_ConsumerLoop.ipynb 14
 def _prepare_callback(
     callback: Callable[[BaseModel], Union[None, Awaitable[None]]]
 ) -> Callable[[BaseModel], Awaitable[None]]:
@@ -68,7 +141,72 @@ def _prepare_callback(
     )
     return _create_safe_callback(async_callback)
 
-# %% ../../nbs/011_ConsumerLoop.ipynb 14
+# %% ../../nbs/011_ConsumerLoop.ipynb 16
+def _create_record_dispatcher(  # type: ignore
+    callback: Callable[..., Union[None, Awaitable[None]]],
+    *,
+    topic: str,
+    decoder_fn: Callable[[bytes, ModelMetaclass], Any],
+    msg_type: Type[BaseModel],
+    unpack_envelopes: bool = False,
+    caller: str,
+) -> Callable[[ConsumerRecord], Awaitable[int]]:
+    """
+    Creates the function passing the messages of consumed records to the callback, used by both
+    the consumer and the replay loops.
+
+    Records holding envelopes are unpacked if unpack_envelopes is set. Each message is decoded and
+    passed to the callback together with the metadata of its record if the callback takes it.
+    Exceptions are logged and ignored.
+
+    Params:
+        callback: callback function to be called with the decoded messages
+        topic: Topic the records are consumed from
+        decoder_fn: Function to decode the messages consumed from the topic
+        msg_type: Type of the messages passed to the decoder
+        unpack_envelopes: If True, records marked as envelopes are unpacked
+        caller: name of the function logging the warnings
+
+    Returns:
+        Function dispatching a record and returning the number of its messages
+    """
+    prepared_callback = _prepare_callback(callback)
+    takes_event_metadata = _takes_event_metadata(callback)
+
+    async def dispatch(record: ConsumerRecord) -> int:  # type: ignore
+        try:
+            values = (
+                unpack_envelope(record.value)
+                if unpack_envelopes and is_envelope(record.headers)
+                else [record.value]
+            )
+        except ValueError as e:
+            logger.warning(
+                f"{caller}(): Skipped invalid envelope at offset {record.offset} in partition {record.partition} of topic='{topic}': {e}"
+            )
+            return 0
+        # created once per record and shared by the messages of an envelope
+        meta = (
+            EventMetadata.create_event_metadata(record)
+            if takes_event_metadata
+            else None
+        )
+        for value in values:
+            try:
+                decoded_msg = decoder_fn(value, msg_type)
+                if meta is None:
+                    await prepared_callback(decoded_msg)
+                else:
+                    await prepared_callback(decoded_msg, meta)  # type: ignore
+            except Exception as e:
+                logger.warning(
+                    f"{caller}(): Unexpected exception '{e.__repr__()}' caught and ignored for topic='{topic}' and message: {value!r}"
+                )
+        return len(values)
+
+    return dispatch
+
+# %% ../../nbs/011_ConsumerLoop.ipynb 18
 async def _stream_msgs(  # type: ignore
     msgs: Dict[TopicPartition, bytes],
     send_stream: anyio.streams.memory.MemoryObjectSendStream[Any],
@@ -96,7 +234,83 @@ def _decode_streamed_msgs(  # type: ignore
     decoded_msgs = [msg_type.parse_raw(msg.value.decode("utf-8")) for msg in msgs]
     return decoded_msgs
 
-# %% ../../nbs/011_ConsumerLoop.ipynb 19
+# %% ../../nbs/011_ConsumerLoop.ipynb 23
+@dataclass
+@export("fastkafka")
+class LoadShedding:  # type: ignore
+    """
+    A policy for shedding load in consumers that cannot keep up with the topic.
+
+    The consumer is overloaded when both the number of consumed records waiting to be
+    processed and the average processing time of a record exceed their thresholds. While
+    the consumer is overloaded, records are shed before they are decoded according to the policy:
+        - "sample": only every sample_rate-th record is processed,
+        - "latest_per_key": only the latest record for each key within a batch fetched
+          from a partition is processed, records without a key are always processed,
+        - "drop": records for which drop_f returns True are skipped.
+
+    Attributes:
+        policy (str): One of "sample", "latest_per_key" or "drop".
+        max_buffer_depth (int): Number of records waiting to be processed above which the consumer is overloaded.
+        max_latency (float): Average processing time of a record in seconds above which the consumer is overloaded.
+        sample_rate (int): Every sample_rate-th record is processed when using the "sample" policy.
+        drop_f (Callable[[ConsumerRecord], bool], optional): Function returning True for low priority records, used by the "drop" policy.
+        shed_count (int): Number of records shed so far.
+    """
+
+    policy: str = "sample"
+    max_buffer_depth: int = 1_000
+    max_latency: float = 0.0
+    sample_rate: int = 10
+    drop_f: Optional[Callable[[ConsumerRecord], bool]] = None  # type: ignore
+    shed_count: int = field(default=0, init=False)
+    _seen: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.policy not in ["sample", "latest_per_key", "drop"]:
+            raise ValueError(
+                f"Unknown load shedding policy '{self.policy}', available options are 'sample', 'latest_per_key' and 'drop'"
+            )
+        if self.sample_rate < 1:
+            raise ValueError(f"sample_rate must be positive, got {self.sample_rate}")
+        if self.policy == "drop" and self.drop_f is None:
+            raise ValueError("drop_f must be set when using the 'drop' policy")
+
+    def is_overloaded(self, buffer_depth: int, latency: float) -> bool:
+        return buffer_depth > self.max_buffer_depth and latency > self.max_latency
+
+    def shed(self, records: List[ConsumerRecord]) -> List[ConsumerRecord]:  # type: ignore
+        """
+        Sheds records from a batch fetched from a single partition.
+
+        Params:
+            records: records fetched from a partition
+
+        Returns:
+            Records that should be processed
+        """
+        if self.policy == "sample":
+            kept = [
+                record
+                for i, record in enumerate(records, start=self._seen)
+                if i % self.sample_rate == 0
+            ]
+            self._seen = (self._seen + len(records)) % self.sample_rate
+        elif self.policy == "latest_per_key":
+            latest = {
+                record.key: record for record in records if record.key is not None
+            }
+            kept = [
+                record
+                for record in records
+                if record.key is None or latest[record.key] is record
+            ]
+        else:
+            kept = [record for record in records if not self.drop_f(record)]  # type: ignore
+        self.shed_count = self.shed_count + len(records) - len(kept)
+        return kept
+
+# %% ../../nbs/011_ConsumerLoop.ipynb 26
 async def _streamed_records(
     receive_stream: MemoryObjectReceiveStream,
 ) -> AsyncGenerator[Any, Any]:
@@ -116,6 +330,9 @@ async def _aiokafka_consumer_loop(  # type: ignore
     max_buffer_size: int = 100_000,
     msg_type: Type[BaseModel],
     is_shutting_down_f: Callable[[], bool],
+    max_age: Optional[timedelta] = None,
+    load_shedding: Optional[LoadShedding] = None,
+    unpack_envelopes: bool = False,
     **kwargs: Any,
 ) -> None:
     """
@@ -130,32 +347,61 @@ async def _aiokafka_consumer_loop(  # type: ignore
         max_buffer_size: Maximum number of unconsumed messages in the callback buffer
         msg_types: Dict of message types mapped to their respective topics
         is_shutting_down_f: Function for controlling the shutdown of consumer loop
+        max_age: Messages with timestamp older than max_age are skipped without decoding
+        load_shedding: Policy for shedding records while the callback cannot keep up with the topic
+        unpack_envelopes: If True, records marked as envelopes are unpacked and the callback is called
+            for each of their messages
     """
 
-    prepared_callback = _prepare_callback(callback)
+    dispatch = _create_record_dispatcher(
+        callback,
+        topic=topic,
+        decoder_fn=decoder_fn,
+        msg_type=msg_type,
+        unpack_envelopes=unpack_envelopes,
+        caller="process_message_callback",
+    )
+    max_age_ms = None if max_age is None else max_age / timedelta(milliseconds=1)
 
-    async def process_message_callback(
+    # number of records sent to the stream and not yet processed and the moving
+    # average of time needed to process a record, used for detecting overload
+    buffer_depth = 0
+    latency = 0.0
+
+    async def process_message_callback(  # type: ignore
         receive_stream: MemoryObjectReceiveStream[Any],
-        callback: Callable[[BaseModel], Awaitable[None]] = prepared_callback,
-        msg_type: Type[BaseModel] = msg_type,
+        dispatch: Callable[[ConsumerRecord], Awaitable[int]] = dispatch,
         topic: str = topic,
-        decoder_fn: Callable[[bytes, ModelMetaclass], Any] = decoder_fn,
+        max_age_ms: Optional[float] = max_age_ms,
     ) -> None:
+        nonlocal buffer_depth, latency
+        skipped = 0
         async with receive_stream:
             try:
                 async for record in _streamed_records(receive_stream):
-                    try:
-                        msg = record.value
-                        decoded_msg = decoder_fn(msg, msg_type)
-                        await callback(decoded_msg)
-                    except Exception as e:
-                        logger.warning(
-                            f"process_message_callback(): Unexpected exception '{e.__repr__()}' caught and ignored for topic='{topic}' and message: {msg}"
+                    buffer_depth = buffer_depth - 1
+                    if (
+                        max_age_ms is not None
+                        and time() * 1000 - record.timestamp > max_age_ms
+                    ):
+                        skipped = skipped + 1
+                        continue
+                    if skipped > 0:
+                        logger.info(
+                            f"process_message_callback(): Skipped {skipped} messages older than {max_age} for topic='{topic}'"
                         )
+                        skipped = 0
+                    start = perf_counter()
+                    await dispatch(record)
+                    latency = 0.9 * latency + 0.1 * (perf_counter() - start)
             except Exception as e:
                 logger.warning(
                     f"process_message_callback(): Unexpected exception '{e.__repr__()}' caught and ignored for topic='{topic}'"
                 )
+        if skipped > 0:
+            logger.info(
+                f"process_message_callback(): Skipped {skipped} messages older than {max_age} for topic='{topic}'"
+            )
 
     send_stream, receive_stream = anyio.create_memory_object_stream(
         max_buffer_size=max_buffer_size
@@ -164,8 +410,24 @@ async def _aiokafka_consumer_loop(  # type: ignore
     async with anyio.create_task_group() as tg:
         tg.start_soon(process_message_callback, receive_stream)
         async with send_stream:
+            is_shedding = False
             while not is_shutting_down_f():
                 msgs = await consumer.getmany(**kwargs)
+                if load_shedding is not None:
+                    is_overloaded = load_shedding.is_overloaded(buffer_depth, latency)
+                    if is_overloaded != is_shedding:
+                        is_shedding = is_overloaded
+                        logger.warning(
+                            f"_aiokafka_consumer_loop(): Consumer for topic='{topic}' {'is overloaded, started' if is_shedding else 'caught up, stopped'} shedding load using policy '{load_shedding.policy}', records shed so far: {load_shedding.shed_count}"
+                        )
+                    if is_shedding:
+                        msgs = {
+                            tp: load_shedding.shed(records)
+                            for tp, records in msgs.items()
+                        }
+                buffer_depth = buffer_depth + sum(
+                    len(records) for records in msgs.values()
+                )
                 try:
                     await send_stream.send(msgs.values())
                 except Exception as e:
@@ -176,12 +438,49 @@ async def _aiokafka_consumer_loop(  # type: ignore
                 f"_aiokafka_consumer_loop(): Consumer loop shutting down, waiting for send_stream to drain..."
             )
 
-# %% ../../nbs/011_ConsumerLoop.ipynb 24
+# %% ../../nbs/011_ConsumerLoop.ipynb 35
 def sanitize_kafka_config(**kwargs: Any) -> Dict[str, Any]:
     """Sanitize Kafka config"""
     return {k: "*" * len(v) if "pass" in k.lower() else v for k, v in kwargs.items()}
 
-# %% ../../nbs/011_ConsumerLoop.ipynb 26
+# %% ../../nbs/011_ConsumerLoop.ipynb 37
+class _AssignmentListener(ConsumerRebalanceListener):  # type: ignore
+    """Records that the consumer joined its group, possibly without getting any partitions"""
+
+    def __init__(self) -> None:
+        self.assigned = asyncio.Event()
+
+    async def on_partitions_revoked(self, revoked: Set[TopicPartition]) -> None:  # type: ignore
+        pass
+
+    async def on_partitions_assigned(self, assigned: Set[TopicPartition]) -> None:  # type: ignore
+        self.assigned.set()
+
+
+async def _wait_for_assignment(  # type: ignore
+    consumer: AIOKafkaConsumer, listener: _AssignmentListener, timeout: float
+) -> bool:
+    """Waits until partitions of the subscribed topic are assigned to the consumer
+
+    Consumers in a group can join it without getting any partitions if the group has
+    more consumers than the topic has partitions.
+
+    Args:
+        consumer: Consumer subscribed to a topic using the listener
+        listener: Listener passed to the consumer when subscribing
+        timeout: Time in seconds to wait for the assignment
+
+    Returns:
+        True if the partitions were assigned in time, False otherwise
+    """
+    deadline = perf_counter() + timeout
+    while not (listener.assigned.is_set() or consumer.assignment()):
+        if perf_counter() >= deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+# %% ../../nbs/011_ConsumerLoop.ipynb 39
 @delegates(AIOKafkaConsumer)
 @delegates(_aiokafka_consumer_loop, keep=True)
 async def aiokafka_consumer_loop(
@@ -193,6 +492,11 @@ async def aiokafka_consumer_loop(
     callback: Callable[[BaseModel], Union[None, Awaitable[None]]],
     msg_type: Type[BaseModel],
     is_shutting_down_f: Callable[[], bool],
+    max_age: Optional[Union[float, timedelta]] = None,
+    load_shedding: Optional[LoadShedding] = None,
+    unpack_envelopes: bool = False,
+    on_started: Optional[Callable[[], Awaitable[None]]] = None,
+    assignment_timeout: float = 10.0,
     **kwargs: Any,
 ) -> None:
     """Consumer loop for infinite pooling of the AIOKafka consumer for new messages. Creates and starts AIOKafkaConsumer
@@ -206,8 +510,20 @@ async def aiokafka_consumer_loop(
         max_buffer_size: Maximum number of unconsumed messages in the callback buffer
         msg_type: Type with `parse_json` method used for parsing a decoded message
         is_shutting_down_f: Function for controlling the shutdown of consumer loop
+        max_age: Messages with timestamp older than max_age (in seconds if given as number)
+            are skipped without decoding, default: None - no messages are skipped
+        load_shedding: Policy for shedding records while the callback cannot keep up
+            with the topic, default: None - no records are shed
+        unpack_envelopes: If True, records marked as envelopes are unpacked and the callback
+            is called for each of their messages, default: False
+        on_started: Coroutine function awaited after the consumer is started, subscribed
+            and assigned its partitions, before any messages are consumed, default: None
+        assignment_timeout: Time in seconds to wait for the partitions to be assigned,
+            consuming starts after it even if they were not, default: 10.0
     """
     logger.info(f"aiokafka_consumer_loop() starting...")
+    if max_age is not None and not isinstance(max_age, timedelta):
+        max_age = timedelta(seconds=max_age)
     try:
         consumer = AIOKafkaConsumer(
             **kwargs,
@@ -218,10 +534,19 @@ async def aiokafka_consumer_loop(
 
         await consumer.start()
         logger.info("aiokafka_consumer_loop(): Consumer started.")
-        consumer.subscribe([topic])
+        listener = _AssignmentListener()
+        consumer.subscribe([topic], listener=listener)
         logger.info("aiokafka_consumer_loop(): Consumer subscribed.")
 
         try:
+            if not await _wait_for_assignment(
+                consumer, listener, timeout=assignment_timeout
+            ):
+                logger.warning(
+                    f"aiokafka_consumer_loop(): No partitions of topic '{topic}' assigned in {assignment_timeout}s, starting to consume anyway."
+                )
+            if on_started is not None:
+                await on_started()
             await _aiokafka_consumer_loop(
                 consumer=consumer,
                 topic=topic,
@@ -231,6 +556,9 @@ async def aiokafka_consumer_loop(
                 callback=callback,
                 msg_type=msg_type,
                 is_shutting_down_f=is_shutting_down_f,
+                max_age=max_age,
+                load_shedding=load_shedding,
+                unpack_envelopes=unpack_envelopes,
             )
         finally:
             await consumer.stop()
@@ -241,3 +569,230 @@ async def aiokafka_consumer_loop(
             f"aiokafka_consumer_loop(): unexpected exception raised: '{e.__repr__()}'"
         )
         raise e
+
+# %% ../../nbs/011_ConsumerLoop.ipynb 45
+def _to_timestamp_ms(dt: datetime) -> int:
+    """Converts datetime to the number of milliseconds since epoch used by Kafka"""
+    return int(dt.timestamp() * 1000)
+
+
+async def _get_replay_offsets(  # type: ignore
+    consumer: AIOKafkaConsumer,
+    topic_partitions: List[TopicPartition],
+    *,
+    from_offset: Optional[int] = None,
+    from_timestamp: Optional[datetime] = None,
+    to_offset: Optional[int] = None,
+    to_timestamp: Optional[datetime] = None,
+) -> Tuple[Dict[TopicPartition, int], Dict[TopicPartition, int]]:
+    """
+    Calculates the first offset and the end offset (exclusive) of the replay for each of the topic partitions.
+
+    Params:
+        consumer: started AIOKafkaConsumer with topic partitions assigned
+        topic_partitions: topic partitions to calculate offsets for
+        from_offset: offset to start the replay from, if None the replay starts at the beginning of the partition
+        from_timestamp: replay starts at the earliest message with timestamp greater or equal to this one
+        to_offset: offset to stop the replay at (exclusive), if None the replay stops at the current end of the partition
+        to_timestamp: replay stops at the earliest message with timestamp greater or equal to this one
+
+    Returns:
+        Tuple of dictionaries mapping topic partitions to the first and the end offsets
+    """
+    if from_offset is not None and from_timestamp is not None:
+        raise ValueError("Only one of from_offset and from_timestamp can be used")
+    if to_offset is not None and to_timestamp is not None:
+        raise ValueError("Only one of to_offset and to_timestamp can be used")
+
+    beginning_offsets = await consumer.beginning_offsets(topic_partitions)
+    end_offsets = await consumer.end_offsets(topic_partitions)
+
+    async def _offsets_for_timestamp(  # type: ignore
+        timestamp: datetime,
+    ) -> Dict[TopicPartition, int]:
+        ts = _to_timestamp_ms(timestamp)
+        offsets = await consumer.offsets_for_times({tp: ts for tp in topic_partitions})
+        # no message newer than the timestamp in partition, use the end of the partition
+        return {
+            tp: end_offsets[tp] if offsets[tp] is None else offsets[tp].offset
+            for tp in topic_partitions
+        }
+
+    if from_timestamp is not None:
+        start = await _offsets_for_timestamp(from_timestamp)
+    elif from_offset is not None:
+        start = {tp: max(from_offset, beginning_offsets[tp]) for tp in topic_partitions}
+    else:
+        start = beginning_offsets
+
+    if to_timestamp is not None:
+        end = await _offsets_for_timestamp(to_timestamp)
+    elif to_offset is not None:
+        end = {tp: min(to_offset, end_offsets[tp]) for tp in topic_partitions}
+    else:
+        end = end_offsets
+
+    return {tp: start[tp] for tp in topic_partitions}, {
+        tp: end[tp] for tp in topic_partitions
+    }
+
+# %% ../../nbs/011_ConsumerLoop.ipynb 47
+@delegates(AIOKafkaConsumer.getmany)
+async def _aiokafka_replay_loop(  # type: ignore
+    consumer: AIOKafkaConsumer,
+    *,
+    topic: str,
+    decoder_fn: Callable[[bytes, ModelMetaclass], Any],
+    callback: Callable[[BaseModel], Union[None, Awaitable[None]]],
+    msg_type: Type[BaseModel],
+    start_offsets: Dict[TopicPartition, int],
+    end_offsets: Dict[TopicPartition, int],
+    unpack_envelopes: bool = False,
+    **kwargs: Any,
+) -> int:
+    """
+    Seeks each of the assigned topic partitions to its start offset and streams messages to the callback
+    until the end offsets are reached in all of them.
+
+    Params:
+        consumer: started AIOKafkaConsumer with topic partitions assigned
+        topic: Topic being replayed
+        decoder_fn: Function to decode the messages consumed from the topic
+        callback: callback function to be called after decoding and parsing a consumed message
+        msg_type: Type with `parse_json` method used for parsing a decoded message
+        start_offsets: Dict of offsets to start the replay from mapped to their topic partitions
+        end_offsets: Dict of offsets to stop the replay at (exclusive) mapped to their topic partitions
+        unpack_envelopes: If True, records marked as envelopes are unpacked and the callback is called
+            for each of their messages
+
+    Returns:
+        The number of replayed messages
+    """
+    dispatch = _create_record_dispatcher(
+        callback,
+        topic=topic,
+        decoder_fn=decoder_fn,
+        msg_type=msg_type,
+        unpack_envelopes=unpack_envelopes,
+        caller="_aiokafka_replay_loop",
+    )
+
+    for tp, offset in start_offsets.items():
+        consumer.seek(tp, offset)
+
+    remaining = [tp for tp in start_offsets if start_offsets[tp] < end_offsets[tp]]
+    replayed = 0
+    while remaining:
+        msgs = await consumer.getmany(*remaining, **kwargs)
+        for tp, records in msgs.items():
+            for record in records:
+                if record.offset >= end_offsets[tp]:
+                    break
+                replayed = replayed + await dispatch(record)
+
+        remaining = [
+            tp for tp in remaining if await consumer.position(tp) < end_offsets[tp]
+        ]
+
+    return replayed
+
+# %% ../../nbs/011_ConsumerLoop.ipynb 51
+_replay_consumer_config: Dict[str, Any] = {
+    "fetch_max_bytes": 128 * 1024 * 1024,
+    "max_partition_fetch_bytes": 16 * 1024 * 1024,
+    "max_poll_records": 10_000,
+}
+
+
+@delegates(AIOKafkaConsumer)
+@delegates(_aiokafka_replay_loop, keep=True)
+async def aiokafka_replay_loop(
+    topic: str,
+    decoder_fn: Callable[[bytes, ModelMetaclass], Any],
+    *,
+    timeout_ms: int = 100,
+    callback: Callable[[BaseModel], Union[None, Awaitable[None]]],
+    msg_type: Type[BaseModel],
+    from_offset: Optional[int] = None,
+    from_timestamp: Optional[datetime] = None,
+    to_offset: Optional[int] = None,
+    to_timestamp: Optional[datetime] = None,
+    unpack_envelopes: bool = False,
+    **kwargs: Any,
+) -> int:
+    """Replays messages from all partitions of a topic starting at the given offset or timestamp and exits once the
+    end of the partitions, as seen when the replay started, is reached.
+
+    The consumer is created without a consumer group, so offsets of the consumer groups of the running
+    application are not affected. Fetch sizes and the number of records returned by a single poll are
+    increased to maximize throughput.
+
+    Args:
+        topic: name of the topic to replay
+        decoder_fn: Function to decode the messages consumed from the topic
+        callback: callback function to be called after decoding and parsing a consumed message
+        timeout_ms: Time to timeut the getmany request by the consumer
+        msg_type: Type with `parse_json` method used for parsing a decoded message
+        from_offset: offset to start the replay from, if None the replay starts at the beginning of the partition
+        from_timestamp: replay starts at the earliest message with timestamp greater or equal to this one
+        to_offset: offset to stop the replay at (exclusive), if None the replay stops at the current end of the partition
+        to_timestamp: replay stops at the earliest message with timestamp greater or equal to this one
+        unpack_envelopes: If True, records marked as envelopes are unpacked and the callback is called
+            for each of their messages
+
+    Returns:
+        The number of replayed messages
+    """
+    logger.info(f"aiokafka_replay_loop() starting...")
+    config = {
+        **filter_using_signature(AIOKafkaConsumer, **kwargs),
+        **_replay_consumer_config,
+        "group_id": None,
+        "enable_auto_commit": False,
+    }
+    consumer = AIOKafkaConsumer(**config)
+    logger.info(
+        f"aiokafka_replay_loop(): Consumer created using the following parameters: {sanitize_kafka_config(**config)}"
+    )
+
+    await consumer.start()
+    try:
+        # fetches metadata for all topics
+        await consumer.topics()
+        partitions = consumer.partitions_for_topic(topic)
+        if not partitions:
+            raise ValueError(f"Topic '{topic}' not found")
+        topic_partitions = [TopicPartition(topic, p) for p in sorted(partitions)]
+        consumer.assign(topic_partitions)
+
+        start_offsets, end_offsets = await _get_replay_offsets(
+            consumer,
+            topic_partitions,
+            from_offset=from_offset,
+            from_timestamp=from_timestamp,
+            to_offset=to_offset,
+            to_timestamp=to_timestamp,
+        )
+        logger.info(
+            f"aiokafka_replay_loop(): Replaying topic '{topic}' from offsets {start_offsets} to offsets {end_offsets}"
+        )
+
+        replayed = await _aiokafka_replay_loop(
+            consumer=consumer,
+            topic=topic,
+            decoder_fn=decoder_fn,
+            callback=callback,
+            msg_type=msg_type,
+            start_offsets=start_offsets,
+            end_offsets=end_offsets,
+            unpack_envelopes=unpack_envelopes,
+            timeout_ms=timeout_ms,
+            max_records=config["max_poll_records"],
+        )
+        logger.info(
+            f"aiokafka_replay_loop(): Replayed {replayed} messages from topic '{topic}'"
+        )
+        return replayed
+    finally:
+        await consumer.stop()
+        logger.info(f"aiokafka_replay_loop() finished.")
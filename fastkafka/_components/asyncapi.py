@@ -24,6 +24,7 @@ import fastkafka._components.logger
 
 fastkafka._components.logger.should_supress_timestamps = True
 
+from .aiokafka_consumer_loop import EventMetadata
 from .docs_dependencies import _check_npm_with_local
 from .logger import get_logger
 from .producer_decorator import KafkaEvent, ProduceCallable
@@ -159,6 +160,10 @@ def _get_msg_cls_for_producer(f: ProduceCallable) -> Type[Any]:
             f"Producer function must have a defined return value, got {return_type} as return value"
         )
 
+    # batch producers return lists of messages
+    if hasattr(return_type, "__origin__") and return_type.__origin__ == list:
+        return_type = return_type.__args__[0]
+
     if hasattr(return_type, "__origin__") and return_type.__origin__ == KafkaEvent:
         return_type = return_type.__args__[0]
 
@@ -166,11 +171,12 @@ def _get_msg_cls_for_producer(f: ProduceCallable) -> Type[Any]:
         raise ValueError(f"Producer function return value must have json method")
     return return_type  # type: ignore
 
-# %% ../../nbs/014_AsyncAPI.ipynb 22
+# %% ../../nbs/014_AsyncAPI.ipynb 23
 def _get_msg_cls_for_consumer(f: ConsumeCallable) -> Type[Any]:
     types = get_type_hints(f)
     return_type = types.pop("return", type(None))
-    types_list = list(types.values())
+    # metadata of the consumed record is not a part of the message
+    types_list = [t for t in types.values() if t is not EventMetadata]
     # @app.consumer takes only message argument
     if len(types_list) != 1:
         raise ValueError(
@@ -183,7 +189,7 @@ def _get_msg_cls_for_consumer(f: ConsumeCallable) -> Type[Any]:
         )
     return types_list[0]  # type: ignore
 
-# %% ../../nbs/014_AsyncAPI.ipynb 25
+# %% ../../nbs/014_AsyncAPI.ipynb 26
 def _get_topic_dict(
     f: Callable[[Any], Any], direction: str = "publish"
 ) -> Dict[str, Any]:
@@ -204,7 +210,7 @@ def _get_topic_dict(
         msg_schema["description"] = f.__doc__  # type: ignore
     return {direction: msg_schema}
 
-# %% ../../nbs/014_AsyncAPI.ipynb 28
+# %% ../../nbs/014_AsyncAPI.ipynb 29
 def _get_channels_schema(
     consumers: Dict[str, ConsumeCallable],
     producers: Dict[str, ProduceCallable],
@@ -215,7 +221,7 @@ def _get_channels_schema(
             topics[topic] = _get_topic_dict(f, d)
     return topics
 
-# %% ../../nbs/014_AsyncAPI.ipynb 30
+# %% ../../nbs/014_AsyncAPI.ipynb 31
 def _get_kafka_msg_classes(
     consumers: Dict[str, ConsumeCallable],
     producers: Dict[str, ProduceCallable],
@@ -231,7 +237,7 @@ def _get_kafka_msg_definitions(
 ) -> Dict[str, Dict[str, Any]]:
     return schema(_get_kafka_msg_classes(consumers, producers))  # type: ignore
 
-# %% ../../nbs/014_AsyncAPI.ipynb 32
+# %% ../../nbs/014_AsyncAPI.ipynb 33
 def _get_example(cls: Type[BaseModel]) -> BaseModel:
     kwargs: Dict[str, Any] = {}
     for k, v in cls.__fields__.items():
@@ -248,7 +254,7 @@ def _get_example(cls: Type[BaseModel]) -> BaseModel:
 
     return json.loads(cls(**kwargs).json())  # type: ignore
 
-# %% ../../nbs/014_AsyncAPI.ipynb 34
+# %% ../../nbs/014_AsyncAPI.ipynb 35
 def _add_example_to_msg_definitions(
     msg_cls: Type[BaseModel], msg_schema: Dict[str, Dict[str, Any]]
 ) -> None:
@@ -277,7 +283,7 @@ def _get_msg_definitions_with_examples(
 
     return msg_schema
 
-# %% ../../nbs/014_AsyncAPI.ipynb 36
+# %% ../../nbs/014_AsyncAPI.ipynb 37
 def _get_security_schemes(kafka_brokers: KafkaBrokers) -> Dict[str, Any]:
     security_schemes = {}
     for key, kafka_broker in kafka_brokers.brokers.items():
@@ -287,7 +293,7 @@ def _get_security_schemes(kafka_brokers: KafkaBrokers) -> Dict[str, Any]:
             )
     return security_schemes
 
-# %% ../../nbs/014_AsyncAPI.ipynb 38
+# %% ../../nbs/014_AsyncAPI.ipynb 39
 def _get_components_schema(
     consumers: Dict[str, ConsumeCallable],
     producers: Dict[str, ProduceCallable],
@@ -320,7 +326,7 @@ def _get_components_schema(
 
     return _sub_values(components)  # type: ignore
 
-# %% ../../nbs/014_AsyncAPI.ipynb 40
+# %% ../../nbs/014_AsyncAPI.ipynb 41
 def _get_servers_schema(kafka_brokers: KafkaBrokers) -> Dict[str, Any]:
     servers = json.loads(kafka_brokers.json(sort_keys=False))["brokers"]
 
@@ -329,7 +335,7 @@ def _get_servers_schema(kafka_brokers: KafkaBrokers) -> Dict[str, Any]:
             servers[key]["security"] = [{f"{key}_default_security": []}]
     return servers  # type: ignore
 
-# %% ../../nbs/014_AsyncAPI.ipynb 42
+# %% ../../nbs/014_AsyncAPI.ipynb 43
 def _get_asyncapi_schema(
     consumers: Dict[str, ConsumeCallable],
     producers: Dict[str, ProduceCallable],
@@ -350,7 +356,7 @@ def _get_asyncapi_schema(
         "components": components,
     }
 
-# %% ../../nbs/014_AsyncAPI.ipynb 44
+# %% ../../nbs/014_AsyncAPI.ipynb 45
 def yaml_file_cmp(file_1: Union[Path, str], file_2: Union[Path, str]) -> bool:
     try:
         import yaml
@@ -366,7 +372,7 @@ def yaml_file_cmp(file_1: Union[Path, str], file_2: Union[Path, str]) -> bool:
     d = [_read(f) for f in [file_1, file_2]]
     return d[0] == d[1]
 
-# %% ../../nbs/014_AsyncAPI.ipynb 45
+# %% ../../nbs/014_AsyncAPI.ipynb 46
 def _generate_async_spec(
     *,
     consumers: Dict[str, ConsumeCallable],
@@ -410,7 +416,7 @@ def _generate_async_spec(
             )
             return False
 
-# %% ../../nbs/014_AsyncAPI.ipynb 47
+# %% ../../nbs/014_AsyncAPI.ipynb 48
 def _generate_async_docs(
     *,
     spec_path: Path,
@@ -442,7 +448,7 @@ def _generate_async_docs(
             f"Generation of async docs failed, used '$ {' '.join(cmd)}'{p.stdout.decode()}"
         )
 
-# %% ../../nbs/014_AsyncAPI.ipynb 49
+# %% ../../nbs/014_AsyncAPI.ipynb 50
 def export_async_spec(
     *,
     consumers: Dict[str, ConsumeCallable],
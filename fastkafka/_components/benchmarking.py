@@ -1,9 +1,10 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/017_Benchmarking.ipynb.
 
 # %% auto 0
-__all__ = ['logger']
+__all__ = ['logger', 'LatencyHistogram']
 
 # %% ../../nbs/017_Benchmarking.ipynb 1
+import math
 from collections import deque
 from datetime import datetime, timedelta
 from functools import wraps
@@ -33,8 +34,10 @@ def _benchmark(
     """
     if isinstance(interval, int):
         interval = timedelta(seconds=interval)
-    if func_name not in benchmark_results:
+    # producers register their delivery latency before the first call
+    if "count" not in benchmark_results.get(func_name, {}):
         benchmark_results[func_name] = {
+            **benchmark_results.get(func_name, {}),
             "count": 0,
             "last_count": 0,
             "start": None,
@@ -65,6 +68,9 @@ def _benchmark(
             log_msg += f", Avg throughput = {mean(benchmark_results[func_name]['history']):5,.0f}"
         #             if len(benchmark_results[func_name]["history"]) > 1:
         #                 log_msg += f", Standard deviation of throughput is {stdev(benchmark_results[func_name]['history']):5,.0f}"
+        if "delivery_latency" in benchmark_results[func_name]:
+            latency = benchmark_results[func_name]["delivery_latency"]
+            log_msg += f", Delivery latency p50/p99/p999 = {latency.percentile(50) * 1000:.1f}/{latency.percentile(99) * 1000:.1f}/{latency.percentile(99.9) * 1000:.1f} ms"
         log_msg = (
             log_msg
             + f" - For {func_name}(interval={interval.seconds},{sliding_window_size=})"
@@ -75,3 +81,82 @@ def _benchmark(
         benchmark_results[func_name]["last_count"] = benchmark_results[func_name][
             "count"
         ]
+
+# %% ../../nbs/017_Benchmarking.ipynb 7
+class LatencyHistogram:
+    """Histogram of latencies with fixed memory and bounded relative error."""
+
+    # values are recorded in microseconds, 7 bits of precision give a relative error of at most 1/64
+    _SUB_BUCKET_BITS = 7
+    _SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+    _HALF_SUB_BUCKET_COUNT = _SUB_BUCKET_COUNT // 2
+
+    def __init__(self, max_latency: float = 3600.0):
+        """
+        Params:
+            max_latency: highest recorded latency in seconds, higher latencies are recorded as this one
+        """
+        self._max_value = int(max_latency * 1_000_000)
+        self._counts = [0] * (self._index(self._max_value) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        if value < cls._SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - cls._SUB_BUCKET_BITS
+        return (
+            cls._SUB_BUCKET_COUNT
+            + (shift - 1) * cls._HALF_SUB_BUCKET_COUNT
+            + (value >> shift)
+            - cls._HALF_SUB_BUCKET_COUNT
+        )
+
+    @classmethod
+    def _highest_value(cls, index: int) -> int:
+        if index < cls._SUB_BUCKET_COUNT:
+            return index
+        shift, sub_bucket = divmod(
+            index - cls._SUB_BUCKET_COUNT, cls._HALF_SUB_BUCKET_COUNT
+        )
+        return ((sub_bucket + cls._HALF_SUB_BUCKET_COUNT + 1) << (shift + 1)) - 1
+
+    def record(self, latency: float) -> None:
+        """Records a latency given in seconds"""
+        value = min(max(int(latency * 1_000_000), 0), self._max_value)
+        self._counts[self._index(value)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def percentile(self, percentile: float) -> float:
+        """Returns the latency in seconds below which the given percentage of the recorded latencies fall"""
+        if self.count == 0:
+            return 0.0
+        target = max(math.ceil(percentile / 100 * self.count), 1)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(self._highest_value(index) / 1_000_000, self.max)
+        return self.max
+
+    def reset(self) -> None:
+        """Removes all recorded latencies"""
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def get_stats(self) -> Dict[str, float]:
+        """Returns the number of recorded latencies, their mean, max and p50, p99 and p999 in milliseconds"""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count * 1000 if self.count else 0.0,
+            "p50": self.percentile(50) * 1000,
+            "p99": self.percentile(99) * 1000,
+            "p999": self.percentile(99.9) * 1000,
+            "max": self.max * 1000,
+        }
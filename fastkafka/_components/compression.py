@@ -0,0 +1,141 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/028_Compression.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'get_available_compression_types', 'benchmark_compression', 'AutoCompression']
+
+# %% ../../nbs/028_Compression.ipynb 1
+from dataclasses import dataclass
+from time import perf_counter
+from typing import *
+
+from kafka.codec import (
+    gzip_encode,
+    has_gzip,
+    has_lz4,
+    has_snappy,
+    has_zstd,
+    lz4_encode,
+    snappy_encode,
+    zstd_encode,
+)
+
+from .logger import get_logger
+from .meta import export
+
+# %% ../../nbs/028_Compression.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/028_Compression.ipynb 6
+_CODECS: Dict[str, Tuple[Callable[[], bool], Callable[[bytes], bytes]]] = {
+    "gzip": (has_gzip, gzip_encode),
+    "snappy": (has_snappy, snappy_encode),
+    "lz4": (has_lz4, lz4_encode),
+    "zstd": (has_zstd, zstd_encode),
+}
+
+
+def get_available_compression_types() -> List[str]:
+    """Returns the compression types which can be used with the installed packages"""
+    return [name for name, (is_available, _) in _CODECS.items() if is_available()]
+
+# %% ../../nbs/028_Compression.ipynb 8
+def benchmark_compression(
+    samples: List[bytes],
+    compression_types: Optional[List[str]] = None,
+    *,
+    min_duration: float = 0.05,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmarks compression codecs on sample payloads.
+
+    Samples are compressed together, as messages are compressed in batches by producers.
+
+    Params:
+        samples: encoded messages
+        compression_types: codecs to benchmark, all available codecs by default
+        min_duration: minimal time in seconds spent compressing the samples with each codec
+
+    Returns:
+        Dictionary with the size of compressed samples relative to the original size
+        ("ratio") and compression throughput in MB/s ("throughput") for each codec
+    """
+    batch = b"".join(samples)
+    if len(batch) == 0:
+        raise ValueError("Samples must not be empty")
+    if compression_types is None:
+        compression_types = get_available_compression_types()
+
+    results: Dict[str, Dict[str, float]] = {}
+    for compression_type in compression_types:
+        if compression_type not in _CODECS:
+            raise ValueError(f"Unknown compression type '{compression_type}'")
+        is_available, encode = _CODECS[compression_type]
+        if not is_available():
+            raise ValueError(
+                f"Compression type '{compression_type}' is not available, please install FastKafka using the command 'fastkafka[compression]'"
+            )
+
+        n, started_at = 0, perf_counter()
+        while True:
+            compressed = encode(batch)
+            n = n + 1
+            duration = perf_counter() - started_at
+            if duration >= min_duration:
+                break
+        results[compression_type] = {
+            "ratio": len(compressed) / len(batch),
+            "throughput": n * len(batch) / duration / 1_000_000,
+        }
+    return results
+
+# %% ../../nbs/028_Compression.ipynb 11
+@dataclass
+@export("fastkafka")
+class AutoCompression:
+    """
+    Settings for choosing the compression type of a producer by benchmarking codecs at startup.
+
+    Attributes:
+        samples (list, optional): Sample messages or encoded payloads to benchmark on. By default,
+            the example of the message class built from the examples of its fields is repeated
+            to fill a batch of the producer's max_batch_size.
+        objective (str): "ratio" chooses the codec compressing the samples best and
+            "throughput" the fastest codec compressing them by at least min_saving.
+        compression_types (list, optional): Codecs to choose from, all available codecs by default.
+        min_saving (float): Codecs reducing the size of samples by less than this fraction
+            are not used. If no codec qualifies, the compression type configured for the
+            app is used, messages are not compressed if none is configured.
+    """
+
+    samples: Optional[List[Any]] = None
+    objective: str = "ratio"
+    compression_types: Optional[List[str]] = None
+    min_saving: float = 0.1
+
+    def __post_init__(self) -> None:
+        if self.objective not in ["ratio", "throughput"]:
+            raise ValueError(
+                f"objective must be one of 'ratio' or 'throughput', got '{self.objective}'"
+            )
+
+    def choose(self, samples: List[bytes]) -> Optional[str]:
+        """
+        Benchmarks codecs on encoded samples and returns the chosen compression type.
+
+        Params:
+            samples: encoded messages
+
+        Returns:
+            The chosen compression type or None if messages should not be compressed
+        """
+        results = benchmark_compression(samples, self.compression_types)
+        candidates = {
+            compression_type: result
+            for compression_type, result in results.items()
+            if result["ratio"] <= 1 - self.min_saving
+        }
+        if len(candidates) == 0:
+            return None
+        if self.objective == "ratio":
+            return min(candidates, key=lambda t: candidates[t]["ratio"])
+        return max(candidates, key=lambda t: candidates[t]["throughput"])
@@ -7,11 +7,13 @@ __all__ = ['logger', 'AvroBase', 'avro_encoder', 'avro_decoder', 'avsc_to_pydant
 import io
 import json
 from typing import *
+from weakref import WeakKeyDictionary
 
 import fastavro
 from pydantic import BaseModel, create_model
 from pydantic.main import ModelMetaclass
 
+from .trusted import construct_model
 from ..logger import get_logger
 from ..meta import export
 
@@ -205,6 +207,33 @@ class AvroBase(BaseModel):
         }
 
 # %% ../../../nbs/018_Avro_Encode_Decoder.ipynb 11
+# parsed schemas of pydantic classes, entries of redefined classes are dropped once the old class is garbage collected
+_parsed_schemas: "WeakKeyDictionary[ModelMetaclass, Dict[str, Any]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_parsed_schema(cls: ModelMetaclass) -> Dict[str, Any]:
+    """
+    Returns the parsed Avro schema of the pydantic class, the schema is generated and parsed only once per class
+
+    Params:
+        cls: Pydantic class
+
+    Returns:
+        Avro schema parsed by fastavro
+    """
+    try:
+        return _parsed_schemas[cls]
+    except KeyError:
+        schema = cast(
+            Dict[str, Any],
+            fastavro.schema.parse_schema(AvroBase.avro_schema_for_pydantic(cls)),
+        )
+        _parsed_schemas[cls] = schema
+        return schema
+
+# %% ../../../nbs/018_Avro_Encode_Decoder.ipynb 13
 @export("fastkafka.encoder")
 def avro_encoder(msg: BaseModel) -> bytes:
     """
@@ -216,33 +245,35 @@ def avro_encoder(msg: BaseModel) -> bytes:
     Returns:
         A bytes message which is encoded from pydantic basemodel
     """
-    schema = fastavro.schema.parse_schema(AvroBase.avro_schema_for_pydantic(msg))
+    schema = _get_parsed_schema(msg.__class__)
     bytes_writer = io.BytesIO()
     fastavro.schemaless_writer(bytes_writer, schema, msg.dict())
     raw_bytes = bytes_writer.getvalue()
     return raw_bytes
 
-# %% ../../../nbs/018_Avro_Encode_Decoder.ipynb 13
+# %% ../../../nbs/018_Avro_Encode_Decoder.ipynb 15
 @export("fastkafka.encoder")
-def avro_decoder(raw_msg: bytes, cls: ModelMetaclass) -> Any:
+def avro_decoder(raw_msg: bytes, cls: ModelMetaclass, validate: bool = True) -> Any:
     """
     Decoder to decode avro encoded messages to pydantic model instance
 
     Args:
         raw_msg: Avro encoded bytes message received from Kafka topic
         cls: Pydantic class; This pydantic class will be used to construct instance of same class
+        validate: If False, the instance is built without validating the message, use only
+            for messages of trusted producers, default: True
 
     Returns:
         An instance of given pydantic class
     """
-    schema = fastavro.schema.parse_schema(AvroBase.avro_schema_for_pydantic(cls))
+    schema = _get_parsed_schema(cls)
 
     bytes_reader = io.BytesIO(raw_msg)
-    msg_dict = fastavro.schemaless_reader(bytes_reader, schema)
+    msg_dict = cast(Dict[str, Any], fastavro.schemaless_reader(bytes_reader, schema))
 
-    return cls(**msg_dict)
+    return cls(**msg_dict) if validate else construct_model(cls, msg_dict)
 
-# %% ../../../nbs/018_Avro_Encode_Decoder.ipynb 16
+# %% ../../../nbs/018_Avro_Encode_Decoder.ipynb 19
 @export("fastkafka.encoder")
 def avsc_to_pydantic(schema: Dict[str, Any]) -> ModelMetaclass:
     """
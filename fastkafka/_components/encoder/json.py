@@ -11,6 +11,7 @@ from typing import *
 from pydantic import BaseModel
 from pydantic.main import ModelMetaclass
 
+from .trusted import construct_model
 from ..logger import get_logger
 from ..meta import export
 
@@ -41,17 +42,19 @@ def json_encoder(msg: BaseModel) -> bytes:
 
 # %% ../../../nbs/019_Json_Encode_Decoder.ipynb 11
 @export("fastkafka.encoder")
-def json_decoder(raw_msg: bytes, cls: ModelMetaclass) -> Any:
+def json_decoder(raw_msg: bytes, cls: ModelMetaclass, validate: bool = True) -> Any:
     """
     Decoder to decode json string in bytes to pydantic model instance
 
     Args:
         raw_msg: Bytes message received from Kafka topic
         cls: Pydantic class; This pydantic class will be used to construct instance of same class
+        validate: If False, the instance is built without validating the message, use only
+            for messages of trusted producers, default: True
 
     Returns:
         An instance of given pydantic class
     """
     msg_dict = json.loads(raw_msg.decode("utf-8"))
 
-    return cls(**msg_dict)
+    return cls(**msg_dict) if validate else construct_model(cls, msg_dict)
@@ -0,0 +1,23 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/036_Json_Encoders.ipynb.
+
+# %% auto 0
+__all__ = ['has_json_encoders', 'get_default']
+
+# %% ../../../nbs/036_Json_Encoders.ipynb 1
+from functools import partial
+from typing import *
+
+from pydantic.json import custom_pydantic_encoder, pydantic_encoder
+from pydantic.main import ModelMetaclass
+
+# %% ../../../nbs/036_Json_Encoders.ipynb 4
+def has_json_encoders(cls: ModelMetaclass) -> bool:
+    """Checks if the class defines custom json_encoders in its Config"""
+    return bool(getattr(cls.__config__, "json_encoders", {}))  # type: ignore
+
+
+def get_default(cls: ModelMetaclass) -> Callable[[Any], Any]:
+    """Returns the function serializing values not supported by the serialization library, custom json_encoders of the class are used first"""
+    if has_json_encoders(cls):
+        return partial(custom_pydantic_encoder, cls.__config__.json_encoders)  # type: ignore
+    return pydantic_encoder
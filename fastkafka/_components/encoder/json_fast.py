@@ -0,0 +1,97 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/032_Json_Fast_Encode_Decoder.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'JsonDumps', 'json_fast_encoder', 'json_fast_decoder']
+
+# %% ../../../nbs/032_Json_Fast_Encode_Decoder.ipynb 1
+import json
+from typing import *
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+from pydantic.main import ModelMetaclass
+
+from .json_encoders import has_json_encoders
+from .trusted import construct_model
+from ..logger import get_logger
+from ..meta import export
+
+try:
+    import orjson
+
+    _has_orjson = True
+except ModuleNotFoundError:
+    _has_orjson = False
+
+try:
+    import msgspec
+
+    _has_msgspec = True
+except ModuleNotFoundError:
+    _has_msgspec = False
+
+# %% ../../../nbs/032_Json_Fast_Encode_Decoder.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../../nbs/032_Json_Fast_Encode_Decoder.ipynb 6
+JsonDumps = Callable[[Any, Callable[[Any], Any]], bytes]
+
+
+def _json_dumps(o: Any, default: Callable[[Any], Any]) -> bytes:
+    return json.dumps(o, default=default).encode("utf-8")
+
+
+def _get_json_backend() -> Tuple[str, Callable[[bytes], Any], JsonDumps]:
+    """Returns the name and the loads and dumps functions of the fastest available JSON library"""
+    if _has_orjson:
+        return (
+            "orjson",
+            orjson.loads,
+            lambda o, default: orjson.dumps(
+                o, default=default, option=orjson.OPT_NON_STR_KEYS
+            ),
+        )
+    if _has_msgspec:
+        # msgspec serializes Decimal as str and UTC datetimes with "Z", unlike pydantic
+        return "msgspec", msgspec.json.decode, _json_dumps
+    return "json", json.loads, _json_dumps
+
+
+_json_backend, _loads, _dumps = _get_json_backend()
+
+# %% ../../../nbs/032_Json_Fast_Encode_Decoder.ipynb 8
+@export("fastkafka.encoder")
+def json_fast_encoder(msg: BaseModel) -> bytes:
+    """
+    Encoder to encode pydantic instances to json bytes using orjson if installed
+
+    Args:
+        msg: An instance of pydantic basemodel
+
+    Returns:
+        Json bytes encoded from pydantic basemodel
+    """
+    if has_json_encoders(msg.__class__):
+        # orjson serializes types like datetime and UUID without calling json_encoders
+        return msg.json().encode("utf-8")
+    return _dumps(msg.dict(), pydantic_encoder)
+
+
+@export("fastkafka.encoder")
+def json_fast_decoder(
+    raw_msg: bytes, cls: ModelMetaclass, validate: bool = True
+) -> Any:
+    """
+    Decoder to decode json bytes to pydantic model instance using orjson or msgspec if installed
+
+    Args:
+        raw_msg: Bytes message received from Kafka topic
+        cls: Pydantic class; This pydantic class will be used to construct instance of same class
+        validate: If False, the instance is built without validating the message, use only
+            for messages of trusted producers, default: True
+
+    Returns:
+        An instance of given pydantic class
+    """
+    msg_dict = _loads(raw_msg)
+    return cls(**msg_dict) if validate else construct_model(cls, msg_dict)
@@ -0,0 +1,128 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/034_MessagePack_Encode_Decoder.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'msgpack_encoder', 'msgpack_decoder']
+
+# %% ../../../nbs/034_MessagePack_Encode_Decoder.ipynb 1
+import threading
+from typing import *
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+from pydantic.main import ModelMetaclass
+
+from .json_encoders import get_default
+from .trusted import construct_model
+from ..logger import get_logger
+from ..meta import export
+
+try:
+    import msgpack
+
+    _has_msgpack = True
+except ModuleNotFoundError:
+    _has_msgpack = False
+
+# %% ../../../nbs/034_MessagePack_Encode_Decoder.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../../nbs/034_MessagePack_Encode_Decoder.ipynb 6
+_local = threading.local()
+
+
+def _get_packer(cls: ModelMetaclass) -> Any:
+    """Returns the msgpack.Packer of the class for the current thread"""
+    packers: Optional["WeakKeyDictionary[ModelMetaclass, Any]"] = getattr(
+        _local, "packers", None
+    )
+    if packers is None:
+        packers = WeakKeyDictionary()
+        _local.packers = packers
+    try:
+        return packers[cls]
+    except KeyError:
+        packer = msgpack.Packer(default=get_default(cls), use_bin_type=True)
+        packers[cls] = packer
+        return packer
+
+
+def _create_unpacker() -> Any:
+    """Creates the msgpack.Unpacker of the current thread"""
+    _local.unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+    _local.fed = 0
+    return _local.unpacker
+
+
+def _unpack(raw_msg: bytes) -> Any:
+    """
+    Unpacks a message using the unpacker of the current thread
+
+    Params:
+        raw_msg: msgpack bytes
+
+    Returns:
+        The unpacked object
+
+    Raises:
+        ValueError: if the message is truncated or contains more than one object
+    """
+    unpacker = getattr(_local, "unpacker", None) or _create_unpacker()
+    try:
+        unpacker.feed(raw_msg)
+        _local.fed += len(raw_msg)
+        obj = unpacker.unpack()
+    except msgpack.OutOfData:
+        _create_unpacker()
+        raise ValueError(f"Truncated msgpack message of {len(raw_msg)} bytes")
+    except Exception:
+        _create_unpacker()
+        raise
+    if unpacker.tell() != _local.fed:
+        _create_unpacker()
+        raise ValueError(
+            f"Extra data after msgpack object in message of {len(raw_msg)} bytes"
+        )
+    return obj
+
+# %% ../../../nbs/034_MessagePack_Encode_Decoder.ipynb 10
+def _check_msgpack() -> None:
+    if not _has_msgpack:
+        raise ModuleNotFoundError(
+            "Unable to import msgpack packages. Please install FastKafka using the command 'fastkafka[msgpack]'"
+        )
+
+
+@export("fastkafka.encoder")
+def msgpack_encoder(msg: BaseModel) -> bytes:
+    """
+    Encoder to encode pydantic instances to msgpack bytes
+
+    Datetimes, decimals and UUIDs are encoded the same way as by the JSON encoder.
+
+    Args:
+        msg: An instance of pydantic basemodel
+
+    Returns:
+        Msgpack bytes encoded from pydantic basemodel
+    """
+    _check_msgpack()
+    return _get_packer(msg.__class__).pack(msg.dict())  # type: ignore
+
+
+@export("fastkafka.encoder")
+def msgpack_decoder(raw_msg: bytes, cls: ModelMetaclass, validate: bool = True) -> Any:
+    """
+    Decoder to decode msgpack bytes to pydantic model instance
+
+    Args:
+        raw_msg: Msgpack bytes message received from Kafka topic
+        cls: Pydantic class; This pydantic class will be used to construct instance of same class
+        validate: If False, the instance is built without validating the message, use only
+            for messages of trusted producers, default: True
+
+    Returns:
+        An instance of given pydantic class
+    """
+    _check_msgpack()
+    msg_dict = _unpack(raw_msg)
+    return cls(**msg_dict) if validate else construct_model(cls, msg_dict)
@@ -0,0 +1,236 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/033_Protobuf_Encode_Decoder.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'protobuf_encoder', 'protobuf_decoder']
+
+# %% ../../../nbs/033_Protobuf_Encode_Decoder.ipynb 1
+from dataclasses import dataclass, field
+from datetime import timezone
+from typing import *
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+from pydantic.main import ModelMetaclass
+
+from .trusted import construct_model
+from ..logger import get_logger
+from ..meta import export
+
+try:
+    from google.protobuf.descriptor import Descriptor, FieldDescriptor
+    from google.protobuf.message import Message
+
+    _message_cls: Optional[Type[Message]] = Message
+except ModuleNotFoundError:
+    _message_cls = None
+
+# %% ../../../nbs/033_Protobuf_Encode_Decoder.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../../nbs/033_Protobuf_Encode_Decoder.ipynb 8
+_SCALAR, _REPEATED, _MAP, _TIMESTAMP, _MESSAGE, _REPEATED_MESSAGE = range(6)
+
+
+@dataclass
+class _FieldMapping:
+    name: str
+    kind: int
+    has_presence: bool
+    # mapping of the fields of nested messages
+    fields: List["_FieldMapping"] = field(default_factory=list)
+
+
+_field_mappings: "WeakKeyDictionary[ModelMetaclass, Dict[str, List[_FieldMapping]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _is_repeated(proto_field: "FieldDescriptor") -> bool:
+    # label was removed from descriptors in newer versions of protobuf
+    if hasattr(proto_field, "is_repeated"):
+        return proto_field.is_repeated
+    return proto_field.label == FieldDescriptor.LABEL_REPEATED  # type: ignore
+
+
+def _get_field_mappings(
+    cls: ModelMetaclass, descriptor: "Descriptor"
+) -> List[_FieldMapping]:
+    """
+    Returns the mapping of the fields of the pydantic class to the fields of the protobuf message, the mapping is computed once per class and message type
+
+    Params:
+        cls: Pydantic class
+        descriptor: descriptor of the protobuf message
+
+    Returns:
+        Mapping of the fields of the class
+
+    Raises:
+        ValueError: if a field of the class cannot be mapped to a field of the message
+    """
+    mappings = _field_mappings.setdefault(cls, {})
+    if descriptor.full_name in mappings:
+        return mappings[descriptor.full_name]
+
+    missing = [name for name in cls.__fields__ if name not in descriptor.fields_by_name]  # type: ignore
+    if missing:
+        raise ValueError(
+            f"Fields {missing} of '{cls.__name__}' are missing in protobuf message '{descriptor.full_name}'"
+        )
+
+    # stored before mapping nested messages, so recursive models are mapped only once
+    fields: List[_FieldMapping] = []
+    mappings[descriptor.full_name] = fields
+    try:
+        for name, model_field in cls.__fields__.items():  # type: ignore
+            proto_field = descriptor.fields_by_name[name]
+            message_type = proto_field.message_type
+            mapping = _FieldMapping(
+                name=name,
+                kind=_REPEATED if _is_repeated(proto_field) else _SCALAR,
+                has_presence=proto_field.has_presence,
+            )
+            if message_type is not None and message_type.GetOptions().map_entry:
+                if message_type.fields_by_name["value"].message_type is not None:
+                    raise ValueError(
+                        f"Map field '{name}' of protobuf message '{descriptor.full_name}' has message values, which are not supported"
+                    )
+                mapping.kind = _MAP
+            elif message_type is not None and (
+                message_type.full_name == "google.protobuf.Timestamp"
+            ):
+                if mapping.kind == _REPEATED:
+                    raise ValueError(
+                        f"Repeated timestamp field '{name}' of protobuf message '{descriptor.full_name}' is not supported"
+                    )
+                mapping.kind = _TIMESTAMP
+            elif message_type is not None:
+                nested_cls = model_field.type_
+                if not (
+                    isinstance(nested_cls, type) and issubclass(nested_cls, BaseModel)
+                ):
+                    raise ValueError(
+                        f"Field '{name}' of '{cls.__name__}' must be a pydantic model to be mapped to protobuf message '{message_type.full_name}'"
+                    )
+                mapping.kind = (
+                    _REPEATED_MESSAGE if mapping.kind == _REPEATED else _MESSAGE
+                )
+                mapping.fields = _get_field_mappings(nested_cls, message_type)
+            fields.append(mapping)
+    except Exception:
+        del mappings[descriptor.full_name]
+        raise
+    return fields
+
+# %% ../../../nbs/033_Protobuf_Encode_Decoder.ipynb 10
+def _to_proto(msg: BaseModel, proto: "Message", fields: List[_FieldMapping]) -> None:
+    """Sets the fields of the protobuf message to the values of the fields of the pydantic instance"""
+    for f in fields:
+        value = getattr(msg, f.name)
+        if value is None:
+            continue
+        if f.kind == _SCALAR:
+            setattr(proto, f.name, value)
+        elif f.kind == _REPEATED:
+            getattr(proto, f.name).extend(value)
+        elif f.kind == _MAP:
+            getattr(proto, f.name).update(value)
+        elif f.kind == _TIMESTAMP:
+            getattr(proto, f.name).FromDatetime(value)
+        elif f.kind == _MESSAGE:
+            nested = getattr(proto, f.name)
+            nested.SetInParent()
+            _to_proto(value, nested, f.fields)
+        else:
+            repeated = getattr(proto, f.name)
+            for v in value:
+                _to_proto(v, repeated.add(), f.fields)
+
+
+def _from_proto(proto: "Message", fields: List[_FieldMapping]) -> Dict[str, Any]:
+    """Returns the values of the fields of the protobuf message, fields which are not set are left out so they get the default values of the pydantic class"""
+    values: Dict[str, Any] = {}
+    for f in fields:
+        if f.has_presence and not proto.HasField(f.name):
+            continue
+        value = getattr(proto, f.name)
+        if f.kind == _SCALAR:
+            values[f.name] = value
+        elif f.kind == _REPEATED:
+            values[f.name] = list(value)
+        elif f.kind == _MAP:
+            values[f.name] = dict(value)
+        elif f.kind == _TIMESTAMP:
+            values[f.name] = value.ToDatetime(tzinfo=timezone.utc)
+        elif f.kind == _MESSAGE:
+            values[f.name] = _from_proto(value, f.fields)
+        else:
+            values[f.name] = [_from_proto(v, f.fields) for v in value]
+    return values
+
+# %% ../../../nbs/033_Protobuf_Encode_Decoder.ipynb 11
+def _get_protobuf_message(cls: ModelMetaclass) -> Type["Message"]:
+    if _message_cls is None:
+        raise ModuleNotFoundError(
+            "Unable to import protobuf packages. Please install FastKafka using the command 'fastkafka[protobuf]'"
+        )
+    proto_cls = getattr(cls.__config__, "protobuf_message", None)  # type: ignore
+    if proto_cls is None:
+        raise ValueError(
+            f"Protobuf message of '{cls.__name__}' is not set, set it as 'protobuf_message' in the Config of the class"
+        )
+    return proto_cls  # type: ignore
+
+
+@export("fastkafka.encoder")
+def protobuf_encoder(msg: Union[BaseModel, "Message"]) -> bytes:
+    """
+    Encoder to encode pydantic instances or protobuf messages to protobuf bytes
+
+    Pydantic classes are mapped to the protobuf message set as `protobuf_message` in their Config,
+    using the fields with the same names.
+
+    Args:
+        msg: An instance of pydantic basemodel or a protobuf message
+
+    Returns:
+        Protobuf bytes encoded from the message
+    """
+    if _message_cls is not None and isinstance(msg, _message_cls):
+        return msg.SerializeToString()
+    model = cast(BaseModel, msg)
+    proto_cls = _get_protobuf_message(model.__class__)
+    proto = proto_cls()
+    _to_proto(model, proto, _get_field_mappings(model.__class__, proto_cls.DESCRIPTOR))  # type: ignore
+    return proto.SerializeToString()
+
+
+@export("fastkafka.encoder")
+def protobuf_decoder(
+    raw_msg: bytes,
+    cls: Union[ModelMetaclass, Type["Message"]],
+    validate: bool = True,
+) -> Any:
+    """
+    Decoder to decode protobuf bytes to a pydantic model or protobuf message instance
+
+    Args:
+        raw_msg: Protobuf bytes message received from Kafka topic
+        cls: Pydantic class with `protobuf_message` set in its Config, or a protobuf message class
+        validate: If False, the pydantic instance is built without validating the message, use
+            only for messages of trusted producers, default: True
+
+    Returns:
+        An instance of given class
+    """
+    if (
+        _message_cls is not None
+        and isinstance(cls, type)
+        and issubclass(cls, _message_cls)
+    ):
+        return cast(Type["Message"], cls).FromString(raw_msg)
+    model_cls = cast(ModelMetaclass, cls)
+    proto_cls = _get_protobuf_message(model_cls)
+    proto = proto_cls.FromString(raw_msg)
+    values = _from_proto(proto, _get_field_mappings(model_cls, proto_cls.DESCRIPTOR))  # type: ignore
+    return model_cls(**values) if validate else construct_model(model_cls, values)
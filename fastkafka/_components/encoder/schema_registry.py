@@ -0,0 +1,336 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/031_Schema_Registry.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'SchemaRegistryClient', 'InMemorySchemaRegistry', 'FileSchemaRegistry', 'HttpSchemaRegistry',
+           'SchemaRegistryCodec']
+
+# %% ../../../nbs/031_Schema_Registry.ipynb 1
+import asyncio
+import concurrent.futures
+import io
+import json
+import os
+import struct
+from pathlib import Path
+from time import monotonic
+from typing import *
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+from weakref import WeakKeyDictionary
+
+import fastavro
+from pydantic import BaseModel
+from pydantic.main import ModelMetaclass
+
+from .avro import AvroBase, _get_parsed_schema
+from .trusted import construct_model
+from ..logger import get_logger
+from ..meta import export
+
+# %% ../../../nbs/031_Schema_Registry.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../../nbs/031_Schema_Registry.ipynb 6
+@export("fastkafka.encoder")
+class SchemaRegistryClient:
+    """Base class of clients of a registry storing Avro schemas under numeric ids"""
+
+    def get_schema(self, schema_id: int) -> Optional[Dict[str, Any]]:
+        """Returns the schema with the id, or None if there is no such schema in the registry"""
+        raise NotImplementedError
+
+    def register_schema(self, subject: str, schema: Dict[str, Any]) -> int:
+        """Registers the schema under the subject and returns its id, registering an already registered schema returns its id"""
+        raise NotImplementedError
+
+
+@export("fastkafka.encoder")
+class InMemorySchemaRegistry(SchemaRegistryClient):
+    """Schema registry kept in memory, useful as a stand-in for a real registry in tests"""
+
+    def __init__(self) -> None:
+        self.schemas: Dict[int, Dict[str, Any]] = {}
+        self.subjects: Dict[str, List[int]] = {}
+
+    def get_schema(self, schema_id: int) -> Optional[Dict[str, Any]]:
+        return self.schemas.get(schema_id)
+
+    def register_schema(self, subject: str, schema: Dict[str, Any]) -> int:
+        canonical = json.dumps(schema, sort_keys=True)
+        schema_id = next(
+            (
+                i
+                for i, s in self.schemas.items()
+                if json.dumps(s, sort_keys=True) == canonical
+            ),
+            None,
+        )
+        if schema_id is None:
+            schema_id = len(self.schemas) + 1
+            self.schemas[schema_id] = json.loads(canonical)
+        versions = self.subjects.setdefault(subject, [])
+        if schema_id not in versions:
+            versions.append(schema_id)
+        return schema_id
+
+
+@export("fastkafka.encoder")
+class FileSchemaRegistry(InMemorySchemaRegistry):
+    """Schema registry stored in a local JSON file, loaded when created and saved after a schema is registered"""
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Params:
+            path: path of the JSON file, it is created when the first schema is registered
+        """
+        super().__init__()
+        self.path = Path(path)
+        if self.path.exists():
+            content = json.loads(self.path.read_text())
+            self.schemas = {int(i): s for i, s in content["schemas"].items()}
+            self.subjects = content["subjects"]
+
+    def register_schema(self, subject: str, schema: Dict[str, Any]) -> int:
+        schema_id = super().register_schema(subject, schema)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"schemas": self.schemas, "subjects": self.subjects}, indent=2)
+        )
+        os.replace(tmp_path, self.path)
+        return schema_id
+
+
+@export("fastkafka.encoder")
+class HttpSchemaRegistry(SchemaRegistryClient):
+    """Client of the REST API of Confluent Schema Registry, requests block the calling thread"""
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+    ):
+        """
+        Params:
+            url: URL of the schema registry, e.g. "http://localhost:8081"
+            headers: additional headers of the requests, e.g. for authorization
+            timeout: timeout of the requests in seconds
+        """
+        self.url = url.rstrip("/")
+        self.headers = headers or {}
+        self.timeout = timeout
+
+    def _request(self, method: str, path: str, body: Optional[Any] = None) -> Any:
+        request = Request(  # nosec
+            self.url + path,
+            data=None if body is None else json.dumps(body).encode("utf-8"),
+            method=method,
+            headers={
+                "Content-Type": "application/vnd.schemaregistry.v1+json",
+                **self.headers,
+            },
+        )
+        with urlopen(request, timeout=self.timeout) as response:  # nosec
+            return json.loads(response.read())
+
+    def get_schema(self, schema_id: int) -> Optional[Dict[str, Any]]:
+        try:
+            response = self._request("GET", f"/schemas/ids/{schema_id}")
+        except HTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return json.loads(response["schema"])  # type: ignore
+
+    def register_schema(self, subject: str, schema: Dict[str, Any]) -> int:
+        response = self._request(
+            "POST",
+            f"/subjects/{quote(subject, safe='')}/versions",
+            {"schema": json.dumps(schema)},
+        )
+        return response["id"]  # type: ignore
+
+# %% ../../../nbs/031_Schema_Registry.ipynb 11
+_MAGIC_BYTE = 0
+_HEADER = struct.Struct(">bI")
+
+
+@export("fastkafka.encoder")
+class SchemaRegistryCodec:
+    """
+    Encoder and decoder of messages in the wire format of Confluent Schema Registry.
+
+    The Avro schema of a pydantic class is registered once when the first message of the class is encoded.
+    Messages are decoded using the writer schema they were encoded with, resolved to the schema of the
+    pydantic class, so fields added or removed by the producer are handled according to the Avro schema
+    resolution rules. Records are matched by name, so the name of the pydantic class must be the same as
+    the name of the record in the writer schema.
+
+    Writer schemas are cached for ttl seconds, and ids of schemas not found in the registry are cached for
+    negative_ttl seconds, so messages with an unknown schema id do not flood the registry with requests.
+    Expired writer schemas are fetched again in a background thread and used until then.
+    Use `encoder=codec.encode` with `produces()` and `decoder=codec.decode` with `consumes()`.
+
+    Requests to the registry block the event loop calling the encoder or decoder, so registering a schema
+    or fetching a writer schema for the first time stalls the application. Use `prepare` when the application
+    starts to make these requests in a thread ahead of time.
+    """
+
+    def __init__(
+        self,
+        client: SchemaRegistryClient,
+        *,
+        subject: Optional[Union[str, Callable[[Dict[str, Any]], str]]] = None,
+        ttl: float = 300.0,
+        negative_ttl: float = 10.0,
+    ):
+        """
+        Params:
+            client: client of the schema registry
+            subject: subject the schemas are registered under, or a function returning it for an Avro schema,
+                default: None - the full name of the record, as with the RecordNameStrategy. Use e.g.
+                "<topic>-value" for the default TopicNameStrategy of the Java clients.
+            ttl: time in seconds writer schemas are cached for
+            negative_ttl: time in seconds ids of schemas not found in the registry are cached for
+        """
+        self.client = client
+        self.subject = subject
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # parsed writer schemas, or None if not found, with their expiry time per schema id
+        self._writer_schemas: Dict[int, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        self._schema_ids: "WeakKeyDictionary[ModelMetaclass, int]" = WeakKeyDictionary()
+        # ids of expired writer schemas being fetched again, created lazily
+        self._refreshing: Set[int] = set()
+        self._refresh_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def _get_subject(self, schema: Dict[str, Any]) -> str:
+        if self.subject is None:
+            return f"{schema['namespace']}.{schema['name']}"
+        if isinstance(self.subject, str):
+            return self.subject
+        return self.subject(schema)
+
+    def _get_schema_id(self, cls: ModelMetaclass) -> int:
+        try:
+            return self._schema_ids[cls]
+        except KeyError:
+            schema = AvroBase.avro_schema_for_pydantic(cls)
+            schema_id = self.client.register_schema(self._get_subject(schema), schema)
+            self._schema_ids[cls] = schema_id
+            return schema_id
+
+    def _fetch_writer_schema(
+        self, schema_id: int
+    ) -> Tuple[float, Optional[Dict[str, Any]]]:
+        schema = self.client.get_schema(schema_id)
+        now = monotonic()
+        cached: Tuple[float, Optional[Dict[str, Any]]]
+        if schema is None:
+            cached = (now + self.negative_ttl, None)
+        else:
+            parsed = cast(Dict[str, Any], fastavro.schema.parse_schema(schema))
+            cached = (now + self.ttl, parsed)
+        self._writer_schemas[schema_id] = cached
+        return cached
+
+    def _refresh_writer_schema(self, schema_id: int) -> None:
+        def _on_done(fut: concurrent.futures.Future) -> None:
+            self._refreshing.discard(schema_id)
+            if fut.exception() is not None:
+                logger.warning(
+                    f"SchemaRegistryCodec: Fetching the schema with id {schema_id} failed: {fut.exception()!r}"
+                )
+
+        if self._refresh_executor is None:
+            self._refresh_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="fastkafka-schema-registry"
+            )
+        self._refreshing.add(schema_id)
+        self._refresh_executor.submit(
+            self._fetch_writer_schema, schema_id
+        ).add_done_callback(_on_done)
+
+    def _get_writer_schema(self, schema_id: int) -> Dict[str, Any]:
+        cached = self._writer_schemas.get(schema_id)
+        if cached is None or (cached[1] is None and cached[0] <= monotonic()):
+            # there is no schema to decode the message with until the request completes
+            cached = self._fetch_writer_schema(schema_id)
+        elif cached[0] <= monotonic() and schema_id not in self._refreshing:
+            self._refresh_writer_schema(schema_id)
+        if cached[1] is None:
+            raise ValueError(f"Schema with id {schema_id} not found in the registry")
+        return cached[1]
+
+    async def prepare(
+        self, *classes: ModelMetaclass, schema_ids: Iterable[int] = ()
+    ) -> None:
+        """
+        Registers the schemas of the classes and fetches the writer schemas with the ids in a thread,
+        so encoding and decoding messages with them doesn't block the event loop
+
+        Params:
+            classes: pydantic classes of the messages encoded by the codec
+            schema_ids: ids of the writer schemas of the messages decoded by the codec
+
+        Raises:
+            ValueError: if a schema with one of the ids is not found in the registry
+        """
+        loop = asyncio.get_running_loop()
+        for cls in classes:
+            await loop.run_in_executor(None, self._get_schema_id, cls)
+        for schema_id in schema_ids:
+            await loop.run_in_executor(None, self._get_writer_schema, schema_id)
+
+    def encode(self, msg: BaseModel) -> bytes:
+        """
+        Encodes the pydantic instance in the wire format
+
+        Args:
+            msg: An instance of pydantic basemodel
+
+        Returns:
+            The magic byte and the schema id followed by the Avro encoded message
+        """
+        schema_id = self._get_schema_id(msg.__class__)
+        bytes_writer = io.BytesIO()
+        bytes_writer.write(_HEADER.pack(_MAGIC_BYTE, schema_id))
+        fastavro.schemaless_writer(
+            bytes_writer, _get_parsed_schema(msg.__class__), msg.dict()
+        )
+        return bytes_writer.getvalue()
+
+    def decode(self, raw_msg: bytes, cls: ModelMetaclass, validate: bool = True) -> Any:
+        """
+        Decodes a message in the wire format to an instance of the pydantic class
+
+        Args:
+            raw_msg: Bytes message received from Kafka topic
+            cls: Pydantic class; This pydantic class will be used to construct instance of same class
+            validate: If False, the instance is built without validating the message, use only
+                for messages of trusted producers, default: True
+
+        Returns:
+            An instance of given pydantic class
+
+        Raises:
+            ValueError: if the message is not in the wire format or its schema is not found in the registry
+        """
+        if len(raw_msg) < _HEADER.size or raw_msg[0] != _MAGIC_BYTE:
+            raise ValueError(
+                "Message is not in the wire format of Confluent Schema Registry"
+            )
+        _, schema_id = _HEADER.unpack_from(raw_msg)
+        bytes_reader = io.BytesIO(raw_msg)
+        bytes_reader.seek(_HEADER.size)
+        msg_dict = cast(
+            Dict[str, Any],
+            fastavro.schemaless_reader(
+                bytes_reader,
+                self._get_writer_schema(schema_id),
+                _get_parsed_schema(cls),
+            ),
+        )
+        return cls(**msg_dict) if validate else construct_model(cls, msg_dict)
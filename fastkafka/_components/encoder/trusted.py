@@ -0,0 +1,156 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/035_Trusted_Decoding.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'ModelBuilder', 'construct_model', 'get_trusted_decoder']
+
+# %% ../../../nbs/035_Trusted_Decoding.ipynb 1
+import inspect
+from itertools import count
+from typing import *
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import SHAPE_DICT, SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.main import ModelMetaclass
+from pydantic.utils import lenient_issubclass
+
+from ..logger import get_logger
+
+# %% ../../../nbs/035_Trusted_Decoding.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../../nbs/035_Trusted_Decoding.ipynb 6
+_AS_IS, _MODEL, _MODEL_LIST, _VALIDATE = range(4)
+
+_native_types = {str, int, float, bool, Any}
+
+ModelBuilder = Callable[[Dict[str, Any]], BaseModel]
+
+_model_builders: "WeakKeyDictionary[ModelMetaclass, ModelBuilder]" = WeakKeyDictionary()
+
+
+def _get_field_kind(f: ModelField) -> int:
+    if f.type_ in _native_types and (
+        f.shape in (SHAPE_SINGLETON, SHAPE_LIST)
+        or (f.shape == SHAPE_DICT and f.key_field.type_ is str)  # type: ignore
+    ):
+        return _AS_IS
+    if lenient_issubclass(f.type_, BaseModel):
+        if f.shape == SHAPE_SINGLETON:
+            return _MODEL
+        if f.shape == SHAPE_LIST:
+            return _MODEL_LIST
+    return _VALIDATE
+
+
+def _get_model_builder(cls: ModelMetaclass) -> ModelBuilder:
+    """
+    Returns the function building instances of the class from dicts without validating them
+
+    Params:
+        cls: Pydantic class
+
+    Returns:
+        Function building instances of the class, the functions are created once per class
+    """
+    try:
+        return _model_builders[cls]
+    except KeyError:
+        pass
+
+    fields: List[Tuple[str, str, int, ModelField, Optional[ModelBuilder]]] = []
+
+    def validate_field(f: ModelField, value: Any) -> Any:
+        value, errors = f.validate(value, {}, loc=f.alias, cls=cls)  # type: ignore
+        if errors:
+            raise ValidationError([errors], cls)  # type: ignore
+        return value
+
+    def build(values: Dict[str, Any]) -> BaseModel:
+        fields_values: Dict[str, Any] = {}
+        for name, alias, kind, f, nested_builder in fields:
+            if alias in values:
+                value = values[alias]
+            elif name in values:
+                value = values[name]
+            else:
+                continue
+            if value is None or kind == _AS_IS:
+                pass
+            elif kind == _MODEL and isinstance(value, dict):
+                value = nested_builder(value)  # type: ignore
+            elif kind == _MODEL_LIST and isinstance(value, list):
+                value = [
+                    nested_builder(v)  # type: ignore
+                    if isinstance(v, dict)
+                    else validate_field(f, [v])[0]
+                    for v in value
+                ]
+            else:
+                value = validate_field(f, value)
+            fields_values[name] = value
+        return cls.construct(**fields_values)  # type: ignore
+
+    # registered before mapping the fields, so recursive models get the same builder
+    _model_builders[cls] = build
+    for name, f in cls.__fields__.items():  # type: ignore
+        kind = _get_field_kind(f)
+        nested_builder = (
+            _get_model_builder(f.type_) if kind in (_MODEL, _MODEL_LIST) else None
+        )
+        fields.append((name, f.alias, kind, f, nested_builder))
+    return build
+
+
+def construct_model(cls: ModelMetaclass, values: Dict[str, Any]) -> Any:
+    """
+    Builds an instance of the pydantic class without validating the values of strings,
+    numbers, booleans and nested models
+
+    Args:
+        cls: Pydantic class
+        values: Values of the fields of the instance
+
+    Returns:
+        An instance of given pydantic class
+    """
+    return _get_model_builder(cls)(values)
+
+# %% ../../../nbs/035_Trusted_Decoding.ipynb 11
+def get_trusted_decoder(
+    decoder_fn: Callable[..., Any], validate_every: Optional[int] = None
+) -> Callable[[bytes, ModelMetaclass], Any]:
+    """
+    Returns a decoder which decodes messages without validating them
+
+    Args:
+        decoder_fn: Decoder accepting the `validate` keyword argument
+        validate_every: If set, every `validate_every`-th message is validated, starting with the first one
+
+    Returns:
+        The decoder
+
+    Raises:
+        ValueError: if the decoder does not accept the `validate` argument or validate_every is not positive
+    """
+    if "validate" not in inspect.signature(decoder_fn).parameters:
+        raise ValueError(
+            f"Decoder {decoder_fn.__name__}() cannot decode messages without validation, it must accept the 'validate' keyword argument"
+        )
+    if validate_every is not None and validate_every < 1:
+        raise ValueError(f"validate_every must be positive, got {validate_every}")
+
+    counter = count()
+
+    def trusted_decoder(raw_msg: bytes, cls: ModelMetaclass) -> Any:
+        if validate_every is not None and next(counter) % validate_every == 0:
+            try:
+                return decoder_fn(raw_msg, cls)
+            except ValidationError as e:
+                logger.warning(
+                    f"trusted_decoder(): Validation of a sampled {cls.__name__} message failed, its producers might not be trusted anymore: {e}"
+                )
+                raise
+        return decoder_fn(raw_msg, cls, validate=False)
+
+    return trusted_decoder
@@ -0,0 +1,193 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/030_Envelope.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'ENVELOPE_HEADER', 'SendEnvelope', 'pack_envelope', 'unpack_envelope', 'is_envelope', 'Envelope',
+           'EnvelopeBatcher']
+
+# %% ../../nbs/030_Envelope.ipynb 1
+import asyncio
+import struct
+from dataclasses import dataclass
+from typing import *
+
+from .logger import get_logger
+from .meta import export
+
+# %% ../../nbs/030_Envelope.ipynb 3
+logger = get_logger(__name__)
+
+# %% ../../nbs/030_Envelope.ipynb 6
+ENVELOPE_HEADER = "fastkafka_envelope"
+
+_LENGTH = struct.Struct(">I")
+
+
+def pack_envelope(values: List[bytes]) -> bytes:
+    """Packs encoded messages into the value of a single record"""
+    return b"".join(_LENGTH.pack(len(value)) + value for value in values)
+
+
+def unpack_envelope(value: bytes) -> List[bytes]:
+    """
+    Unpacks encoded messages from the value of a record packed by pack_envelope.
+
+    Params:
+        value: value of the record
+
+    Returns:
+        Encoded messages in the order they were packed
+
+    Raises:
+        ValueError: if the value is not a valid envelope
+    """
+    values = []
+    offset = 0
+    while offset < len(value):
+        if offset + _LENGTH.size > len(value):
+            raise ValueError(f"Truncated envelope, length missing at byte {offset}")
+        (length,) = _LENGTH.unpack_from(value, offset)
+        offset = offset + _LENGTH.size
+        if offset + length > len(value):
+            raise ValueError(
+                f"Truncated envelope, message of {length} bytes at byte {offset} exceeds its size of {len(value)} bytes"
+            )
+        values.append(value[offset : offset + length])
+        offset = offset + length
+    return values
+
+
+def is_envelope(headers: Optional[Sequence[Tuple[str, bytes]]]) -> bool:
+    """Returns True if the headers of a record mark it as an envelope"""
+    return any(key == ENVELOPE_HEADER for key, _ in headers or [])
+
+# %% ../../nbs/030_Envelope.ipynb 9
+@dataclass
+@export("fastkafka")
+class Envelope:
+    """
+    Settings for packing small messages sent to a topic into envelopes, so the per-record overhead of Kafka
+    is paid once for many messages.
+
+    Messages are collected per key and their envelope is sent when it holds max_messages messages, when
+    their size reaches max_bytes, or linger_ms after the first message was added to it, whichever comes
+    first. Consumers must be created with `envelope=True` to unpack the envelopes.
+
+    Attributes:
+        max_messages (int): Maximum number of messages in an envelope.
+        max_bytes (int): Size of encoded messages in bytes at which the envelope is sent, it must be well
+            below the max_request_size of the producer and the max.message.bytes of the topic.
+        linger_ms (float): Maximum time in milliseconds a message waits for the envelope to fill.
+    """
+
+    max_messages: int = 1_000
+    max_bytes: int = 64 * 1024
+    linger_ms: float = 5.0
+
+    def __post_init__(self) -> None:
+        if self.max_messages < 1:
+            raise ValueError(f"max_messages must be positive, got {self.max_messages}")
+        if self.max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, got {self.max_bytes}")
+        if self.linger_ms < 0:
+            raise ValueError(f"linger_ms must not be negative, got {self.linger_ms}")
+
+# %% ../../nbs/030_Envelope.ipynb 11
+SendEnvelope = Callable[[Optional[bytes], bytes, int], Awaitable[Any]]
+
+
+class EnvelopeBatcher:
+    """
+    Collects encoded messages of a topic per key and sends them packed in envelopes.
+
+    Envelopes are sent one at a time in the order they were filled, so the order of messages with the
+    same key is kept.
+    """
+
+    def __init__(self, envelope: Envelope):
+        """
+        Params:
+            envelope: settings of the envelopes
+        """
+        self.envelope = envelope
+        self.envelope_count = 0
+        self.message_count = 0
+        self._buffers: Dict[Optional[bytes], List[bytes]] = {}
+        self._sizes: Dict[Optional[bytes], int] = {}
+        self._timers: Dict[Optional[bytes], asyncio.TimerHandle] = {}
+        self._send_fs: Dict[Optional[bytes], SendEnvelope] = {}
+        self._linger_tasks: Set[asyncio.Task] = set()
+        # created in the running loop, locks created outside of it can be bound to another loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def pending_count(self) -> int:
+        return sum(len(values) for values in self._buffers.values())
+
+    async def add(
+        self, key: Optional[bytes], value: bytes, send_f: SendEnvelope
+    ) -> None:
+        """
+        Adds the encoded message to the envelope for its key and sends the envelope if it is full.
+
+        Params:
+            key: key of the message, the envelope is sent with it
+            value: encoded message
+            send_f: function sending the key, the packed envelope and the number of messages in it
+        """
+        values = self._buffers.setdefault(key, [])
+        values.append(value)
+        self._sizes[key] = self._sizes.get(key, 0) + len(value)
+        self._send_fs[key] = send_f
+        if (
+            len(values) >= self.envelope.max_messages
+            or self._sizes[key] >= self.envelope.max_bytes
+        ):
+            await self.send_pending(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self.envelope.linger_ms / 1000, self._on_linger, key
+            )
+
+    def _on_linger(self, key: Optional[bytes]) -> None:
+        task = asyncio.create_task(self.send_pending(key))
+        self._linger_tasks.add(task)
+        task.add_done_callback(self._on_linger_done)
+
+    def _on_linger_done(self, task: asyncio.Task) -> None:
+        self._linger_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Failed to send envelope: {task.exception()!r}")
+
+    async def send_pending(self, key: Optional[bytes]) -> None:
+        """Sends the envelope with messages for the key if there are any"""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        values = self._buffers.pop(key, [])
+        self._sizes.pop(key, None)
+        send_f = self._send_fs.pop(key, None)
+        if not values:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        # the lock is fair, so envelopes are sent in the order they were taken from the buffers
+        async with self._lock:
+            await send_f(key, pack_envelope(values), len(values))  # type: ignore
+        self.envelope_count = self.envelope_count + 1
+        self.message_count = self.message_count + len(values)
+
+    async def flush(self) -> None:
+        """Sends all pending envelopes and waits for the ones being sent after their linger time"""
+        await asyncio.gather(*[self.send_pending(key) for key in list(self._buffers)])
+        await asyncio.gather(*self._linger_tasks, return_exceptions=True)
+
+    def reset(self) -> None:
+        """Drops the lock, called after the batcher is flushed at shutdown so it can be used in another event loop"""
+        self._lock = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "pending": self.pending_count,
+            "envelopes": self.envelope_count,
+            "messages": self.message_count,
+        }
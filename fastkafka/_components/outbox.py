@@ -0,0 +1,472 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/026_Outbox.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'OutboxRecord', 'Outbox']
+
+# %% ../../nbs/026_Outbox.ipynb 1
+import asyncio
+import os
+import struct
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from mmap import mmap
+from pathlib import Path
+from time import time
+from typing import *
+
+from aiokafka import AIOKafkaProducer
+
+from .logger import get_logger
+from .meta import export
+
+# %% ../../nbs/026_Outbox.ipynb 5
+logger = get_logger(__name__)
+
+# %% ../../nbs/026_Outbox.ipynb 8
+@dataclass
+class OutboxRecord:
+    topic: str
+    value: bytes
+    key: Optional[bytes] = None
+    headers: List[Tuple[str, bytes]] = field(default_factory=list)
+    timestamp_ms: Optional[int] = None
+
+
+# payload size, CRC32 of the payload
+_FRAME_HEADER = struct.Struct("<II")
+# topic size, key size (-1 for None), value size, number of headers, timestamp
+_RECORD_HEADER = struct.Struct("<HiIHq")
+# name size, value size
+_RECORD_HEADER_ENTRY = struct.Struct("<HI")
+
+
+def _encode_record(record: OutboxRecord) -> bytes:
+    topic = record.topic.encode("utf-8")
+    parts = [
+        _RECORD_HEADER.pack(
+            len(topic),
+            -1 if record.key is None else len(record.key),
+            len(record.value),
+            len(record.headers),
+            -1 if record.timestamp_ms is None else record.timestamp_ms,
+        ),
+        topic,
+        record.key or b"",
+        record.value,
+    ]
+    for name, value in record.headers:
+        encoded_name = name.encode("utf-8")
+        parts += [
+            _RECORD_HEADER_ENTRY.pack(len(encoded_name), len(value)),
+            encoded_name,
+            value,
+        ]
+    return b"".join(parts)
+
+
+def _decode_record(payload: bytes) -> OutboxRecord:
+    (
+        topic_size,
+        key_size,
+        value_size,
+        headers_count,
+        timestamp_ms,
+    ) = _RECORD_HEADER.unpack_from(payload)
+    position = _RECORD_HEADER.size
+    topic = payload[position : position + topic_size].decode("utf-8")
+    position += topic_size
+    key = None if key_size < 0 else payload[position : position + key_size]
+    position += max(key_size, 0)
+    value = payload[position : position + value_size]
+    position += value_size
+    headers = []
+    for _ in range(headers_count):
+        name_size, header_value_size = _RECORD_HEADER_ENTRY.unpack_from(
+            payload, position
+        )
+        position += _RECORD_HEADER_ENTRY.size
+        name = payload[position : position + name_size].decode("utf-8")
+        position += name_size
+        headers.append((name, payload[position : position + header_value_size]))
+        position += header_value_size
+    return OutboxRecord(
+        topic=topic,
+        value=value,
+        key=key,
+        headers=headers,
+        timestamp_ms=None if timestamp_ms < 0 else timestamp_ms,
+    )
+
+# %% ../../nbs/026_Outbox.ipynb 11
+class _Segment:
+    def __init__(self, path: Path, size: int):
+        self.path = path
+        with open(path, "a+b") as f:
+            if os.fstat(f.fileno()).st_size < size:
+                f.truncate(size)
+            self.size = os.fstat(f.fileno()).st_size
+            self._mmap = mmap(f.fileno(), self.size)
+
+    def read_frame(self, position: int) -> Optional[Tuple[bytes, int]]:
+        """Returns the payload of the frame at the position and the position of the next frame"""
+        if position + _FRAME_HEADER.size > self.size:
+            return None
+        payload_size, crc = _FRAME_HEADER.unpack_from(self._mmap, position)
+        start = position + _FRAME_HEADER.size
+        if payload_size == 0 or start + payload_size > self.size:
+            return None
+        payload = self._mmap[start : start + payload_size]
+        if zlib.crc32(payload) != crc:
+            return None
+        return payload, start + payload_size
+
+    def fits(self, position: int, payload: bytes) -> bool:
+        return position + _FRAME_HEADER.size + len(payload) <= self.size
+
+    def write_frame(self, position: int, payload: bytes) -> int:
+        start = position + _FRAME_HEADER.size
+        self._mmap[start : start + len(payload)] = payload
+        _FRAME_HEADER.pack_into(self._mmap, position, len(payload), zlib.crc32(payload))
+        return start + len(payload)
+
+    def truncate(self, position: int) -> None:
+        """Marks the end of the log at the position, dropping any partially written frame"""
+        if position + _FRAME_HEADER.size <= self.size:
+            _FRAME_HEADER.pack_into(self._mmap, position, 0, 0)
+
+    def flush(self) -> None:
+        self._mmap.flush()
+
+    def close(self) -> None:
+        self._mmap.close()
+
+# %% ../../nbs/026_Outbox.ipynb 14
+@export("fastkafka")
+class Outbox:
+    """
+    A durable spool on local disk for messages which cannot be sent to the broker right away.
+
+    Producers using an outbox write messages to it when sending fails, when the limit of
+    in-flight messages is reached or while messages spooled earlier are still waiting to
+    be sent. The application drains the outbox in the background, sending the spooled
+    messages in order once the broker is reachable again. Messages are delivered at
+    least once, a part of the messages might be sent twice if draining is interrupted.
+
+    The messages are stored in an append-only log of memory-mapped segment files in
+    the given directory. Fully drained segments are deleted and the disk usage is bounded
+    by max_bytes, appending to a full outbox raises RuntimeError. Producers and draining
+    write to the segments in a thread of the outbox, so disk I/O does not block the event loop.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        segment_bytes: int = 16 * 1024 * 1024,
+        max_bytes: int = 1024 * 1024 * 1024,
+        drain_batch_size: int = 1_000,
+        retry_interval: float = 1.0,
+        fsync: bool = False,
+    ):
+        """
+        Params:
+            path: directory of the segment files, created if it does not exist
+            segment_bytes: size of a segment file
+            max_bytes: maximum total size of the segment files
+            drain_batch_size: maximum number of messages sent at once while draining
+            retry_interval: time in seconds to wait before retrying to send messages
+                after sending failed while draining
+            fsync: if True, segments are flushed to disk after each write, so spooled
+                messages survive crashes of the operating system at the cost of throughput
+        """
+        if segment_bytes <= _FRAME_HEADER.size:
+            raise ValueError(
+                f"segment_bytes must be larger than {_FRAME_HEADER.size}, got {segment_bytes}"
+            )
+        if max_bytes < segment_bytes:
+            raise ValueError(
+                f"max_bytes must not be smaller than segment_bytes, got {max_bytes} < {segment_bytes}"
+            )
+        self.path = Path(path)
+        self.segment_bytes = segment_bytes
+        self.max_bytes = max_bytes
+        self.drain_batch_size = drain_batch_size
+        self.retry_interval = retry_interval
+        self.fsync = fsync
+
+        self.spooled_count = 0
+        self.drained_count = 0
+        self.rejected_count = 0
+
+        # producers of sync functions write from their own thread
+        self._lock = threading.Lock()
+        # segments are opened lazily, on the first use after creating or closing the outbox
+        self._segments: Optional[Dict[int, _Segment]] = None
+        self._read_position = (0, 0)
+        self._write_position = (0, 0)
+        self._pending_count = 0
+        self._pending_bytes = 0
+        # number of messages passed to spool() which are not written yet
+        self._queued_count = 0
+        # single thread, so messages are written in the order they are spooled
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # loop and event of the running drain(), the event is set when messages are appended
+        self._wakeup: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="outbox"
+            )
+        return self._executor
+
+    def _segment_path(self, segment_id: int) -> Path:
+        return self.path / f"{segment_id:020d}.log"
+
+    def _position_path(self) -> Path:
+        return self.path / "position"
+
+    def _open(self) -> Dict[int, _Segment]:
+        if self._segments is not None:
+            return self._segments
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        segment_ids = sorted(int(p.stem) for p in self.path.glob("*.log"))
+        if self._position_path().exists():
+            segment_id, position = map(int, self._position_path().read_text().split())
+        else:
+            segment_id, position = (segment_ids[0] if segment_ids else 0), 0
+
+        for drained_id in [i for i in segment_ids if i < segment_id]:
+            self._segment_path(drained_id).unlink()
+        self._segments = {
+            i: _Segment(self._segment_path(i), self.segment_bytes)
+            for i in segment_ids
+            if i >= segment_id
+        }
+        if segment_id not in self._segments:
+            self._segments[segment_id] = _Segment(
+                self._segment_path(segment_id), self.segment_bytes
+            )
+
+        self._read_position = (segment_id, position)
+        self._pending_count, self._pending_bytes = 0, 0
+        for i in sorted(self._segments):
+            position = position if i == segment_id else 0
+            while (frame := self._segments[i].read_frame(position)) is not None:
+                payload, position = frame
+                self._pending_count += 1
+                self._pending_bytes += len(payload)
+        last_id = max(self._segments)
+        self._segments[last_id].truncate(position)
+        self._write_position = (last_id, position)
+
+        if self._pending_count > 0:
+            logger.info(
+                f"Outbox._open(): Found {self._pending_count} spooled messages in '{self.path}'"
+            )
+        return self._segments
+
+    @property
+    def pending_count(self) -> int:
+        """Number of spooled messages waiting to be sent, including the messages being written"""
+        if self._segments is None:
+            with self._lock:
+                self._open()
+        return self._pending_count + self._queued_count
+
+    def append(self, record: OutboxRecord) -> None:
+        """
+        Spools a message, blocking until it is written.
+
+        Params:
+            record: the message to spool
+
+        Raises:
+            RuntimeError: if the outbox is full
+        """
+        if record.timestamp_ms is None:
+            record.timestamp_ms = int(time() * 1000)
+        payload = _encode_record(record)
+        with self._lock:
+            segments = self._open()
+            segment_id, position = self._write_position
+            segment = segments[segment_id]
+            if not segment.fits(position, payload):
+                size = max(self.segment_bytes, _FRAME_HEADER.size + len(payload))
+                if sum(s.size for s in segments.values()) + size > self.max_bytes:
+                    self.rejected_count += 1
+                    raise RuntimeError(
+                        f"Outbox '{self.path}' is full, {self._pending_count} messages are waiting to be sent"
+                    )
+                segment_id, position = segment_id + 1, 0
+                segment = _Segment(self._segment_path(segment_id), size)
+                segments[segment_id] = segment
+            position = segment.write_frame(position, payload)
+            if self.fsync:
+                segment.flush()
+            self._write_position = (segment_id, position)
+            self._pending_count += 1
+            self._pending_bytes += len(payload)
+            self.spooled_count += 1
+        self._notify()
+
+    def _notify(self) -> None:
+        """Wakes up drain() waiting for messages to be appended"""
+        if self._wakeup is not None:
+            loop, event = self._wakeup
+            loop.call_soon_threadsafe(event.set)
+
+    def spool(self, records: List[OutboxRecord]) -> "asyncio.Future[None]":
+        """
+        Spools messages without blocking the event loop, the messages are written in the thread of the outbox.
+
+        The messages are counted as pending right away and written in the order of the calls.
+
+        Params:
+            records: the messages to spool
+
+        Returns:
+            Future done once the messages are written, it raises RuntimeError if the outbox is full
+        """
+        with self._lock:
+            self._queued_count += len(records)
+        return asyncio.get_running_loop().run_in_executor(
+            self._get_executor(), self._append_queued, records
+        )
+
+    def _append_queued(self, records: List[OutboxRecord]) -> None:
+        try:
+            for record in records:
+                self.append(record)
+        finally:
+            with self._lock:
+                self._queued_count -= len(records)
+
+    def _peek(
+        self, max_records: int
+    ) -> Tuple[List[OutboxRecord], Tuple[int, int], int]:
+        """Returns the oldest spooled messages, the position after them and their size"""
+        with self._lock:
+            segments = self._open()
+            segment_id, position = self._read_position
+            records: List[OutboxRecord] = []
+            size = 0
+            while len(records) < max_records:
+                frame = segments[segment_id].read_frame(position)
+                if frame is None:
+                    if segment_id == self._write_position[0]:
+                        break
+                    segment_id, position = segment_id + 1, 0
+                    continue
+                payload, position = frame
+                records.append(_decode_record(payload))
+                size += len(payload)
+            return records, (segment_id, position), size
+
+    def _commit(self, position: Tuple[int, int], count: int, size: int) -> None:
+        """Marks the messages before the position as sent, deleting the drained segments"""
+        with self._lock:
+            segments = self._open()
+            for segment_id in [i for i in segments if i < position[0]]:
+                segments.pop(segment_id).close()
+                self._segment_path(segment_id).unlink()
+            self._read_position = position
+            tmp_path = self._position_path().with_suffix(".tmp")
+            tmp_path.write_text(f"{position[0]} {position[1]}")
+            os.replace(tmp_path, self._position_path())
+            self._pending_count -= count
+            self._pending_bytes -= size
+            self.drained_count += count
+
+    async def drain(
+        self, send_f: Callable[[List[OutboxRecord]], Awaitable[None]]
+    ) -> None:
+        """
+        Sends the spooled messages in order until cancelled, waiting for new messages while the outbox is empty.
+
+        Params:
+            send_f: coroutine function sending the messages and waiting for their delivery,
+                the messages are sent again after retry_interval if it raises an exception
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        self._wakeup = (loop, event)
+        is_failing = False
+        try:
+            while True:
+                # cleared before peeking, so messages appended meanwhile are not missed
+                event.clear()
+                records, position, size = await loop.run_in_executor(
+                    self._get_executor(), self._peek, self.drain_batch_size
+                )
+                if not records:
+                    await event.wait()
+                    continue
+                try:
+                    await send_f(records)
+                except Exception as e:
+                    if not is_failing:
+                        logger.warning(
+                            f"Outbox.drain(): Sending spooled messages failed with '{e!r}', retrying every {self.retry_interval}s"
+                        )
+                    is_failing = True
+                    await asyncio.sleep(self.retry_interval)
+                    continue
+                if is_failing:
+                    logger.info(
+                        f"Outbox.drain(): Sending spooled messages from '{self.path}' resumed"
+                    )
+                    is_failing = False
+                await loop.run_in_executor(
+                    self._get_executor(), self._commit, position, len(records), size
+                )
+        finally:
+            self._wakeup = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Returns the number and size of pending messages, the counts of spooled, drained and rejected messages and the size of the segment files"""
+        with self._lock:
+            disk_bytes = (
+                0
+                if self._segments is None
+                else sum(s.size for s in self._segments.values())
+            )
+            return {
+                "pending": self._pending_count + self._queued_count,
+                "pending_bytes": self._pending_bytes,
+                "spooled": self.spooled_count,
+                "drained": self.drained_count,
+                "rejected": self.rejected_count,
+                "disk_bytes": disk_bytes,
+            }
+
+    def close(self) -> None:
+        """Closes the segment files, waiting for the messages being written, the outbox is opened again when used"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        with self._lock:
+            if self._segments is not None:
+                for segment in self._segments.values():
+                    segment.close()
+                self._segments = None
+
+# %% ../../nbs/026_Outbox.ipynb 18
+async def _send_records(  # type: ignore
+    producer: AIOKafkaProducer, records: List[OutboxRecord]
+) -> None:
+    """Sends the spooled messages using the producer and waits for their delivery"""
+    futs = [
+        await producer.send(
+            record.topic,
+            record.value,
+            key=record.key,
+            headers=record.headers,
+            timestamp_ms=record.timestamp_ms,
+        )
+        for record in records
+    ]
+    await asyncio.gather(*futs)
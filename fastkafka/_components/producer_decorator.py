@@ -1,24 +1,42 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/013_ProducerDecorator.ipynb.
 
 # %% auto 0
-__all__ = ['BaseSubmodel', 'ProduceReturnTypes', 'ProduceCallable', 'KafkaEvent', 'get_loop', 'producer_decorator']
+__all__ = ['logger', 'T', 'BaseSubmodel', 'ProduceReturnTypes', 'ProduceCallable', 'Partitioner', 'KafkaEvent', 'get_loop',
+           'DeliveryTracker', 'EncodeOffloading', 'OrderedEncoder', 'EventLoopThread', 'StickyPartitioner',
+           'get_partitioner', 'producer_decorator']
 
 # %% ../../nbs/013_ProducerDecorator.ipynb 1
 import asyncio
+import concurrent.futures
 import functools
 import json
+import random
+import threading
 from asyncio import iscoroutinefunction  # do not use the version from inspect
 from collections import namedtuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from time import monotonic
 from typing import *
 
 import nest_asyncio
 from aiokafka import AIOKafkaProducer
+from aiokafka.errors import KafkaError
+from aiokafka.structs import RecordMetadata
+from kafka.partitioner.default import DefaultPartitioner
 from pydantic import BaseModel
 
+from .benchmarking import LatencyHistogram
+from .envelope import ENVELOPE_HEADER, EnvelopeBatcher
+from .logger import get_logger
 from .meta import export
+from .outbox import Outbox, OutboxRecord
 
-# %% ../../nbs/013_ProducerDecorator.ipynb 3
+# %% ../../nbs/013_ProducerDecorator.ipynb 2
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# %% ../../nbs/013_ProducerDecorator.ipynb 4
 BaseSubmodel = TypeVar("BaseSubmodel", bound=BaseModel)
 BaseSubmodel
 
@@ -32,23 +50,30 @@ class KafkaEvent(Generic[BaseSubmodel]):
     Attributes:
         message (BaseSubmodel): The message contained in the Kafka event, can be of type pydantic.BaseModel.
         key (bytes, optional): The optional key used to identify the Kafka event.
+        headers (List[Tuple[str, bytes]], optional): The optional record headers sent together with the Kafka event.
     """
 
     message: BaseSubmodel
     key: Optional[bytes] = None
+    headers: Optional[List[Tuple[str, bytes]]] = None
 
-# %% ../../nbs/013_ProducerDecorator.ipynb 5
-ProduceReturnTypes = Union[BaseModel, KafkaEvent[BaseModel]]
+# %% ../../nbs/013_ProducerDecorator.ipynb 6
+ProduceReturnTypes = Union[
+    BaseModel,
+    KafkaEvent[BaseModel],
+    List[BaseModel],
+    List[KafkaEvent[BaseModel]],
+]
 
 ProduceCallable = Union[
     Callable[..., ProduceReturnTypes], Callable[..., Awaitable[ProduceReturnTypes]]
 ]
 
-# %% ../../nbs/013_ProducerDecorator.ipynb 8
+# %% ../../nbs/013_ProducerDecorator.ipynb 9
 def _wrap_in_event(message: Union[BaseModel, KafkaEvent]) -> KafkaEvent:
     return message if type(message) == KafkaEvent else KafkaEvent(message)
 
-# %% ../../nbs/013_ProducerDecorator.ipynb 11
+# %% ../../nbs/013_ProducerDecorator.ipynb 12
 def get_loop() -> asyncio.AbstractEventLoop:
     try:
         loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
@@ -60,34 +85,661 @@ def get_loop() -> asyncio.AbstractEventLoop:
 
     return loop
 
-# %% ../../nbs/013_ProducerDecorator.ipynb 13
+# %% ../../nbs/013_ProducerDecorator.ipynb 14
+class DeliveryTracker:
+    """
+    Keeps track of pending deliveries of messages sent by a producer.
+
+    The number of pending deliveries is bounded, sending waits for some of them to
+    complete once the limit is reached. Delivery results are counted and passed
+    to the optional callbacks, and the time from sending to the acknowledgement of
+    successful deliveries is recorded in a latency histogram.
+    """
+
+    def __init__(  # type: ignore
+        self,
+        max_in_flight: int = 10_000,
+        on_delivery: Optional[Callable[[RecordMetadata], Any]] = None,
+        on_delivery_error: Optional[Callable[[BaseException], Any]] = None,
+    ):
+        """
+        Params:
+            max_in_flight: maximum number of pending sends (a batch or an envelope counts as one send)
+            on_delivery: called with the record metadata of each successful send
+            on_delivery_error: called with the exception of each failed send, failures
+                are logged if it is not set
+        """
+        if max_in_flight < 1:
+            raise ValueError(
+                f"max_in_flight must be a positive integer, got {max_in_flight}"
+            )
+        self.max_in_flight = max_in_flight
+        self.on_delivery = on_delivery
+        self.on_delivery_error = on_delivery_error
+
+        self.delivered_count = 0
+        self.failed_count = 0
+        self.latency = LatencyHistogram()
+
+        self._pending: Set[asyncio.Future] = set()
+        # sends submitted from other threads which might not have reached the producer yet
+        self._submitted: Set[concurrent.futures.Future] = set()
+        # created lazily so it is bound to the loop the producer runs in
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def in_flight_count(self) -> int:
+        return len(self._pending)
+
+    async def send(
+        self, send_f: Callable[[], Awaitable[asyncio.Future]], msg_count: int = 1
+    ) -> asyncio.Future:
+        """
+        Calls send_f once there is room for another pending send and tracks the returned future.
+
+        Params:
+            send_f: function calling one of the send methods of a producer
+            msg_count: number of messages sent by send_f
+
+        Returns:
+            The future returned by send_f
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        await self._semaphore.acquire()
+        sent_at = monotonic()
+        try:
+            fut = await send_f()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        self._pending.add(fut)
+        fut.add_done_callback(
+            functools.partial(self._on_done, msg_count=msg_count, sent_at=sent_at)
+        )
+        return fut
+
+    def _on_done(self, fut: asyncio.Future, *, msg_count: int, sent_at: float) -> None:
+        self._pending.discard(fut)
+        self._semaphore.release()  # type: ignore
+
+        if not fut.cancelled() and fut.exception() is None:
+            self.delivered_count += msg_count
+            self.latency.record(monotonic() - sent_at)
+            if self.on_delivery is not None:
+                self.on_delivery(fut.result())
+            return
+
+        e = asyncio.CancelledError() if fut.cancelled() else fut.exception()
+        self.failed_count += msg_count
+        if self.on_delivery_error is not None:
+            self.on_delivery_error(e)  # type: ignore
+        else:
+            logger.warning(f"Failed to deliver {msg_count} message(s): {e!r}")
+
+    def track_submitted(self, fut: concurrent.futures.Future) -> None:
+        """Tracks a send submitted to the event loop of the producer from another thread, so flush waits for it"""
+        self._submitted.add(fut)
+        fut.add_done_callback(self._submitted.discard)
+
+    async def flush(self) -> None:
+        """Waits until all submitted and pending sends are completed"""
+        if self._submitted:
+            await asyncio.wait([asyncio.wrap_future(f) for f in list(self._submitted)])
+        if self._pending:
+            await asyncio.wait(list(self._pending))
+
+    def reset(self) -> None:
+        """Forgets the pending sends and the semaphore, called after the producer is stopped so the tracker can be used in another event loop"""
+        self._pending.clear()
+        self._submitted.clear()
+        self._semaphore = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": self.in_flight_count,
+            "delivered": self.delivered_count,
+            "failed": self.failed_count,
+        }
+
+# %% ../../nbs/013_ProducerDecorator.ipynb 18
+@dataclass
+@export("fastkafka")
+class EncodeOffloading:
+    """
+    Settings for encoding large messages in a thread or process pool instead of the event loop.
+
+    Attributes:
+        min_size (int): Messages with an estimated encoded size of at least this many bytes are
+            encoded in the pool, smaller ones are encoded in the event loop.
+        executor (str, Executor): "thread" or "process" for a pool managed by the application,
+            or an executor managed by the caller. Messages and the encoder must be picklable
+            to be encoded in a process pool.
+        max_workers (int, optional): Maximum number of workers of the pool managed by the
+            application, the default of the pool is used if None.
+        estimate_size (Callable, optional): Function returning the estimated encoded size of
+            a message. By default, the average encoded size of the last messages sent to the
+            topic is used, the first messages are encoded in the pool as their size is unknown.
+    """
+
+    min_size: int = 64 * 1024
+    executor: Union[str, concurrent.futures.Executor] = "thread"
+    max_workers: Optional[int] = None
+    estimate_size: Optional[Callable[[Any], int]] = None
+
+    _pool: Optional[concurrent.futures.Executor] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if isinstance(self.executor, str) and self.executor not in [
+            "thread",
+            "process",
+        ]:
+            raise ValueError(
+                f"executor must be one of 'thread', 'process' or an Executor, got '{self.executor}'"
+            )
+
+    def get_executor(self) -> concurrent.futures.Executor:
+        """Returns the executor, the pool managed by the application is created on first use"""
+        if not isinstance(self.executor, str):
+            return self.executor
+        if self._pool is None:
+            pool_cls = (
+                concurrent.futures.ThreadPoolExecutor
+                if self.executor == "thread"
+                else concurrent.futures.ProcessPoolExecutor
+            )
+            self._pool = pool_cls(max_workers=self.max_workers)
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Shuts down the pool managed by the application, executors of the caller are left running"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+def _encode_all(
+    encoder_fn: Callable[[BaseModel], bytes], messages: List[BaseModel]
+) -> List[bytes]:
+    return [encoder_fn(message) for message in messages]
+
+
+class OrderedEncoder:
+    """
+    Encodes messages sent to a topic in the event loop or in a pool and sends them in the order they were produced.
+    """
+
+    def __init__(self, offloading: EncodeOffloading):
+        """
+        Params:
+            offloading: settings of encode offloading
+        """
+        self.offloading = offloading
+        self.queue_depth = 0
+        self.offloaded_count = 0
+        self.inline_count = 0
+        # average encoded size of the last messages, None until the first of them are encoded
+        self._last_size: Optional[int] = None
+        # completed once the last queued messages are handed over to the producer
+        self._tail: Optional[asyncio.Future] = None
+
+    def _should_offload(self, messages: List[Any]) -> bool:
+        if self.offloading.estimate_size is not None:
+            size = sum(self.offloading.estimate_size(m) for m in messages)
+        elif self._last_size is None:
+            return True
+        else:
+            size = self._last_size * len(messages)
+        return size >= self.offloading.min_size
+
+    async def send(
+        self,
+        messages: List[Any],
+        encoder_fn: Callable[[BaseModel], bytes],
+        send_f: Callable[[List[bytes]], Awaitable[T]],
+    ) -> T:
+        """
+        Encodes the messages and sends them after the messages queued before them are sent.
+
+        Params:
+            messages: messages to encode
+            encoder_fn: function used for encoding the messages
+            send_f: function sending the encoded messages
+
+        Returns:
+            The result of send_f
+        """
+        loop = asyncio.get_running_loop()
+        previous, done = self._tail, loop.create_future()
+        self._tail = done
+        self.queue_depth += 1
+        try:
+            if self._should_offload(messages):
+                values = await loop.run_in_executor(
+                    self.offloading.get_executor(), _encode_all, encoder_fn, messages
+                )
+                self.offloaded_count += len(messages)
+            else:
+                values = _encode_all(encoder_fn, messages)
+                self.inline_count += len(messages)
+            if values:
+                self._last_size = sum(len(v) for v in values) // len(values)
+
+            if previous is not None:
+                await previous
+            return await send_f(values)
+        finally:
+            self.queue_depth -= 1
+            done.set_result(None)
+            if self._tail is done:
+                self._tail = None
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self.queue_depth,
+            "offloaded": self.offloaded_count,
+            "inline": self.inline_count,
+        }
+
+# %% ../../nbs/013_ProducerDecorator.ipynb 20
+class EventLoopThread:
+    """
+    Runs an event loop in a separate daemon thread.
+
+    Producers of sync functions are started in this loop, so messages can be sent from
+    any thread without re-entering the event loop of the application.
+    """
+
+    def __init__(self, name: str = "fastkafka-producers"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_started(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            raise RuntimeError("Event loop thread not started! Run start() first")
+        return self._loop
+
+    def start(self) -> None:
+        if self.is_started:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name=self.name, daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future:
+        """Schedules the coroutine in the loop, can be called from any thread"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Runs the coroutine in the loop and waits for its result without blocking the caller's loop"""
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def stop(self) -> None:
+        if not self.is_started:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()  # type: ignore
+        self.loop.close()
+        self._loop = None
+        self._thread = None
+
+
+def _log_send_error(fut: concurrent.futures.Future) -> None:
+    if not fut.cancelled() and fut.exception() is not None:
+        logger.warning(f"Failed to send message(s): {fut.exception()!r}")
+
+# %% ../../nbs/013_ProducerDecorator.ipynb 22
+Partitioner = Callable[[Optional[bytes], List[int], List[int]], int]
+
+
+class StickyPartitioner:
+    """
+    Partitioner sending messages without a key to the same partition until sticky_count of them
+    were sent, so they fill bigger batches. Messages with a key are partitioned using the murmur2
+    hash of the key, the same way as the default partitioner of the Java client does.
+    """
+
+    def __init__(self, sticky_count: int = 1_000):
+        self.sticky_count = sticky_count
+        # partition and number of messages sent to it per list of partitions of a topic
+        self._sticky: Dict[Tuple[int, ...], Tuple[int, int]] = {}
+
+    def __call__(
+        self,
+        key: Optional[bytes],
+        all_partitions: List[int],
+        available_partitions: List[int],
+    ) -> int:
+        if key is not None:
+            return DefaultPartitioner()(key, all_partitions, available_partitions)  # type: ignore
+
+        topic_partitions = tuple(all_partitions)
+        partition, count = self._sticky.get(topic_partitions, (-1, 0))
+        if count >= self.sticky_count or partition not in (
+            available_partitions or all_partitions
+        ):
+            partition = random.choice(available_partitions or all_partitions)  # nosec
+            count = 0
+        self._sticky[topic_partitions] = (partition, count + 1)
+        return partition
+
+
+# factories of partitioners, stateful partitioners are not shared between producers; keys are
+# hashed with murmur2 the same way as by the Java client by the default partitioner of AIOKafkaProducer
+_partitioners: Dict[str, Callable[[], Partitioner]] = {
+    "sticky": StickyPartitioner,
+}
+
+
+def get_partitioner(partitioner: Union[str, Partitioner]) -> Partitioner:
+    """
+    Returns the partitioner for the given strategy name or the partitioner itself if it is a function.
+
+    Partitioners are called with the key of a message and lists of all and available partitions of the topic
+    taken from the metadata cached by the producer, and return the partition to send the message to.
+
+    Params:
+        partitioner: "sticky" for a new StickyPartitioner, or a function
+    """
+    if callable(partitioner):
+        return partitioner
+    if partitioner not in _partitioners:
+        raise ValueError(
+            f"Unknown partitioner '{partitioner}', available options are {list(_partitioners.keys())}"
+        )
+    return _partitioners[partitioner]()
+
+# %% ../../nbs/013_ProducerDecorator.ipynb 24
+async def _send_or_spool(
+    send_f: Callable[[], Awaitable[asyncio.Future]],
+    topic: str,
+    records: List[Tuple[Optional[bytes], bytes, Optional[List[Tuple[str, bytes]]]]],
+    tracker: DeliveryTracker,
+    outbox: Optional[Outbox] = None,
+    msg_count: Optional[int] = None,
+) -> Optional[asyncio.Future]:
+    """
+    Sends the records using the tracker, or spools them to the outbox if it is set.
+
+    Records are spooled instead of sent while messages spooled earlier are waiting to be sent, so the
+    order of messages is kept, and while the limit of in-flight messages is reached. They are also spooled
+    if sending them or their delivery fails with a KafkaError.
+
+    Params:
+        send_f: function calling one of the send methods of a producer
+        topic: topic the records are sent to
+        records: keys, values and headers of the records sent by send_f
+        tracker: tracker of the pending deliveries of the producer
+        outbox: outbox for spooling the records which cannot be sent
+        msg_count: number of messages in the records counted by the tracker, the number of
+            records by default, an envelope is one record packing several messages
+
+    Returns:
+        The future returned by send_f, or None if the records were spooled
+    """
+    msg_count = len(records) if msg_count is None else msg_count
+    if outbox is None:
+        return await tracker.send(send_f, msg_count=msg_count)
+
+    def spool() -> "asyncio.Future[None]":
+        return outbox.spool(
+            [
+                OutboxRecord(topic=topic, value=value, key=key, headers=headers or [])
+                for key, value, headers in records
+            ]
+        )
+
+    if outbox.pending_count > 0 or tracker.in_flight_count >= tracker.max_in_flight:
+        await spool()
+        return None
+
+    try:
+        fut = await tracker.send(send_f, msg_count=msg_count)
+    except KafkaError as e:
+        logger.warning(
+            f"_send_or_spool(): Sending to topic '{topic}' failed with '{e!r}', spooling {len(records)} message(s) to the outbox"
+        )
+        await spool()
+        return None
+
+    def _log_spooled(spooled: asyncio.Future) -> None:
+        if spooled.cancelled():
+            return
+        if spooled.exception() is None:
+            logger.info(
+                f"_send_or_spool(): Spooled {len(records)} undelivered message(s) for topic '{topic}' to the outbox"
+            )
+        else:
+            logger.error(
+                f"_send_or_spool(): Lost {len(records)} undelivered message(s) for topic '{topic}': {spooled.exception()}"
+            )
+
+    def _spool_undelivered(fut: asyncio.Future) -> None:
+        if fut.cancelled() or not isinstance(fut.exception(), KafkaError):
+            return
+        spool().add_done_callback(_log_spooled)
+
+    fut.add_done_callback(_spool_undelivered)
+    return fut
+
+# %% ../../nbs/013_ProducerDecorator.ipynb 26
+async def _send_batch(  # type: ignore
+    producer: AIOKafkaProducer,
+    topic: str,
+    events: List[KafkaEvent],
+    encoder_fn: Callable[[BaseModel], bytes],
+    tracker: Optional[DeliveryTracker] = None,
+    partitioner: Optional[Partitioner] = None,
+    outbox: Optional[Outbox] = None,
+    values: Optional[List[bytes]] = None,
+) -> List[asyncio.Future]:
+    """
+    Encodes the events and sends them using one batch per partition, or more if they don't fit in one.
+
+    Messages are assigned to partitions by the partitioner of the producer. If it is not set, messages with a key
+    are assigned to partitions by hashing the key the same way as the default partitioner of AIOKafkaProducer does,
+    and messages without a key are all sent to one randomly chosen partition.
+
+    Params:
+        producer: started producer used for sending the batches
+        topic: topic to send the events to
+        events: events to send
+        encoder_fn: function used for encoding the messages
+        tracker: tracker of the pending deliveries of the producer
+        partitioner: partitioner of the producer
+        outbox: outbox for spooling the messages which cannot be sent
+        values: messages of the events already encoded, encoder_fn is not used if given
+
+    Returns:
+        List of futures, one for each of the sent batches, batches spooled to the outbox are not included
+    """
+    if not events:
+        return []
+
+    tracker = DeliveryTracker() if tracker is None else tracker
+
+    partitions = sorted(await producer.partitions_for(topic))
+    partitioner = (
+        StickyPartitioner(sticky_count=len(events))
+        if partitioner is None
+        else partitioner
+    )
+
+    records_per_partition: Dict[
+        int, List[Tuple[Optional[bytes], bytes, List[Tuple[str, bytes]]]]
+    ] = {}
+    if values is None:
+        values = [encoder_fn(event.message) for event in events]
+    for event, value in zip(events, values):
+        partition = partitioner(event.key, partitions, partitions)
+        records_per_partition.setdefault(partition, []).append(
+            (event.key, value, event.headers or [])
+        )
+
+    async def send_batch(
+        batch: Any,
+        partition: int,
+        batch_records: List[
+            Tuple[Optional[bytes], bytes, Optional[List[Tuple[str, bytes]]]]
+        ],
+    ) -> Optional[asyncio.Future]:
+        return await _send_or_spool(
+            functools.partial(producer.send_batch, batch, topic, partition=partition),
+            topic,
+            batch_records,
+            tracker,
+            outbox,
+        )
+
+    futs = []
+    for partition, records in records_per_partition.items():
+        batch = producer.create_batch()
+        batch_records: List[
+            Tuple[Optional[bytes], bytes, Optional[List[Tuple[str, bytes]]]]
+        ] = []
+        for key, value, headers in records:
+            if (
+                batch.append(key=key, value=value, timestamp=None, headers=headers)
+                is None
+            ):
+                # batch is full, the first record always fits in an empty one
+                futs.append(await send_batch(batch, partition, batch_records))
+                batch = producer.create_batch()
+                batch_records = []
+                batch.append(key=key, value=value, timestamp=None, headers=headers)
+            batch_records.append((key, value, headers))
+        futs.append(await send_batch(batch, partition, batch_records))
+
+    return [fut for fut in futs if fut is not None]
+
+# %% ../../nbs/013_ProducerDecorator.ipynb 28
 def producer_decorator(
     producer_store: Dict[str, Any],
     func: ProduceCallable,
     topic: str,
     encoder_fn: Callable[[BaseModel], bytes],
+    tracker: Optional[DeliveryTracker] = None,
+    io_thread: Optional[EventLoopThread] = None,
+    fire_and_forget: bool = False,
+    outbox: Optional[Outbox] = None,
+    ordered_encoder: Optional[OrderedEncoder] = None,
+    envelope_batcher: Optional[EnvelopeBatcher] = None,
 ) -> ProduceCallable:
     """todo: write documentation"""
 
-    loop = get_loop()
+    tracker = DeliveryTracker() if tracker is None else tracker
+    if ordered_encoder is not None and not iscoroutinefunction(func):
+        raise ValueError(
+            f"Encode offloading is only supported for async functions, sync function '{func.__name__}' encodes messages in the calling thread"
+        )
+    if envelope_batcher is not None and not iscoroutinefunction(func):
+        raise ValueError(
+            f"Envelopes are only supported for async functions, sync function '{func.__name__}' sends messages from another event loop"
+        )
+    if not iscoroutinefunction(func):
+        if io_thread is None:
+            raise ValueError(
+                f"Sync function '{func.__name__}' needs an EventLoopThread to send messages from, its producer must be started in the loop of the thread"
+            )
+        submit = io_thread.submit
+
+    async def send_record(
+        key: Optional[bytes],
+        value: bytes,
+        headers: List[Tuple[str, bytes]],
+        msg_count: int = 1,
+    ) -> Optional[asyncio.Future]:
+        _, producer, _ = producer_store[topic]
+        return await _send_or_spool(
+            functools.partial(producer.send, topic, value, key=key, headers=headers),
+            topic,
+            [(key, value, headers)],
+            tracker,
+            outbox,
+            msg_count=msg_count,
+        )
+
+    async def send_envelope(
+        key: Optional[bytes], value: bytes, msg_count: int
+    ) -> Optional[asyncio.Future]:
+        # deliveries of the messages packed in the envelope are counted, not of the envelope
+        return await send_record(
+            key, value, [(ENVELOPE_HEADER, b"")], msg_count=msg_count
+        )
 
-    def release_callback(fut: asyncio.Future) -> None:
-        pass
+    async def add_to_envelopes(events: List[KafkaEvent]) -> None:
+        for event in events:
+            value = encoder_fn(event.message)
+            if event.headers:
+                # headers cannot be packed, the message is sent on its own after the pending ones with its key
+                await envelope_batcher.send_pending(event.key)  # type: ignore
+                await send_record(event.key, value, event.headers)
+            else:
+                await envelope_batcher.add(event.key, value, send_envelope)  # type: ignore
 
     @functools.wraps(func)
     async def _produce_async(
         *args: List[Any],
         producer_store: Dict[str, Any] = producer_store,
         f: Callable[..., Awaitable[ProduceReturnTypes]] = func,  # type: ignore
-        **kwargs: Any
+        **kwargs: Any,
     ) -> ProduceReturnTypes:
         return_val = await f(*args, **kwargs)
+        _, producer, producer_config = producer_store[topic]
+        if envelope_batcher is not None:
+            await add_to_envelopes(
+                [
+                    _wrap_in_event(v)
+                    for v in (
+                        return_val if isinstance(return_val, list) else [return_val]
+                    )
+                ]
+            )
+            return return_val
+        if isinstance(return_val, list):
+            events = [_wrap_in_event(v) for v in return_val]
+
+            async def send_batch(values: Optional[List[bytes]] = None) -> Any:
+                return await _send_batch(
+                    producer,
+                    topic,
+                    events,
+                    encoder_fn,
+                    tracker=tracker,
+                    partitioner=(producer_config or {}).get("partitioner"),
+                    outbox=outbox,
+                    values=values,
+                )
+
+            if ordered_encoder is None:
+                await send_batch()
+            else:
+                await ordered_encoder.send(
+                    [e.message for e in events], encoder_fn, send_batch
+                )
+            return return_val
         wrapped_val = _wrap_in_event(return_val)
-        _, producer, _ = producer_store[topic]
-        fut = await producer.send(
-            topic, encoder_fn(wrapped_val.message), key=wrapped_val.key
-        )
-        fut.add_done_callback(release_callback)
+
+        async def send(value: bytes) -> Any:
+            return await send_record(wrapped_val.key, value, wrapped_val.headers or [])
+
+        if ordered_encoder is None:
+            await send(encoder_fn(wrapped_val.message))
+        else:
+            await ordered_encoder.send(
+                [wrapped_val.message], encoder_fn, lambda values: send(values[0])
+            )
         return return_val
 
     @functools.wraps(func)
@@ -95,16 +747,40 @@ def producer_decorator(
         *args: List[Any],
         producer_store: Dict[str, Any] = producer_store,
         f: Callable[..., ProduceReturnTypes] = func,  # type: ignore
-        loop: asyncio.AbstractEventLoop = loop,
-        **kwargs: Any
+        **kwargs: Any,
     ) -> ProduceReturnTypes:
         return_val = f(*args, **kwargs)
-        wrapped_val = _wrap_in_event(return_val)
-        _, producer, _ = producer_store[topic]
-        fut = loop.run_until_complete(
-            producer.send(topic, encoder_fn(wrapped_val.message), key=wrapped_val.key)
-        )
-        fut.add_done_callback(release_callback)
+        _, producer, producer_config = producer_store[topic]
+        if isinstance(return_val, list):
+            send_coro = _send_batch(
+                producer,
+                topic,
+                [_wrap_in_event(v) for v in return_val],
+                encoder_fn,
+                tracker=tracker,
+                partitioner=(producer_config or {}).get("partitioner"),
+                outbox=outbox,
+            )
+        else:
+            wrapped_val = _wrap_in_event(return_val)
+            value = encoder_fn(wrapped_val.message)
+            headers = wrapped_val.headers or []
+            send_coro = _send_or_spool(
+                functools.partial(
+                    producer.send, topic, value, key=wrapped_val.key, headers=headers
+                ),
+                topic,
+                [(wrapped_val.key, value, headers)],
+                tracker,  # type: ignore
+                outbox,
+            )
+
+        if fire_and_forget:
+            fut = submit(send_coro)
+            tracker.track_submitted(fut)
+            fut.add_done_callback(_log_send_error)
+        else:
+            submit(send_coro).result()
         return return_val
 
     return _produce_async if iscoroutinefunction(func) else _produce_sync
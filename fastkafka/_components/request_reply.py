@@ -0,0 +1,188 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/029_RequestReply.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'CORRELATION_ID_HEADER', 'reply_headers', 'ReplyConsumer']
+
+# %% ../../nbs/029_RequestReply.ipynb 1
+import asyncio
+import uuid
+from typing import *
+
+from aiokafka import AIOKafkaConsumer
+from aiokafka.structs import ConsumerRecord, TopicPartition
+
+from fastkafka._components.aiokafka_consumer_loop import (
+    EventMetadata,
+    sanitize_kafka_config,
+)
+from .logger import get_logger
+from .meta import export, filter_using_signature
+
+# %% ../../nbs/029_RequestReply.ipynb 5
+logger = get_logger(__name__)
+
+# %% ../../nbs/029_RequestReply.ipynb 8
+CORRELATION_ID_HEADER = "correlation_id"
+
+
+@export("fastkafka")
+def reply_headers(metadata: EventMetadata) -> List[Tuple[str, bytes]]:
+    """
+    Returns the headers to send with a reply to the consumed request.
+
+    Params:
+        metadata: metadata of the consumed request
+
+    Returns:
+        List with the correlation id header of the request, empty if the request has none
+    """
+    return [(k, v) for k, v in metadata.headers if k == CORRELATION_ID_HEADER]
+
+# %% ../../nbs/029_RequestReply.ipynb 11
+class ReplyConsumer:
+    """Consumes replies from a topic and completes the pending requests with matching correlation ids."""
+
+    def __init__(self, topic: str, *, timeout_ms: int = 100, **kwargs: Any):
+        """
+        Params:
+            topic: topic the replies are sent to
+            timeout_ms: time to wait for replies in a single poll of the consumer
+            kwargs: parameters passed to AIOKafkaConsumer
+        """
+        self.topic = topic
+        self.timeout_ms = timeout_ms
+        self._config = kwargs
+        self._starting: Optional["asyncio.Future[None]"] = None
+        self._consumer: Optional[AIOKafkaConsumer] = None  # type: ignore
+        self._consume_task: Optional[asyncio.Task] = None
+        self._pending: Dict[bytes, "asyncio.Future[ConsumerRecord]"] = {}  # type: ignore
+        self._replied = 0
+        self._timed_out = 0
+        self._unmatched = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of requests waiting for a reply ("in_flight"), replied and timed out requests,
+        and the number of consumed replies not matching any pending request ("unmatched"), such as
+        replies to requests of other processes or replies received after a timeout
+        """
+        return {
+            "in_flight": len(self._pending),
+            "replied": self._replied,
+            "timed_out": self._timed_out,
+            "unmatched": self._unmatched,
+        }
+
+    async def start(self) -> None:
+        """Starts the consumer if it is not already started, it is safe to call concurrently"""
+        if self._starting is None:
+            self._starting = asyncio.ensure_future(self._start())
+        try:
+            await asyncio.shield(self._starting)
+        except Exception:
+            self._starting = None
+            raise
+
+    async def _start(self) -> None:
+        config = {
+            **filter_using_signature(AIOKafkaConsumer, **self._config),
+            "group_id": None,
+            "enable_auto_commit": False,
+        }
+        consumer = AIOKafkaConsumer(**config)
+        logger.info(
+            f"ReplyConsumer._start(): Consumer created for topic '{self.topic}' using the following parameters: {sanitize_kafka_config(**config)}"
+        )
+        await consumer.start()
+        try:
+            # fetches metadata for all topics
+            await consumer.topics()
+            partitions = consumer.partitions_for_topic(self.topic)
+            if not partitions:
+                raise ValueError(f"Topic '{self.topic}' not found")
+            topic_partitions = [TopicPartition(self.topic, p) for p in partitions]
+            consumer.assign(topic_partitions)
+            # replies sent before the positions are known would be skipped
+            await consumer.seek_to_end(*topic_partitions)
+            for tp in topic_partitions:
+                await consumer.position(tp)
+        except BaseException:
+            await consumer.stop()
+            raise
+        self._consumer = consumer
+        self._consume_task = asyncio.create_task(self._consume())
+
+    async def _consume(self) -> None:
+        while True:
+            try:
+                msgs = await self._consumer.getmany(timeout_ms=self.timeout_ms)  # type: ignore
+            except Exception as e:
+                logger.warning(
+                    f"ReplyConsumer._consume(): Unexpected exception '{e!r}' caught and ignored while consuming replies from topic '{self.topic}'"
+                )
+                await asyncio.sleep(self.timeout_ms / 1000)
+                continue
+            for records in msgs.values():
+                for record in records:
+                    self._complete(record)
+
+    def _complete(self, record: ConsumerRecord) -> None:  # type: ignore
+        correlation_id = dict(record.headers or []).get(CORRELATION_ID_HEADER)
+        fut = self._pending.get(correlation_id)  # type: ignore
+        if fut is None or fut.done():
+            self._unmatched = self._unmatched + 1
+        else:
+            fut.set_result(record)
+
+    async def request(  # type: ignore
+        self,
+        send_f: Callable[[List[Tuple[str, bytes]]], Awaitable[Any]],
+        timeout: float,
+    ) -> ConsumerRecord:
+        """
+        Sends a request and waits for the reply with the same correlation id.
+
+        Params:
+            send_f: function sending the request with the given headers
+            timeout: time in seconds to wait for the reply
+
+        Returns:
+            The consumed reply
+
+        Raises:
+            asyncio.TimeoutError: if the reply is not received in time
+        """
+        await self.start()
+        correlation_id = uuid.uuid4().hex.encode()
+        fut: "asyncio.Future[ConsumerRecord]" = (  # type: ignore
+            asyncio.get_running_loop().create_future()
+        )
+        # registered before sending, so that a fast reply is not missed
+        self._pending[correlation_id] = fut
+        try:
+            await send_f([(CORRELATION_ID_HEADER, correlation_id)])
+            record = await asyncio.wait_for(fut, timeout)
+            self._replied = self._replied + 1
+            return record
+        except asyncio.TimeoutError:
+            self._timed_out = self._timed_out + 1
+            raise
+        finally:
+            # requests are evicted when they are replied, timed out or cancelled
+            self._pending.pop(correlation_id, None)
+
+    async def stop(self) -> None:
+        """Stops the consumer, pending requests are cancelled"""
+        if self._consume_task is not None:
+            self._consume_task.cancel()
+            try:
+                await self._consume_task
+            except asyncio.CancelledError:
+                pass
+            self._consume_task = None
+        if self._consumer is not None:
+            await self._consumer.stop()
+            self._consumer = None
+        for fut in self._pending.values():
+            fut.cancel()
+        self._starting = None
@@ -0,0 +1,294 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/027_Scheduler.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'Schedule', 'TimerWheel', 'Scheduler']
+
+# %% ../../nbs/027_Scheduler.ipynb 1
+import asyncio
+import math
+import random
+from asyncio import iscoroutinefunction  # do not use the version from inspect
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from time import monotonic, time
+from typing import *
+
+from .logger import get_logger
+from .meta import export
+
+# %% ../../nbs/027_Scheduler.ipynb 5
+logger = get_logger(__name__)
+
+# %% ../../nbs/027_Scheduler.ipynb 8
+def _parse_cron_field(field: str, min_value: int, max_value: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in field.split(","):
+        range_part, _, step = part.partition("/")
+        if range_part == "*":
+            start, end = min_value, max_value
+        elif "-" in range_part:
+            start, end = map(int, range_part.split("-"))
+        else:
+            start = int(range_part)
+            end = max_value if step else start
+        if not (min_value <= start <= end <= max_value):
+            raise ValueError(
+                f"Cron field '{field}' is out of range [{min_value}, {max_value}]"
+            )
+        values.update(range(start, end + 1, int(step) if step else 1))
+    return values
+
+
+# the longest month lengths, including leap years
+_days_in_month = dict(
+    zip(range(1, 13), [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+)
+
+
+class _CronExpression:
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"Cron expression must have five fields, got '{expression}'"
+            )
+        try:
+            self.minutes = _parse_cron_field(fields[0], 0, 59)
+            self.hours = _parse_cron_field(fields[1], 0, 23)
+            self.days = _parse_cron_field(fields[2], 1, 31)
+            self.months = _parse_cron_field(fields[3], 1, 12)
+            self.weekdays = {d % 7 for d in _parse_cron_field(fields[4], 0, 7)}
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression '{expression}': {e}") from e
+        self.expression = expression
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+        # fails fast instead of in next_after, every day of week occurs in every month
+        if self._any_weekday and not any(
+            day <= _days_in_month[month] for month in self.months for day in self.days
+        ):
+            raise ValueError(f"Cron expression '{expression}' never matches")
+
+    def _matches_day(self, dt: datetime) -> bool:
+        day_matches = dt.day in self.days
+        # cron numbers days of week from Sunday
+        weekday_matches = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_matches and weekday_matches
+        return day_matches or weekday_matches
+
+    def next_after(self, dt: datetime) -> datetime:
+        """Returns the first matching time after dt"""
+        dt = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # a matching time is found within a few years for any valid expression
+        while dt.year <= datetime.now().year + 5:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1) + timedelta(days=32)).replace(
+                    day=1, hour=0, minute=0
+                )
+            elif not self._matches_day(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+            elif dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+            elif dt.minute not in self.minutes:
+                dt = dt + timedelta(minutes=1)
+            else:
+                return dt
+        raise ValueError(f"Cron expression '{self.expression}' never matches")
+
+# %% ../../nbs/027_Scheduler.ipynb 11
+def _to_seconds(value: Union[float, timedelta]) -> float:
+    return value.total_seconds() if isinstance(value, timedelta) else float(value)
+
+
+@dataclass
+@export("fastkafka")
+class Schedule:
+    """
+    A schedule for calling a producer function periodically.
+
+    Attributes:
+        every (float, timedelta, optional): Interval between calls, in seconds if given as a number.
+        cron (str, optional): Cron expression with minute, hour, day of month, month and day of week
+            fields, evaluated in local time. Exactly one of every and cron must be set.
+        jitter (float, timedelta): Maximum random delay added to each call, in seconds if given
+            as a number. Spreads the calls of schedules which are due at the same time.
+        catch_up (str): What to do with calls missed while the application was too busy to make
+            them on time: "latest" makes one call for all of them, "all" makes a call for each
+            of them and "skip" drops them and waits for the next due time.
+    """
+
+    every: Optional[Union[float, timedelta]] = None
+    cron: Optional[str] = None
+    jitter: Union[float, timedelta] = 0.0
+    catch_up: str = "latest"
+
+    _interval: Optional[float] = field(init=False, repr=False, compare=False)
+    _cron: Optional[_CronExpression] = field(init=False, repr=False, compare=False)
+    _jitter: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if (self.every is None) == (self.cron is None):
+            raise ValueError("Exactly one of every and cron must be set")
+        if self.catch_up not in ["latest", "all", "skip"]:
+            raise ValueError(
+                f"catch_up must be one of 'latest', 'all' or 'skip', got '{self.catch_up}'"
+            )
+        self._interval = None if self.every is None else _to_seconds(self.every)
+        if self._interval is not None and self._interval <= 0:
+            raise ValueError(f"every must be positive, got {self.every}")
+        self._cron = None if self.cron is None else _CronExpression(self.cron)
+        self._jitter = _to_seconds(self.jitter)
+        if self._jitter < 0:
+            raise ValueError(f"jitter must not be negative, got {self.jitter}")
+
+    def next_due(self, due: float) -> float:
+        """Returns the first due time after the given one, as a timestamp"""
+        if self._interval is not None:
+            return due + self._interval
+        return self._cron.next_after(datetime.fromtimestamp(due)).timestamp()  # type: ignore
+
+    def get_runs(self, due: float, now: float) -> Tuple[int, float]:
+        """
+        Returns the number of calls to make for the due time and the next due time after now.
+
+        Params:
+            due: due time of the call, as a timestamp
+            now: current time, as a timestamp
+
+        Returns:
+            Number of calls to make and the next due time
+        """
+        if self._interval is not None:
+            missed = max(math.floor((now - due) / self._interval), 0)
+            next_due = due + (missed + 1) * self._interval
+        else:
+            missed, next_due = 0, self.next_due(due)
+            while next_due <= now:
+                missed, next_due = missed + 1, self.next_due(next_due)
+        if missed == 0 or self.catch_up == "latest":
+            return 1, next_due
+        if self.catch_up == "all":
+            return missed + 1, next_due
+        return 0, next_due
+
+# %% ../../nbs/027_Scheduler.ipynb 14
+class TimerWheel:
+    def __init__(self, tick: float, slots: int = 512, start: float = 0.0):
+        """
+        Params:
+            tick: resolution of the wheel in seconds, deadlines are rounded up to it
+            slots: number of slots of the wheel
+            start: time the wheel starts at, items are not due before it
+        """
+        self.tick = tick
+        self._slots: List[List[Tuple[int, Any]]] = [[] for _ in range(slots)]
+        self._current_tick = math.floor(start / tick)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, deadline: float, item: Any) -> None:
+        """Adds an item which is due at the deadline"""
+        deadline_tick = max(math.ceil(deadline / self.tick), self._current_tick + 1)
+        self._slots[deadline_tick % len(self._slots)].append((deadline_tick, item))
+        self._count = self._count + 1
+
+    def advance(self, now: float) -> List[Any]:
+        """Removes and returns the items which are due at now, ordered by their deadlines"""
+        now_tick = math.floor(now / self.tick)
+        due: List[Tuple[int, Any]] = []
+        # each slot is visited at most once, even if the wheel fell behind by more than a round
+        last_tick = min(now_tick, self._current_tick + len(self._slots))
+        for tick in range(self._current_tick + 1, last_tick + 1):
+            index = tick % len(self._slots)
+            if self._slots[index]:
+                due.extend(e for e in self._slots[index] if e[0] <= now_tick)
+                self._slots[index] = [e for e in self._slots[index] if e[0] > now_tick]
+        self._current_tick = max(self._current_tick, now_tick)
+        self._count = self._count - len(due)
+        due.sort(key=lambda e: e[0])
+        return [item for _, item in due]
+
+# %% ../../nbs/027_Scheduler.ipynb 17
+@dataclass
+class _ScheduledCall:
+    f: Callable[[], Any]
+    schedule: Schedule
+    due: float = 0.0
+
+
+async def _call(f: Callable[[], Any], runs: int) -> None:
+    for _ in range(runs):
+        try:
+            if iscoroutinefunction(f):
+                await f()
+            else:
+                await asyncio.get_running_loop().run_in_executor(None, f)
+        except Exception as e:
+            logger.warning(
+                f"_call(): Unexpected exception '{e!r}' caught and ignored while calling scheduled function '{f.__name__}'"
+            )
+
+
+class Scheduler:
+    """Calls functions on their schedules, all of them are driven by a single task using a timer wheel."""
+
+    def __init__(self, tick: float = 0.1, slots: int = 512):
+        """
+        Params:
+            tick: resolution of the scheduler in seconds
+            slots: number of slots of the timer wheel
+        """
+        self.tick = tick
+        self.slots = slots
+        self._calls: List[_ScheduledCall] = []
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def add(self, f: Callable[[], Any], schedule: Schedule) -> None:
+        """
+        Adds a function to be called on the schedule.
+
+        Params:
+            f: sync or async function called without arguments, sync functions are called in a thread pool
+            schedule: schedule of the calls
+        """
+        self._calls.append(_ScheduledCall(f=f, schedule=schedule))
+
+    async def run(self) -> None:
+        """Calls the functions on their schedules until cancelled, pending calls are cancelled with it"""
+        wheel = TimerWheel(self.tick, self.slots, start=monotonic())
+        running: Set[asyncio.Task] = set()
+
+        def _add(call: _ScheduledCall, due: float) -> None:
+            call.due = due
+            delay = due - time() + random.uniform(0, call.schedule._jitter)  # nosec
+            wheel.add(monotonic() + delay, call)
+
+        now = time()
+        for call in self._calls:
+            _add(call, call.schedule.next_due(now))
+
+        try:
+            while True:
+                # wake up at tick boundaries so that the sleep overhead does not add up
+                next_tick = (math.floor(monotonic() / self.tick) + 1) * self.tick
+                await asyncio.sleep(next_tick - monotonic())
+                for call in wheel.advance(monotonic()):
+                    runs, next_due = call.schedule.get_runs(call.due, time())
+                    if runs == 0:
+                        logger.info(
+                            f"Scheduler.run(): Skipped missed calls of '{call.f.__name__}'"
+                        )
+                    else:
+                        task = asyncio.create_task(_call(call.f, runs))
+                        running.add(task)
+                        task.add_done_callback(running.discard)
+                    _add(call, next_due)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
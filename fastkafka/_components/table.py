@@ -0,0 +1,271 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/012_Table.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'Table', 'aiokafka_table_loop']
+
+# %% ../../nbs/012_Table.ipynb 1
+import asyncio
+from collections import OrderedDict
+from typing import *
+
+from aiokafka import AIOKafkaConsumer
+from aiokafka.structs import ConsumerRecord, TopicPartition
+from pydantic import BaseModel
+from pydantic.main import ModelMetaclass
+
+from fastkafka._components.aiokafka_consumer_loop import (
+    _get_replay_offsets,
+    _replay_consumer_config,
+    sanitize_kafka_config,
+)
+from .logger import get_logger
+from .meta import delegates, export, filter_using_signature
+from .producer_decorator import BaseSubmodel
+
+# %% ../../nbs/012_Table.ipynb 5
+logger = get_logger(__name__)
+
+# %% ../../nbs/012_Table.ipynb 8
+@export("fastkafka")
+class Table(Generic[BaseSubmodel]):
+    """
+    An in-memory view of the latest message for each key of a topic, typically a compacted one.
+
+    Tables are created with the `FastKafka.table` method and are populated in the background while
+    the application is running. Messages are stored encoded and decoded on the first lookup, messages
+    without a key are ignored and messages with an empty value (tombstones) remove the key from the table.
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        msg_type: Type[BaseSubmodel],
+        *,
+        decoder_fn: Callable[[bytes, ModelMetaclass], Any],
+        max_size: Optional[int] = None,
+    ):
+        """Creates a table
+
+        Args:
+            topic: topic the table is populated from
+            msg_type: type of messages in the topic
+            decoder_fn: function used for decoding messages
+            max_size: maximum number of keys in the table, if exceeded the least recently
+                updated keys are evicted, default: None - the table is not bounded
+        """
+        self.topic = topic
+        self.msg_type = msg_type
+        self.decoder_fn = decoder_fn
+        self.max_size = max_size
+
+        self._data: "OrderedDict[bytes, Union[bytes, BaseSubmodel]]" = OrderedDict()
+        self._is_ready = False
+        self._error: Optional[BaseException] = None
+        self._ready_event: Optional[asyncio.Event] = None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Union[bytes, str]) -> bool:
+        return _encode_key(key) in self._data
+
+    def get(
+        self, key: Union[bytes, str], default: Optional[BaseSubmodel] = None
+    ) -> Optional[BaseSubmodel]:
+        """Returns the latest message with the given key
+
+        Args:
+            key: key of the message, strings are encoded using utf-8
+            default: value returned if there is no message with the key in the table
+
+        Returns:
+            The latest message with the key or default
+        """
+        key = _encode_key(key)
+        value = self._data.get(key)
+        if value is None:
+            return default
+        if isinstance(value, bytes):
+            value = self.decoder_fn(value, self.msg_type)
+            self._data[key] = value
+        return value
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the table caught up with the end of the topic as seen when the application started"""
+        return self._is_ready
+
+    async def wait_until_ready(self) -> None:
+        """Waits until the table caught up with the end of the topic as seen when the application started
+
+        Raises:
+            RuntimeError: if populating the table failed
+        """
+        await self._get_ready_event().wait()
+        if self._error is not None:
+            raise RuntimeError(
+                f"Populating the table from topic '{self.topic}' failed"
+            ) from self._error
+
+    def _get_ready_event(self) -> asyncio.Event:
+        # created lazily so it is bound to the running event loop
+        if self._ready_event is None:
+            self._ready_event = asyncio.Event()
+            if self._is_ready or self._error is not None:
+                self._ready_event.set()
+        return self._ready_event
+
+    def _set_ready(self, is_ready: bool) -> None:
+        self._is_ready = is_ready
+        self._error = None
+        if is_ready:
+            self._get_ready_event().set()
+        elif self._ready_event is not None:
+            # tasks already waiting keep waiting until the table is ready
+            self._ready_event.clear()
+
+    def _set_failed(self, error: BaseException) -> None:
+        # wakes up the waiting tasks, which raise the error
+        self._is_ready = False
+        self._error = error
+        self._get_ready_event().set()
+
+    def _reset(self) -> None:
+        # the table can be populated again in another event loop
+        self._is_ready = False
+        self._error = None
+        self._ready_event = None
+
+    def _update(self, key: Optional[bytes], value: Optional[bytes]) -> None:
+        if key is None:
+            return
+        if not value:
+            self._data.pop(key, None)
+            return
+        self._data[key] = value
+        if self.max_size is not None:
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+
+def _encode_key(key: Union[bytes, str]) -> bytes:
+    return key.encode("utf-8") if isinstance(key, str) else key
+
+# %% ../../nbs/012_Table.ipynb 13
+@delegates(AIOKafkaConsumer.getmany)
+async def _aiokafka_table_loop(  # type: ignore
+    consumer: AIOKafkaConsumer,
+    *,
+    table: Table,
+    end_offsets: Dict[TopicPartition, int],
+    is_shutting_down_f: Callable[[], bool],
+    **kwargs: Any,
+) -> None:
+    """
+    Polls the consumer for new messages and updates the table with them. The table is marked as ready
+    once the end offsets are reached in all topic partitions.
+
+    Params:
+        consumer: started AIOKafkaConsumer with topic partitions assigned
+        table: table to update
+        end_offsets: Dict of offsets marking the end of bootstrapping mapped to their topic partitions
+        is_shutting_down_f: Function for controlling the shutdown of the loop
+    """
+    remaining = [
+        tp for tp in end_offsets if await consumer.position(tp) < end_offsets[tp]
+    ]
+    if not remaining:
+        table._set_ready(True)
+
+    while not is_shutting_down_f():
+        msgs = await consumer.getmany(**kwargs)
+        for records in msgs.values():
+            for record in records:
+                table._update(record.key, record.value)
+
+        if remaining:
+            remaining = [
+                tp for tp in remaining if await consumer.position(tp) < end_offsets[tp]
+            ]
+            if not remaining:
+                table._set_ready(True)
+                logger.info(
+                    f"_aiokafka_table_loop(): Table for topic '{table.topic}' is ready with {len(table)} keys"
+                )
+
+# %% ../../nbs/012_Table.ipynb 16
+@delegates(AIOKafkaConsumer)
+async def aiokafka_table_loop(
+    table: Table,
+    *,
+    timeout_ms: int = 100,
+    is_shutting_down_f: Callable[[], bool],
+    **kwargs: Any,
+) -> None:
+    """Populates the table from the beginning of all partitions of its topic and keeps it up to
+    date with new messages until shutdown.
+
+    The consumer is created without a consumer group, so every instance of the application builds
+    the whole table. Fetch sizes and the number of records returned by a single poll are increased
+    to bootstrap the table as fast as possible.
+
+    Args:
+        table: table to populate
+        timeout_ms: Time to timeut the getmany request by the consumer
+        is_shutting_down_f: Function for controlling the shutdown of the loop
+    """
+    logger.info(f"aiokafka_table_loop() starting...")
+    config = {
+        **filter_using_signature(AIOKafkaConsumer, **kwargs),
+        **_replay_consumer_config,
+        "group_id": None,
+        "enable_auto_commit": False,
+    }
+    consumer = AIOKafkaConsumer(**config)
+    logger.info(
+        f"aiokafka_table_loop(): Consumer created using the following parameters: {sanitize_kafka_config(**config)}"
+    )
+
+    table._set_ready(False)
+    try:
+        await consumer.start()
+        try:
+            # fetches metadata for all topics
+            await consumer.topics()
+            partitions = consumer.partitions_for_topic(table.topic)
+            if not partitions:
+                raise ValueError(f"Topic '{table.topic}' not found")
+            topic_partitions = [
+                TopicPartition(table.topic, p) for p in sorted(partitions)
+            ]
+            consumer.assign(topic_partitions)
+
+            start_offsets, end_offsets = await _get_replay_offsets(
+                consumer, topic_partitions
+            )
+            for tp, offset in start_offsets.items():
+                consumer.seek(tp, offset)
+            logger.info(
+                f"aiokafka_table_loop(): Populating table from topic '{table.topic}' up to offsets {end_offsets}"
+            )
+
+            await _aiokafka_table_loop(
+                consumer=consumer,
+                table=table,
+                end_offsets=end_offsets,
+                is_shutting_down_f=is_shutting_down_f,
+                timeout_ms=timeout_ms,
+                max_records=config["max_poll_records"],
+            )
+        finally:
+            await consumer.stop()
+    except Exception as e:
+        logger.error(
+            f"aiokafka_table_loop(): unexpected exception raised: '{e.__repr__()}'"
+        )
+        # tasks waiting for the table would wait forever otherwise
+        table._set_failed(e)
+        raise e
+    finally:
+        logger.info(f"aiokafka_table_loop() finished.")
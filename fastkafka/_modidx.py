@@ -19,12 +19,20 @@ d = { 'settings': { 'branch': 'main',
                                                                                                 'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.__init__': ( 'fastkafka.html#fastkafka.__init__',
                                                                                                'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka._choose_compression_types': ( 'fastkafka.html#fastkafka._choose_compression_types',
+                                                                                                                'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka._get_request_producer': ( 'fastkafka.html#fastkafka._get_request_producer',
+                                                                                                            'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka._populate_bg_tasks': ( 'fastkafka.html#fastkafka._populate_bg_tasks',
                                                                                                          'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka._populate_consumers': ( 'fastkafka.html#fastkafka._populate_consumers',
                                                                                                           'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka._populate_producers': ( 'fastkafka.html#fastkafka._populate_producers',
                                                                                                           'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka._populate_tables': ( 'fastkafka.html#fastkafka._populate_tables',
+                                                                                                       'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka._send_outbox_records': ( 'fastkafka.html#fastkafka._send_outbox_records',
+                                                                                                           'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka._set_bootstrap_servers': ( 'fastkafka.html#fastkafka._set_bootstrap_servers',
                                                                                                              'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka._shutdown_bg_tasks': ( 'fastkafka.html#fastkafka._shutdown_bg_tasks',
@@ -33,10 +41,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                                           'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka._shutdown_producers': ( 'fastkafka.html#fastkafka._shutdown_producers',
                                                                                                           'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka._shutdown_requests': ( 'fastkafka.html#fastkafka._shutdown_requests',
+                                                                                                         'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka._shutdown_tables': ( 'fastkafka.html#fastkafka._shutdown_tables',
+                                                                                                       'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka._start': ( 'fastkafka.html#fastkafka._start',
                                                                                              'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka._stop': ( 'fastkafka.html#fastkafka._stop',
                                                                                             'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka._wait_for_consumers_started': ( 'fastkafka.html#fastkafka._wait_for_consumers_started',
+                                                                                                                  'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.benchmark': ( 'fastkafka.html#fastkafka.benchmark',
                                                                                                 'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.consumes': ( 'fastkafka.html#fastkafka.consumes',
@@ -45,30 +59,60 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.create_mocks': ( 'fastkafka.html#fastkafka.create_mocks',
                                                                                                    'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.flush': ( 'fastkafka.html#fastkafka.flush',
+                                                                                            'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.get_delivery_stats': ( 'fastkafka.html#fastkafka.get_delivery_stats',
+                                                                                                         'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.get_encoding_stats': ( 'fastkafka.html#fastkafka.get_encoding_stats',
+                                                                                                         'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.get_envelope_stats': ( 'fastkafka.html#fastkafka.get_envelope_stats',
+                                                                                                         'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.get_request_stats': ( 'fastkafka.html#fastkafka.get_request_stats',
+                                                                                                        'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.get_topics': ( 'fastkafka.html#fastkafka.get_topics',
                                                                                                  'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.is_started': ( 'fastkafka.html#fastkafka.is_started',
                                                                                                  'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.produces': ( 'fastkafka.html#fastkafka.produces',
                                                                                                'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.replay': ( 'fastkafka.html#fastkafka.replay',
+                                                                                             'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.request': ( 'fastkafka.html#fastkafka.request',
+                                                                                              'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.run_in_background': ( 'fastkafka.html#fastkafka.run_in_background',
                                                                                                         'fastkafka/_application/app.py'),
                                             'fastkafka._application.app.FastKafka.set_kafka_broker': ( 'fastkafka.html#fastkafka.set_kafka_broker',
                                                                                                        'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.set_worker_index': ( 'fastkafka.html#fastkafka.set_worker_index',
+                                                                                                       'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app.FastKafka.table': ( 'fastkafka.html#fastkafka.table',
+                                                                                            'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app._choose_compression_type': ( 'fastkafka.html#_choose_compression_type',
+                                                                                                     'fastkafka/_application/app.py'),
                                             'fastkafka._application.app._create_producer': ( 'fastkafka.html#_create_producer',
                                                                                              'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app._gather_or_cancel': ( 'fastkafka.html#_gather_or_cancel',
+                                                                                              'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app._get_consumer_config': ( 'fastkafka.html#_get_consumer_config',
+                                                                                                 'fastkafka/_application/app.py'),
                                             'fastkafka._application.app._get_contact_info': ( 'fastkafka.html#_get_contact_info',
                                                                                               'fastkafka/_application/app.py'),
                                             'fastkafka._application.app._get_decoder_fn': ( 'fastkafka.html#_get_decoder_fn',
                                                                                             'fastkafka/_application/app.py'),
                                             'fastkafka._application.app._get_encoder_fn': ( 'fastkafka.html#_get_encoder_fn',
                                                                                             'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app._get_group_instance_id': ( 'fastkafka.html#_get_group_instance_id',
+                                                                                                   'fastkafka/_application/app.py'),
                                             'fastkafka._application.app._get_kafka_brokers': ( 'fastkafka.html#_get_kafka_brokers',
                                                                                                'fastkafka/_application/app.py'),
                                             'fastkafka._application.app._get_kafka_config': ( 'fastkafka.html#_get_kafka_config',
                                                                                               'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app._get_producer_config': ( 'fastkafka.html#_get_producer_config',
+                                                                                                 'fastkafka/_application/app.py'),
                                             'fastkafka._application.app._get_topic_name': ( 'fastkafka.html#_get_topic_name',
-                                                                                            'fastkafka/_application/app.py')},
+                                                                                            'fastkafka/_application/app.py'),
+                                            'fastkafka._application.app._is_static_membership_supported': ( 'fastkafka.html#_is_static_membership_supported',
+                                                                                                            'fastkafka/_application/app.py')},
             'fastkafka._application.tester': { 'fastkafka._application.tester.Tester': ( 'tester.html#tester',
                                                                                          'fastkafka/_application/tester.py'),
                                                'fastkafka._application.tester.Tester.__aenter__': ( 'tester.html#tester.__aenter__',
@@ -93,20 +137,54 @@ d = { 'settings': { 'branch': 'main',
                                                                                                   'fastkafka/_application/tester.py'),
                                                'fastkafka._application.tester.mirror_producer': ( 'tester.html#mirror_producer',
                                                                                                   'fastkafka/_application/tester.py')},
-            'fastkafka._components.aiokafka_consumer_loop': { 'fastkafka._components.aiokafka_consumer_loop._aiokafka_consumer_loop': ( 'consumerloop.html#_aiokafka_consumer_loop',
+            'fastkafka._components.aiokafka_consumer_loop': { 'fastkafka._components.aiokafka_consumer_loop.EventMetadata': ( 'consumerloop.html#eventmetadata',
+                                                                                                                              'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop.EventMetadata.create_event_metadata': ( 'consumerloop.html#eventmetadata.create_event_metadata',
+                                                                                                                                                    'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop.LoadShedding': ( 'consumerloop.html#loadshedding',
+                                                                                                                             'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop.LoadShedding.__post_init__': ( 'consumerloop.html#loadshedding.__post_init__',
+                                                                                                                                           'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop.LoadShedding.is_overloaded': ( 'consumerloop.html#loadshedding.is_overloaded',
+                                                                                                                                           'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop.LoadShedding.shed': ( 'consumerloop.html#loadshedding.shed',
+                                                                                                                                  'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._AssignmentListener': ( 'consumerloop.html#_assignmentlistener',
+                                                                                                                                    'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._AssignmentListener.__init__': ( 'consumerloop.html#_assignmentlistener.__init__',
+                                                                                                                                             'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._AssignmentListener.on_partitions_assigned': ( 'consumerloop.html#_assignmentlistener.on_partitions_assigned',
+                                                                                                                                                           'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._AssignmentListener.on_partitions_revoked': ( 'consumerloop.html#_assignmentlistener.on_partitions_revoked',
+                                                                                                                                                          'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._aiokafka_consumer_loop': ( 'consumerloop.html#_aiokafka_consumer_loop',
                                                                                                                                         'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._aiokafka_replay_loop': ( 'consumerloop.html#_aiokafka_replay_loop',
+                                                                                                                                      'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._create_record_dispatcher': ( 'consumerloop.html#_create_record_dispatcher',
+                                                                                                                                          'fastkafka/_components/aiokafka_consumer_loop.py'),
                                                               'fastkafka._components.aiokafka_consumer_loop._create_safe_callback': ( 'consumerloop.html#_create_safe_callback',
                                                                                                                                       'fastkafka/_components/aiokafka_consumer_loop.py'),
                                                               'fastkafka._components.aiokafka_consumer_loop._decode_streamed_msgs': ( 'consumerloop.html#_decode_streamed_msgs',
                                                                                                                                       'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._get_replay_offsets': ( 'consumerloop.html#_get_replay_offsets',
+                                                                                                                                    'fastkafka/_components/aiokafka_consumer_loop.py'),
                                                               'fastkafka._components.aiokafka_consumer_loop._prepare_callback': ( 'consumerloop.html#_prepare_callback',
                                                                                                                                   'fastkafka/_components/aiokafka_consumer_loop.py'),
                                                               'fastkafka._components.aiokafka_consumer_loop._stream_msgs': ( 'consumerloop.html#_stream_msgs',
                                                                                                                              'fastkafka/_components/aiokafka_consumer_loop.py'),
                                                               'fastkafka._components.aiokafka_consumer_loop._streamed_records': ( 'consumerloop.html#_streamed_records',
                                                                                                                                   'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._takes_event_metadata': ( 'consumerloop.html#_takes_event_metadata',
+                                                                                                                                      'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._to_timestamp_ms': ( 'consumerloop.html#_to_timestamp_ms',
+                                                                                                                                 'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop._wait_for_assignment': ( 'consumerloop.html#_wait_for_assignment',
+                                                                                                                                     'fastkafka/_components/aiokafka_consumer_loop.py'),
                                                               'fastkafka._components.aiokafka_consumer_loop.aiokafka_consumer_loop': ( 'consumerloop.html#aiokafka_consumer_loop',
                                                                                                                                        'fastkafka/_components/aiokafka_consumer_loop.py'),
+                                                              'fastkafka._components.aiokafka_consumer_loop.aiokafka_replay_loop': ( 'consumerloop.html#aiokafka_replay_loop',
+                                                                                                                                     'fastkafka/_components/aiokafka_consumer_loop.py'),
                                                               'fastkafka._components.aiokafka_consumer_loop.sanitize_kafka_config': ( 'consumerloop.html#sanitize_kafka_config',
                                                                                                                                       'fastkafka/_components/aiokafka_consumer_loop.py')},
             'fastkafka._components.asyncapi': { 'fastkafka._components.asyncapi.APIKeyLocation': ( 'asyncapi.html#apikeylocation',
@@ -171,8 +249,34 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'fastkafka/_components/asyncapi.py'),
                                                 'fastkafka._components.asyncapi.yaml_file_cmp': ( 'asyncapi.html#yaml_file_cmp',
                                                                                                   'fastkafka/_components/asyncapi.py')},
-            'fastkafka._components.benchmarking': { 'fastkafka._components.benchmarking._benchmark': ( 'benchmarking.html#_benchmark',
+            'fastkafka._components.benchmarking': { 'fastkafka._components.benchmarking.LatencyHistogram': ( 'benchmarking.html#latencyhistogram',
+                                                                                                             'fastkafka/_components/benchmarking.py'),
+                                                    'fastkafka._components.benchmarking.LatencyHistogram.__init__': ( 'benchmarking.html#latencyhistogram.__init__',
+                                                                                                                      'fastkafka/_components/benchmarking.py'),
+                                                    'fastkafka._components.benchmarking.LatencyHistogram._highest_value': ( 'benchmarking.html#latencyhistogram._highest_value',
+                                                                                                                            'fastkafka/_components/benchmarking.py'),
+                                                    'fastkafka._components.benchmarking.LatencyHistogram._index': ( 'benchmarking.html#latencyhistogram._index',
+                                                                                                                    'fastkafka/_components/benchmarking.py'),
+                                                    'fastkafka._components.benchmarking.LatencyHistogram.get_stats': ( 'benchmarking.html#latencyhistogram.get_stats',
+                                                                                                                       'fastkafka/_components/benchmarking.py'),
+                                                    'fastkafka._components.benchmarking.LatencyHistogram.percentile': ( 'benchmarking.html#latencyhistogram.percentile',
+                                                                                                                        'fastkafka/_components/benchmarking.py'),
+                                                    'fastkafka._components.benchmarking.LatencyHistogram.record': ( 'benchmarking.html#latencyhistogram.record',
+                                                                                                                    'fastkafka/_components/benchmarking.py'),
+                                                    'fastkafka._components.benchmarking.LatencyHistogram.reset': ( 'benchmarking.html#latencyhistogram.reset',
+                                                                                                                   'fastkafka/_components/benchmarking.py'),
+                                                    'fastkafka._components.benchmarking._benchmark': ( 'benchmarking.html#_benchmark',
                                                                                                        'fastkafka/_components/benchmarking.py')},
+            'fastkafka._components.compression': { 'fastkafka._components.compression.AutoCompression': ( 'compression.html#autocompression',
+                                                                                                          'fastkafka/_components/compression.py'),
+                                                   'fastkafka._components.compression.AutoCompression.__post_init__': ( 'compression.html#autocompression.__post_init__',
+                                                                                                                        'fastkafka/_components/compression.py'),
+                                                   'fastkafka._components.compression.AutoCompression.choose': ( 'compression.html#autocompression.choose',
+                                                                                                                 'fastkafka/_components/compression.py'),
+                                                   'fastkafka._components.compression.benchmark_compression': ( 'compression.html#benchmark_compression',
+                                                                                                                'fastkafka/_components/compression.py'),
+                                                   'fastkafka._components.compression.get_available_compression_types': ( 'compression.html#get_available_compression_types',
+                                                                                                                          'fastkafka/_components/compression.py')},
             'fastkafka._components.docs_dependencies': { 'fastkafka._components.docs_dependencies._check_npm': ( 'docs_dependencies.html#_check_npm',
                                                                                                                  'fastkafka/_components/docs_dependencies.py'),
                                                          'fastkafka._components.docs_dependencies._check_npm_with_local': ( 'docs_dependencies.html#_check_npm_with_local',
@@ -189,6 +293,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                  'fastkafka/_components/encoder/avro.py'),
                                                     'fastkafka._components.encoder.avro.AvroBase.avro_schema_for_pydantic': ( 'avro_encode_decoder.html#avrobase.avro_schema_for_pydantic',
                                                                                                                               'fastkafka/_components/encoder/avro.py'),
+                                                    'fastkafka._components.encoder.avro._get_parsed_schema': ( 'avro_encode_decoder.html#_get_parsed_schema',
+                                                                                                               'fastkafka/_components/encoder/avro.py'),
                                                     'fastkafka._components.encoder.avro.avro_decoder': ( 'avro_encode_decoder.html#avro_decoder',
                                                                                                          'fastkafka/_components/encoder/avro.py'),
                                                     'fastkafka._components.encoder.avro.avro_encoder': ( 'avro_encode_decoder.html#avro_encoder',
@@ -201,6 +307,134 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'fastkafka/_components/encoder/json.py'),
                                                     'fastkafka._components.encoder.json.json_encoder': ( 'json_encode_decoder.html#json_encoder',
                                                                                                          'fastkafka/_components/encoder/json.py')},
+            'fastkafka._components.encoder.json_encoders': { 'fastkafka._components.encoder.json_encoders.get_default': ( 'json_encoders.html#get_default',
+                                                                                                                          'fastkafka/_components/encoder/json_encoders.py'),
+                                                             'fastkafka._components.encoder.json_encoders.has_json_encoders': ( 'json_encoders.html#has_json_encoders',
+                                                                                                                                'fastkafka/_components/encoder/json_encoders.py')},
+            'fastkafka._components.encoder.json_fast': { 'fastkafka._components.encoder.json_fast._get_json_backend': ( 'json_fast_encode_decoder.html#_get_json_backend',
+                                                                                                                        'fastkafka/_components/encoder/json_fast.py'),
+                                                         'fastkafka._components.encoder.json_fast._json_dumps': ( 'json_fast_encode_decoder.html#_json_dumps',
+                                                                                                                  'fastkafka/_components/encoder/json_fast.py'),
+                                                         'fastkafka._components.encoder.json_fast.json_fast_decoder': ( 'json_fast_encode_decoder.html#json_fast_decoder',
+                                                                                                                        'fastkafka/_components/encoder/json_fast.py'),
+                                                         'fastkafka._components.encoder.json_fast.json_fast_encoder': ( 'json_fast_encode_decoder.html#json_fast_encoder',
+                                                                                                                        'fastkafka/_components/encoder/json_fast.py')},
+            'fastkafka._components.encoder.msgpack': { 'fastkafka._components.encoder.msgpack._check_msgpack': ( 'messagepack_encode_decoder.html#_check_msgpack',
+                                                                                                                 'fastkafka/_components/encoder/msgpack.py'),
+                                                       'fastkafka._components.encoder.msgpack._create_unpacker': ( 'messagepack_encode_decoder.html#_create_unpacker',
+                                                                                                                   'fastkafka/_components/encoder/msgpack.py'),
+                                                       'fastkafka._components.encoder.msgpack._get_packer': ( 'messagepack_encode_decoder.html#_get_packer',
+                                                                                                              'fastkafka/_components/encoder/msgpack.py'),
+                                                       'fastkafka._components.encoder.msgpack._unpack': ( 'messagepack_encode_decoder.html#_unpack',
+                                                                                                          'fastkafka/_components/encoder/msgpack.py'),
+                                                       'fastkafka._components.encoder.msgpack.msgpack_decoder': ( 'messagepack_encode_decoder.html#msgpack_decoder',
+                                                                                                                  'fastkafka/_components/encoder/msgpack.py'),
+                                                       'fastkafka._components.encoder.msgpack.msgpack_encoder': ( 'messagepack_encode_decoder.html#msgpack_encoder',
+                                                                                                                  'fastkafka/_components/encoder/msgpack.py')},
+            'fastkafka._components.encoder.protobuf': { 'fastkafka._components.encoder.protobuf._FieldMapping': ( 'protobuf_encode_decoder.html#_fieldmapping',
+                                                                                                                  'fastkafka/_components/encoder/protobuf.py'),
+                                                        'fastkafka._components.encoder.protobuf._from_proto': ( 'protobuf_encode_decoder.html#_from_proto',
+                                                                                                                'fastkafka/_components/encoder/protobuf.py'),
+                                                        'fastkafka._components.encoder.protobuf._get_field_mappings': ( 'protobuf_encode_decoder.html#_get_field_mappings',
+                                                                                                                        'fastkafka/_components/encoder/protobuf.py'),
+                                                        'fastkafka._components.encoder.protobuf._get_protobuf_message': ( 'protobuf_encode_decoder.html#_get_protobuf_message',
+                                                                                                                          'fastkafka/_components/encoder/protobuf.py'),
+                                                        'fastkafka._components.encoder.protobuf._is_repeated': ( 'protobuf_encode_decoder.html#_is_repeated',
+                                                                                                                 'fastkafka/_components/encoder/protobuf.py'),
+                                                        'fastkafka._components.encoder.protobuf._to_proto': ( 'protobuf_encode_decoder.html#_to_proto',
+                                                                                                              'fastkafka/_components/encoder/protobuf.py'),
+                                                        'fastkafka._components.encoder.protobuf.protobuf_decoder': ( 'protobuf_encode_decoder.html#protobuf_decoder',
+                                                                                                                     'fastkafka/_components/encoder/protobuf.py'),
+                                                        'fastkafka._components.encoder.protobuf.protobuf_encoder': ( 'protobuf_encode_decoder.html#protobuf_encoder',
+                                                                                                                     'fastkafka/_components/encoder/protobuf.py')},
+            'fastkafka._components.encoder.schema_registry': { 'fastkafka._components.encoder.schema_registry.FileSchemaRegistry': ( 'schema_registry.html#fileschemaregistry',
+                                                                                                                                     'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.FileSchemaRegistry.__init__': ( 'schema_registry.html#fileschemaregistry.__init__',
+                                                                                                                                              'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.FileSchemaRegistry.register_schema': ( 'schema_registry.html#fileschemaregistry.register_schema',
+                                                                                                                                                     'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.HttpSchemaRegistry': ( 'schema_registry.html#httpschemaregistry',
+                                                                                                                                     'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.HttpSchemaRegistry.__init__': ( 'schema_registry.html#httpschemaregistry.__init__',
+                                                                                                                                              'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.HttpSchemaRegistry._request': ( 'schema_registry.html#httpschemaregistry._request',
+                                                                                                                                              'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.HttpSchemaRegistry.get_schema': ( 'schema_registry.html#httpschemaregistry.get_schema',
+                                                                                                                                                'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.HttpSchemaRegistry.register_schema': ( 'schema_registry.html#httpschemaregistry.register_schema',
+                                                                                                                                                     'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.InMemorySchemaRegistry': ( 'schema_registry.html#inmemoryschemaregistry',
+                                                                                                                                         'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.InMemorySchemaRegistry.__init__': ( 'schema_registry.html#inmemoryschemaregistry.__init__',
+                                                                                                                                                  'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.InMemorySchemaRegistry.get_schema': ( 'schema_registry.html#inmemoryschemaregistry.get_schema',
+                                                                                                                                                    'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.InMemorySchemaRegistry.register_schema': ( 'schema_registry.html#inmemoryschemaregistry.register_schema',
+                                                                                                                                                         'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryClient': ( 'schema_registry.html#schemaregistryclient',
+                                                                                                                                       'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryClient.get_schema': ( 'schema_registry.html#schemaregistryclient.get_schema',
+                                                                                                                                                  'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryClient.register_schema': ( 'schema_registry.html#schemaregistryclient.register_schema',
+                                                                                                                                                       'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec': ( 'schema_registry.html#schemaregistrycodec',
+                                                                                                                                      'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec.__init__': ( 'schema_registry.html#schemaregistrycodec.__init__',
+                                                                                                                                               'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec._fetch_writer_schema': ( 'schema_registry.html#schemaregistrycodec._fetch_writer_schema',
+                                                                                                                                                           'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec._get_schema_id': ( 'schema_registry.html#schemaregistrycodec._get_schema_id',
+                                                                                                                                                     'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec._get_subject': ( 'schema_registry.html#schemaregistrycodec._get_subject',
+                                                                                                                                                   'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec._get_writer_schema': ( 'schema_registry.html#schemaregistrycodec._get_writer_schema',
+                                                                                                                                                         'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec._refresh_writer_schema': ( 'schema_registry.html#schemaregistrycodec._refresh_writer_schema',
+                                                                                                                                                             'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec.decode': ( 'schema_registry.html#schemaregistrycodec.decode',
+                                                                                                                                             'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec.encode': ( 'schema_registry.html#schemaregistrycodec.encode',
+                                                                                                                                             'fastkafka/_components/encoder/schema_registry.py'),
+                                                               'fastkafka._components.encoder.schema_registry.SchemaRegistryCodec.prepare': ( 'schema_registry.html#schemaregistrycodec.prepare',
+                                                                                                                                              'fastkafka/_components/encoder/schema_registry.py')},
+            'fastkafka._components.encoder.trusted': { 'fastkafka._components.encoder.trusted._get_field_kind': ( 'trusted_decoding.html#_get_field_kind',
+                                                                                                                  'fastkafka/_components/encoder/trusted.py'),
+                                                       'fastkafka._components.encoder.trusted._get_model_builder': ( 'trusted_decoding.html#_get_model_builder',
+                                                                                                                     'fastkafka/_components/encoder/trusted.py'),
+                                                       'fastkafka._components.encoder.trusted.construct_model': ( 'trusted_decoding.html#construct_model',
+                                                                                                                  'fastkafka/_components/encoder/trusted.py'),
+                                                       'fastkafka._components.encoder.trusted.get_trusted_decoder': ( 'trusted_decoding.html#get_trusted_decoder',
+                                                                                                                      'fastkafka/_components/encoder/trusted.py')},
+            'fastkafka._components.envelope': { 'fastkafka._components.envelope.Envelope': ( 'envelope.html#envelope',
+                                                                                             'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.Envelope.__post_init__': ( 'envelope.html#envelope.__post_init__',
+                                                                                                           'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher': ( 'envelope.html#envelopebatcher',
+                                                                                                    'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher.__init__': ( 'envelope.html#envelopebatcher.__init__',
+                                                                                                             'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher._on_linger': ( 'envelope.html#envelopebatcher._on_linger',
+                                                                                                               'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher._on_linger_done': ( 'envelope.html#envelopebatcher._on_linger_done',
+                                                                                                                    'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher.add': ( 'envelope.html#envelopebatcher.add',
+                                                                                                        'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher.flush': ( 'envelope.html#envelopebatcher.flush',
+                                                                                                          'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher.get_stats': ( 'envelope.html#envelopebatcher.get_stats',
+                                                                                                              'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher.pending_count': ( 'envelope.html#envelopebatcher.pending_count',
+                                                                                                                  'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher.reset': ( 'envelope.html#envelopebatcher.reset',
+                                                                                                          'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.EnvelopeBatcher.send_pending': ( 'envelope.html#envelopebatcher.send_pending',
+                                                                                                                 'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.is_envelope': ( 'envelope.html#is_envelope',
+                                                                                                'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.pack_envelope': ( 'envelope.html#pack_envelope',
+                                                                                                  'fastkafka/_components/envelope.py'),
+                                                'fastkafka._components.envelope.unpack_envelope': ( 'envelope.html#unpack_envelope',
+                                                                                                    'fastkafka/_components/envelope.py')},
             'fastkafka._components.helpers': { 'fastkafka._components.helpers.ImportFromStringError': ( 'internal_helpers.html#importfromstringerror',
                                                                                                         'fastkafka/_components/helpers.py'),
                                                'fastkafka._components.helpers._import_from_string': ( 'internal_helpers.html#_import_from_string',
@@ -249,14 +483,231 @@ d = { 'settings': { 'branch': 'main',
                                                                                         'fastkafka/_components/meta.py'),
                                             'fastkafka._components.meta.use_parameters_of': ( 'meta.html#use_parameters_of',
                                                                                               'fastkafka/_components/meta.py')},
-            'fastkafka._components.producer_decorator': { 'fastkafka._components.producer_decorator.KafkaEvent': ( 'producerdecorator.html#kafkaevent',
+            'fastkafka._components.outbox': { 'fastkafka._components.outbox.Outbox': ( 'outbox.html#outbox',
+                                                                                       'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox.__init__': ( 'outbox.html#outbox.__init__',
+                                                                                                'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox._append_queued': ( 'outbox.html#outbox._append_queued',
+                                                                                                      'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox._commit': ( 'outbox.html#outbox._commit',
+                                                                                               'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox._get_executor': ( 'outbox.html#outbox._get_executor',
+                                                                                                     'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox._notify': ( 'outbox.html#outbox._notify',
+                                                                                               'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox._open': ( 'outbox.html#outbox._open',
+                                                                                             'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox._peek': ( 'outbox.html#outbox._peek',
+                                                                                             'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox._position_path': ( 'outbox.html#outbox._position_path',
+                                                                                                      'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox._segment_path': ( 'outbox.html#outbox._segment_path',
+                                                                                                     'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox.append': ( 'outbox.html#outbox.append',
+                                                                                              'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox.close': ( 'outbox.html#outbox.close',
+                                                                                             'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox.drain': ( 'outbox.html#outbox.drain',
+                                                                                             'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox.get_stats': ( 'outbox.html#outbox.get_stats',
+                                                                                                 'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox.pending_count': ( 'outbox.html#outbox.pending_count',
+                                                                                                     'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.Outbox.spool': ( 'outbox.html#outbox.spool',
+                                                                                             'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox.OutboxRecord': ( 'outbox.html#outboxrecord',
+                                                                                             'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._Segment': ( 'outbox.html#_segment',
+                                                                                         'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._Segment.__init__': ( 'outbox.html#_segment.__init__',
+                                                                                                  'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._Segment.close': ( 'outbox.html#_segment.close',
+                                                                                               'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._Segment.fits': ( 'outbox.html#_segment.fits',
+                                                                                              'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._Segment.flush': ( 'outbox.html#_segment.flush',
+                                                                                               'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._Segment.read_frame': ( 'outbox.html#_segment.read_frame',
+                                                                                                    'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._Segment.truncate': ( 'outbox.html#_segment.truncate',
+                                                                                                  'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._Segment.write_frame': ( 'outbox.html#_segment.write_frame',
+                                                                                                     'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._decode_record': ( 'outbox.html#_decode_record',
+                                                                                               'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._encode_record': ( 'outbox.html#_encode_record',
+                                                                                               'fastkafka/_components/outbox.py'),
+                                              'fastkafka._components.outbox._send_records': ( 'outbox.html#_send_records',
+                                                                                              'fastkafka/_components/outbox.py')},
+            'fastkafka._components.producer_decorator': { 'fastkafka._components.producer_decorator.DeliveryTracker': ( 'producerdecorator.html#deliverytracker',
+                                                                                                                        'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.DeliveryTracker.__init__': ( 'producerdecorator.html#deliverytracker.__init__',
+                                                                                                                                 'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.DeliveryTracker._on_done': ( 'producerdecorator.html#deliverytracker._on_done',
+                                                                                                                                 'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.DeliveryTracker.flush': ( 'producerdecorator.html#deliverytracker.flush',
+                                                                                                                              'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.DeliveryTracker.get_stats': ( 'producerdecorator.html#deliverytracker.get_stats',
+                                                                                                                                  'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.DeliveryTracker.in_flight_count': ( 'producerdecorator.html#deliverytracker.in_flight_count',
+                                                                                                                                        'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.DeliveryTracker.reset': ( 'producerdecorator.html#deliverytracker.reset',
+                                                                                                                              'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.DeliveryTracker.send': ( 'producerdecorator.html#deliverytracker.send',
+                                                                                                                             'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.DeliveryTracker.track_submitted': ( 'producerdecorator.html#deliverytracker.track_submitted',
+                                                                                                                                        'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EncodeOffloading': ( 'producerdecorator.html#encodeoffloading',
+                                                                                                                         'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EncodeOffloading.__post_init__': ( 'producerdecorator.html#encodeoffloading.__post_init__',
+                                                                                                                                       'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EncodeOffloading.get_executor': ( 'producerdecorator.html#encodeoffloading.get_executor',
+                                                                                                                                      'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EncodeOffloading.shutdown': ( 'producerdecorator.html#encodeoffloading.shutdown',
+                                                                                                                                  'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EventLoopThread': ( 'producerdecorator.html#eventloopthread',
+                                                                                                                        'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EventLoopThread.__init__': ( 'producerdecorator.html#eventloopthread.__init__',
+                                                                                                                                 'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EventLoopThread.is_started': ( 'producerdecorator.html#eventloopthread.is_started',
+                                                                                                                                   'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EventLoopThread.loop': ( 'producerdecorator.html#eventloopthread.loop',
+                                                                                                                             'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EventLoopThread.run': ( 'producerdecorator.html#eventloopthread.run',
+                                                                                                                            'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EventLoopThread.start': ( 'producerdecorator.html#eventloopthread.start',
+                                                                                                                              'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EventLoopThread.stop': ( 'producerdecorator.html#eventloopthread.stop',
+                                                                                                                             'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.EventLoopThread.submit': ( 'producerdecorator.html#eventloopthread.submit',
+                                                                                                                               'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.KafkaEvent': ( 'producerdecorator.html#kafkaevent',
                                                                                                                    'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.OrderedEncoder': ( 'producerdecorator.html#orderedencoder',
+                                                                                                                       'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.OrderedEncoder.__init__': ( 'producerdecorator.html#orderedencoder.__init__',
+                                                                                                                                'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.OrderedEncoder._should_offload': ( 'producerdecorator.html#orderedencoder._should_offload',
+                                                                                                                                       'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.OrderedEncoder.get_stats': ( 'producerdecorator.html#orderedencoder.get_stats',
+                                                                                                                                 'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.OrderedEncoder.send': ( 'producerdecorator.html#orderedencoder.send',
+                                                                                                                            'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.StickyPartitioner': ( 'producerdecorator.html#stickypartitioner',
+                                                                                                                          'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.StickyPartitioner.__call__': ( 'producerdecorator.html#stickypartitioner.__call__',
+                                                                                                                                   'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.StickyPartitioner.__init__': ( 'producerdecorator.html#stickypartitioner.__init__',
+                                                                                                                                   'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator._encode_all': ( 'producerdecorator.html#_encode_all',
+                                                                                                                    'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator._log_send_error': ( 'producerdecorator.html#_log_send_error',
+                                                                                                                        'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator._send_batch': ( 'producerdecorator.html#_send_batch',
+                                                                                                                    'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator._send_or_spool': ( 'producerdecorator.html#_send_or_spool',
+                                                                                                                       'fastkafka/_components/producer_decorator.py'),
                                                           'fastkafka._components.producer_decorator._wrap_in_event': ( 'producerdecorator.html#_wrap_in_event',
                                                                                                                        'fastkafka/_components/producer_decorator.py'),
                                                           'fastkafka._components.producer_decorator.get_loop': ( 'producerdecorator.html#get_loop',
                                                                                                                  'fastkafka/_components/producer_decorator.py'),
+                                                          'fastkafka._components.producer_decorator.get_partitioner': ( 'producerdecorator.html#get_partitioner',
+                                                                                                                        'fastkafka/_components/producer_decorator.py'),
                                                           'fastkafka._components.producer_decorator.producer_decorator': ( 'producerdecorator.html#producer_decorator',
                                                                                                                            'fastkafka/_components/producer_decorator.py')},
+            'fastkafka._components.request_reply': { 'fastkafka._components.request_reply.ReplyConsumer': ( 'requestreply.html#replyconsumer',
+                                                                                                            'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.ReplyConsumer.__init__': ( 'requestreply.html#replyconsumer.__init__',
+                                                                                                                     'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.ReplyConsumer._complete': ( 'requestreply.html#replyconsumer._complete',
+                                                                                                                      'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.ReplyConsumer._consume': ( 'requestreply.html#replyconsumer._consume',
+                                                                                                                     'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.ReplyConsumer._start': ( 'requestreply.html#replyconsumer._start',
+                                                                                                                   'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.ReplyConsumer.get_stats': ( 'requestreply.html#replyconsumer.get_stats',
+                                                                                                                      'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.ReplyConsumer.request': ( 'requestreply.html#replyconsumer.request',
+                                                                                                                    'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.ReplyConsumer.start': ( 'requestreply.html#replyconsumer.start',
+                                                                                                                  'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.ReplyConsumer.stop': ( 'requestreply.html#replyconsumer.stop',
+                                                                                                                 'fastkafka/_components/request_reply.py'),
+                                                     'fastkafka._components.request_reply.reply_headers': ( 'requestreply.html#reply_headers',
+                                                                                                            'fastkafka/_components/request_reply.py')},
+            'fastkafka._components.scheduler': { 'fastkafka._components.scheduler.Schedule': ( 'scheduler.html#schedule',
+                                                                                               'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.Schedule.__post_init__': ( 'scheduler.html#schedule.__post_init__',
+                                                                                                             'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.Schedule.get_runs': ( 'scheduler.html#schedule.get_runs',
+                                                                                                        'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.Schedule.next_due': ( 'scheduler.html#schedule.next_due',
+                                                                                                        'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.Scheduler': ( 'scheduler.html#scheduler',
+                                                                                                'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.Scheduler.__init__': ( 'scheduler.html#scheduler.__init__',
+                                                                                                         'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.Scheduler.__len__': ( 'scheduler.html#scheduler.__len__',
+                                                                                                        'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.Scheduler.add': ( 'scheduler.html#scheduler.add',
+                                                                                                    'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.Scheduler.run': ( 'scheduler.html#scheduler.run',
+                                                                                                    'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.TimerWheel': ( 'scheduler.html#timerwheel',
+                                                                                                 'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.TimerWheel.__init__': ( 'scheduler.html#timerwheel.__init__',
+                                                                                                          'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.TimerWheel.__len__': ( 'scheduler.html#timerwheel.__len__',
+                                                                                                         'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.TimerWheel.add': ( 'scheduler.html#timerwheel.add',
+                                                                                                     'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler.TimerWheel.advance': ( 'scheduler.html#timerwheel.advance',
+                                                                                                         'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler._CronExpression': ( 'scheduler.html#_cronexpression',
+                                                                                                      'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler._CronExpression.__init__': ( 'scheduler.html#_cronexpression.__init__',
+                                                                                                               'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler._CronExpression._matches_day': ( 'scheduler.html#_cronexpression._matches_day',
+                                                                                                                   'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler._CronExpression.next_after': ( 'scheduler.html#_cronexpression.next_after',
+                                                                                                                 'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler._ScheduledCall': ( 'scheduler.html#_scheduledcall',
+                                                                                                     'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler._call': ( 'scheduler.html#_call',
+                                                                                            'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler._parse_cron_field': ( 'scheduler.html#_parse_cron_field',
+                                                                                                        'fastkafka/_components/scheduler.py'),
+                                                 'fastkafka._components.scheduler._to_seconds': ( 'scheduler.html#_to_seconds',
+                                                                                                  'fastkafka/_components/scheduler.py')},
+            'fastkafka._components.table': { 'fastkafka._components.table.Table': ('table.html#table', 'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table.__contains__': ( 'table.html#table.__contains__',
+                                                                                                 'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table.__init__': ( 'table.html#table.__init__',
+                                                                                             'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table.__len__': ( 'table.html#table.__len__',
+                                                                                            'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table._get_ready_event': ( 'table.html#table._get_ready_event',
+                                                                                                     'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table._reset': ( 'table.html#table._reset',
+                                                                                           'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table._set_failed': ( 'table.html#table._set_failed',
+                                                                                                'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table._set_ready': ( 'table.html#table._set_ready',
+                                                                                               'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table._update': ( 'table.html#table._update',
+                                                                                            'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table.get': ( 'table.html#table.get',
+                                                                                        'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table.is_ready': ( 'table.html#table.is_ready',
+                                                                                             'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.Table.wait_until_ready': ( 'table.html#table.wait_until_ready',
+                                                                                                     'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table._aiokafka_table_loop': ( 'table.html#_aiokafka_table_loop',
+                                                                                                   'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table._encode_key': ( 'table.html#_encode_key',
+                                                                                          'fastkafka/_components/table.py'),
+                                             'fastkafka._components.table.aiokafka_table_loop': ( 'table.html#aiokafka_table_loop',
+                                                                                                  'fastkafka/_components/table.py')},
             'fastkafka._components.test_dependencies': { 'fastkafka._components.test_dependencies._install_java': ( 'test_dependencies.html#_install_java',
                                                                                                                     'fastkafka/_components/test_dependencies.py'),
                                                          'fastkafka._components.test_dependencies._install_kafka': ( 'test_dependencies.html#_install_kafka',
@@ -331,6 +782,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                       'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.GroupMetadata.unsubscribe': ( 'inmemorybroker.html#groupmetadata.unsubscribe',
                                                                                                                         'fastkafka/_testing/in_memory_broker.py'),
+                                                     'fastkafka._testing.in_memory_broker.InMemoryBatch': ( 'inmemorybroker.html#inmemorybatch',
+                                                                                                            'fastkafka/_testing/in_memory_broker.py'),
+                                                     'fastkafka._testing.in_memory_broker.InMemoryBatch.__init__': ( 'inmemorybroker.html#inmemorybatch.__init__',
+                                                                                                                     'fastkafka/_testing/in_memory_broker.py'),
+                                                     'fastkafka._testing.in_memory_broker.InMemoryBatch.append': ( 'inmemorybroker.html#inmemorybatch.append',
+                                                                                                                   'fastkafka/_testing/in_memory_broker.py'),
+                                                     'fastkafka._testing.in_memory_broker.InMemoryBatch.record_count': ( 'inmemorybroker.html#inmemorybatch.record_count',
+                                                                                                                         'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryBroker': ( 'inmemorybroker.html#inmemorybroker',
                                                                                                              'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryBroker.__init__': ( 'inmemorybroker.html#inmemorybroker.__init__',
@@ -359,6 +818,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                         'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryConsumer.__init__': ( 'inmemorybroker.html#inmemoryconsumer.__init__',
                                                                                                                         'fastkafka/_testing/in_memory_broker.py'),
+                                                     'fastkafka._testing.in_memory_broker.InMemoryConsumer.assignment': ( 'inmemorybroker.html#inmemoryconsumer.assignment',
+                                                                                                                          'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryConsumer.getmany': ( 'inmemorybroker.html#inmemoryconsumer.getmany',
                                                                                                                        'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryConsumer.start': ( 'inmemorybroker.html#inmemoryconsumer.start',
@@ -373,8 +834,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                         'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryProducer.__init__': ( 'inmemorybroker.html#inmemoryproducer.__init__',
                                                                                                                         'fastkafka/_testing/in_memory_broker.py'),
+                                                     'fastkafka._testing.in_memory_broker.InMemoryProducer.create_batch': ( 'inmemorybroker.html#inmemoryproducer.create_batch',
+                                                                                                                            'fastkafka/_testing/in_memory_broker.py'),
+                                                     'fastkafka._testing.in_memory_broker.InMemoryProducer.partitions_for': ( 'inmemorybroker.html#inmemoryproducer.partitions_for',
+                                                                                                                              'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryProducer.send': ( 'inmemorybroker.html#inmemoryproducer.send',
                                                                                                                     'fastkafka/_testing/in_memory_broker.py'),
+                                                     'fastkafka._testing.in_memory_broker.InMemoryProducer.send_batch': ( 'inmemorybroker.html#inmemoryproducer.send_batch',
+                                                                                                                          'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryProducer.start': ( 'inmemorybroker.html#inmemoryproducer.start',
                                                                                                                      'fastkafka/_testing/in_memory_broker.py'),
                                                      'fastkafka._testing.in_memory_broker.InMemoryProducer.stop': ( 'inmemorybroker.html#inmemoryproducer.stop',
@@ -23,10 +23,13 @@ logger = get_logger(__name__)
 
 # %% ../nbs/021_FastKafkaServer.ipynb 7
 class ServerProcess:
-    def __init__(self, app: str, kafka_broker_name: str):
+    def __init__(
+        self, app: str, kafka_broker_name: str, worker_index: Optional[int] = None
+    ):
         self.app = app
         self.should_exit = False
         self.kafka_broker_name = kafka_broker_name
+        self.worker_index = worker_index
 
     def run(self) -> None:
         return asyncio.run(self._serve())
@@ -36,6 +39,8 @@ class ServerProcess:
 
         self.application = _import_from_string(self.app)
         self.application.set_kafka_broker(self.kafka_broker_name)
+        if self.worker_index is not None:
+            self.application.set_worker_index(self.worker_index)
 
         async with self.application:
             await self._main_loop()
@@ -75,8 +80,12 @@ def run_fastkafka_server_process(
         ...,
         help="kafka_broker, one of the keys of the kafka_brokers dictionary passed in the constructor of FastaKafka class.",
     ),
+    worker_index: Optional[int] = typer.Option(
+        None,
+        help="Index of the worker process, used for deriving stable identities of consumers in the consumer group.",
+    ),
 ) -> None:
-    ServerProcess(app, kafka_broker).run()
+    ServerProcess(app, kafka_broker, worker_index).run()
 
 # %% ../nbs/021_FastKafkaServer.ipynb 10
 async def terminate_asyncio_process(p: asyncio.subprocess.Process) -> None:
@@ -134,6 +143,8 @@ async def run_fastkafka_server(num_workers: int, app: str, kafka_broker: str) ->
         tasks = [
             tg.soonify(asyncio.create_subprocess_exec)(
                 *args,
+                "--worker-index",
+                str(i),
                 stdout=asyncio.subprocess.PIPE,
                 stdin=asyncio.subprocess.PIPE,
             )
@@ -2,7 +2,7 @@
 
 # %% auto 0
 __all__ = ['logger', 'KafkaRecord', 'KafkaPartition', 'KafkaTopic', 'split_list', 'GroupMetadata', 'InMemoryBroker',
-           'InMemoryConsumer', 'InMemoryProducer']
+           'InMemoryConsumer', 'InMemoryProducer', 'InMemoryBatch']
 
 # %% ../../nbs/001_InMemoryBroker.ipynb 1
 import asyncio
@@ -11,10 +11,11 @@ import hashlib
 import inspect
 import random
 import string
+import time
 import uuid
 from collections import namedtuple
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import *
 
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
@@ -42,6 +43,10 @@ class KafkaRecord:
     key: Optional[bytes] = None
     value: bytes = b""
     offset: int = 0
+    timestamp: int = field(
+        default_factory=lambda: int(time.time() * 1000), compare=False
+    )
+    headers: List[Tuple[str, bytes]] = field(default_factory=list)
 
 # %% ../../nbs/001_InMemoryBroker.ipynb 7
 class KafkaPartition:
@@ -50,13 +55,19 @@ class KafkaPartition:
         self.topic = topic
         self.messages: List[KafkaRecord] = list()
 
-    def write(self, value: bytes, key: Optional[bytes] = None) -> RecordMetadata:  # type: ignore
+    def write(  # type: ignore
+        self,
+        value: bytes,
+        key: Optional[bytes] = None,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
+    ) -> RecordMetadata:
         record = KafkaRecord(
             topic=self.topic,
             partition=self.partition,
             value=value,
             key=key,
             offset=len(self.messages),
+            headers=list(headers) if headers else [],
         )
         record_meta = RecordMetadata(
             topic=self.topic,
@@ -97,12 +108,19 @@ class KafkaTopic:
         self,
         value: bytes,
         partition: int,
+        key: Optional[bytes] = None,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
     ) -> RecordMetadata:
-        return self.partitions[partition].write(value)
+        return self.partitions[partition].write(value, key=key, headers=headers)
 
-    def write_with_key(self, value: bytes, key: bytes) -> RecordMetadata:  # type: ignore
+    def write_with_key(  # type: ignore
+        self,
+        value: bytes,
+        key: bytes,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
+    ) -> RecordMetadata:
         partition = int(hashlib.sha256(key).hexdigest(), 16) % self.num_partitions
-        return self.partitions[partition].write(value, key=key)
+        return self.partitions[partition].write(value, key=key, headers=headers)
 
     def write(  # type: ignore
         self,
@@ -110,15 +128,16 @@ class KafkaTopic:
         *,
         key: Optional[bytes] = None,
         partition: Optional[int] = None,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
     ) -> RecordMetadata:
         if partition is not None:
-            return self.write_with_partition(value, partition)
+            return self.write_with_partition(value, partition, key=key, headers=headers)
 
         if key is not None:
-            return self.write_with_key(value, key)
+            return self.write_with_key(value, key, headers=headers)
 
         partition = random.randint(0, self.num_partitions - 1)  # nosec
-        return self.write_with_partition(value, partition)
+        return self.write_with_partition(value, partition, headers=headers)
 
     def latest_offset(self, partition: int) -> int:
         return self.partitions[partition].latest_offset()
@@ -224,6 +243,7 @@ class InMemoryBroker:
         value: bytes,
         key: Optional[bytes] = None,
         partition: Optional[int] = None,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
     ) -> RecordMetadata:
         raise NotImplementedError()
 
@@ -281,6 +301,7 @@ def write(  # type: ignore
     value: bytes,
     key: Optional[bytes] = None,
     partition: Optional[int] = None,
+    headers: Optional[List[Tuple[str, bytes]]] = None,
 ) -> RecordMetadata:
     if (bootstrap_server, topic) not in self.topics:
         self.topics[(bootstrap_server, topic)] = KafkaTopic(
@@ -288,7 +309,7 @@ def write(  # type: ignore
         )
 
     return self.topics[(bootstrap_server, topic)].write(
-        value, key=key, partition=partition
+        value, key=key, partition=partition, headers=headers
     )
 
 # %% ../../nbs/001_InMemoryBroker.ipynb 27
@@ -368,6 +389,9 @@ class InMemoryConsumer:
     def subscribe(self, topics: List[str], **kwargs: Any) -> None:
         raise NotImplementedError()
 
+    def assignment(self) -> Set[TopicPartition]:  # type: ignore
+        raise NotImplementedError()
+
     @delegates(AIOKafkaConsumer.getmany)
     async def getmany(  # type: ignore
         self, **kwargs: Any
@@ -404,6 +428,19 @@ def subscribe(self: InMemoryConsumer, topics: List[str], **kwargs: Any) -> None:
 
 # %% ../../nbs/001_InMemoryBroker.ipynb 43
 @patch
+def assignment(self: InMemoryConsumer) -> Set[TopicPartition]:  # type: ignore
+    if self._id is None:
+        raise RuntimeError("Consumer start() not called! Run consumer start() first")
+    return {
+        TopicPartition(topic, partition)
+        for topic in self._topics
+        for partition in self.broker.topic_groups[
+            (self._bootstrap_servers, topic, self._group_id)  # type: ignore
+        ].get_partitions(self._id)[0]
+    }
+
+# %% ../../nbs/001_InMemoryBroker.ipynb 46
+@patch
 @delegates(AIOKafkaConsumer.stop)
 async def stop(self: InMemoryConsumer, **kwargs: Any) -> None:
     logger.info("AIOKafkaConsumer patched stop() called")
@@ -417,7 +454,7 @@ async def stop(self: InMemoryConsumer, **kwargs: Any) -> None:
             consumer_id=self._id,
         )
 
-# %% ../../nbs/001_InMemoryBroker.ipynb 46
+# %% ../../nbs/001_InMemoryBroker.ipynb 49
 @patch
 @delegates(AIOKafkaConsumer.getmany)
 async def getmany(  # type: ignore
@@ -432,7 +469,7 @@ async def getmany(  # type: ignore
             auto_offset_reset=self._auto_offset_reset,
         )
 
-# %% ../../nbs/001_InMemoryBroker.ipynb 49
+# %% ../../nbs/001_InMemoryBroker.ipynb 52
 class InMemoryProducer:
     def __init__(self, broker: InMemoryBroker, **kwargs: Any) -> None:
         self.broker = broker
@@ -464,7 +501,18 @@ class InMemoryProducer:
     ):
         raise NotImplementedError()
 
-# %% ../../nbs/001_InMemoryBroker.ipynb 52
+    async def partitions_for(self, topic: str) -> Set[int]:
+        raise NotImplementedError()
+
+    def create_batch(self) -> "InMemoryBatch":
+        raise NotImplementedError()
+
+    async def send_batch(  # type: ignore
+        self, batch: "InMemoryBatch", topic: str, *, partition: int
+    ):
+        raise NotImplementedError()
+
+# %% ../../nbs/001_InMemoryBroker.ipynb 55
 @patch  # type: ignore
 @delegates(AIOKafkaProducer.start)
 async def start(self: InMemoryProducer, **kwargs: Any) -> None:
@@ -475,7 +523,7 @@ async def start(self: InMemoryProducer, **kwargs: Any) -> None:
         )
     self.id = self.broker.connect()
 
-# %% ../../nbs/001_InMemoryBroker.ipynb 55
+# %% ../../nbs/001_InMemoryBroker.ipynb 58
 @patch  # type: ignore
 @delegates(AIOKafkaProducer.stop)
 async def stop(self: InMemoryProducer, **kwargs: Any) -> None:
@@ -483,7 +531,7 @@ async def stop(self: InMemoryProducer, **kwargs: Any) -> None:
     if self.id is None:
         raise RuntimeError("Producer start() not called! Run producer start() first")
 
-# %% ../../nbs/001_InMemoryBroker.ipynb 58
+# %% ../../nbs/001_InMemoryBroker.ipynb 61
 @patch
 @delegates(AIOKafkaProducer.send)
 async def send(  # type: ignore
@@ -492,6 +540,7 @@ async def send(  # type: ignore
     msg: bytes,
     key: Optional[bytes] = None,
     partition: Optional[int] = None,
+    headers: Optional[List[Tuple[str, bytes]]] = None,
     **kwargs: Any,
 ):  # asyncio.Task[RecordMetadata]
     if self.id is None:
@@ -503,6 +552,7 @@ async def send(  # type: ignore
         value=msg,
         key=key,
         partition=partition,
+        headers=headers,
     )
 
     async def _f(record: ConsumerRecord = record) -> RecordMetadata:  # type: ignore
@@ -510,7 +560,62 @@ async def send(  # type: ignore
 
     return asyncio.create_task(_f())
 
-# %% ../../nbs/001_InMemoryBroker.ipynb 61
+# %% ../../nbs/001_InMemoryBroker.ipynb 64
+class InMemoryBatch:
+    def __init__(self) -> None:
+        self.records: List[Tuple[Optional[bytes], bytes, List[Tuple[str, bytes]]]] = []
+
+    def append(
+        self,
+        *,
+        timestamp: Optional[int],
+        key: Optional[bytes],
+        value: bytes,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
+        **kwargs: Any
+    ) -> int:
+        self.records.append((key, value, list(headers) if headers else []))
+        return len(self.records) - 1
+
+    def record_count(self) -> int:
+        return len(self.records)
+
+
+@patch
+async def partitions_for(self: InMemoryProducer, topic: str) -> Set[int]:
+    return set(range(self.broker.num_partitions))
+
+
+@patch
+def create_batch(self: InMemoryProducer) -> InMemoryBatch:
+    return InMemoryBatch()
+
+
+@patch
+async def send_batch(  # type: ignore
+    self: InMemoryProducer, batch: InMemoryBatch, topic: str, *, partition: int
+):  # asyncio.Task[RecordMetadata]
+    if self.id is None:
+        raise RuntimeError("Producer start() not called! Run producer start() first")
+
+    records = [
+        self.broker.write(
+            bootstrap_server=self._bootstrap_servers,
+            topic=topic,
+            value=value,
+            key=key,
+            partition=partition,
+            headers=headers,
+        )
+        for key, value, headers in batch.records
+    ]
+
+    async def _f(record: RecordMetadata = records[0]) -> RecordMetadata:  # type: ignore
+        return record
+
+    return asyncio.create_task(_f())
+
+# %% ../../nbs/001_InMemoryBroker.ipynb 67
 @patch
 @contextmanager
 def lifecycle(self: InMemoryBroker) -> Iterator[InMemoryBroker]:
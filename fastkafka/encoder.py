@@ -11,15 +11,36 @@ from fastkafka._components.encoder.avro import (
     avsc_to_pydantic,
 )
 from ._components.encoder.json import json_decoder, json_encoder
+from ._components.encoder.json_fast import json_fast_decoder, json_fast_encoder
+from ._components.encoder.msgpack import msgpack_decoder, msgpack_encoder
+from ._components.encoder.protobuf import protobuf_decoder, protobuf_encoder
+from fastkafka._components.encoder.schema_registry import (
+    FileSchemaRegistry,
+    HttpSchemaRegistry,
+    InMemorySchemaRegistry,
+    SchemaRegistryClient,
+    SchemaRegistryCodec,
+)
 from ._components.meta import export
 
 __all__ = [
     "AvroBase",
+    "FileSchemaRegistry",
+    "HttpSchemaRegistry",
+    "InMemorySchemaRegistry",
+    "SchemaRegistryClient",
+    "SchemaRegistryCodec",
     "avro_decoder",
     "avro_encoder",
     "avsc_to_pydantic",
     "json_decoder",
     "json_encoder",
+    "json_fast_decoder",
+    "json_fast_encoder",
+    "msgpack_decoder",
+    "msgpack_encoder",
+    "protobuf_decoder",
+    "protobuf_encoder",
 ]
 
 # %% ../nbs/020_Encoder_Export.ipynb 3
@@ -37,6 +37,20 @@ requirements = [
 avro_requirements = [
     "fastavro>=1.7.3"
 ]
+json_fast_requirements = [
+    "orjson>=3.8.0",
+]
+msgpack_requirements = [
+    "msgpack>=1.0.0",
+]
+protobuf_requirements = [
+    "protobuf>=4.21.0",
+]
+compression_requirements = [
+    "python-snappy>=0.6.1",
+    "lz4>=4.3.2",
+    "zstandard>=0.20.0",
+]
 test_requirements = [
     "install-jdk==0.3.0",
     "ipywidgets>=8.0,<=8.0.4",
@@ -89,7 +103,7 @@ setuptools.setup(
     packages = setuptools.find_packages(),
     include_package_data = True,
     install_requires = requirements,
-    extras_require={ 'dev': dev_requirements + avro_requirements + test_requirements + docs_requirements, "avro": avro_requirements, "test": test_requirements, "docs": docs_requirements },
+    extras_require={ 'dev': dev_requirements + avro_requirements + compression_requirements + json_fast_requirements + msgpack_requirements + protobuf_requirements + test_requirements + docs_requirements, "avro": avro_requirements, "compression": compression_requirements, "json-fast": json_fast_requirements, "msgpack": msgpack_requirements, "protobuf": protobuf_requirements, "test": test_requirements, "docs": docs_requirements },
     dependency_links = cfg.get('dep_links','').split(),
     python_requires  = '>=' + cfg['min_python'],
     long_description = open('README.md', encoding="UTF-8").read(),